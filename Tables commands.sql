@@ -149,3 +149,76 @@ CREATE TABLE cloudinary (
   api_key VARCHAR(64),
   api_secret VARCHAR(64)
 );
+
+---
+
+-- Acorda o loop principal (LISTEN_NOTIFY=ON no .env) assim que uma linha pendente é inserida ou atualizada.
+-- Linhas devolvidas à fila por uma instância (EXECUTANDO -> PENDENTE) não acordam o loop, evitando novas tentativas
+-- imediatas. Elas voltam a ser processadas no próximo ciclo.
+CREATE OR REPLACE FUNCTION notificar_operacao_pendente() RETURNS trigger AS $$
+BEGIN
+  IF NEW.cod_retorno = 0 AND (TG_OP = 'INSERT' OR OLD.cod_retorno IS DISTINCT FROM 1) THEN
+    PERFORM pg_notify('operacoes_pendentes', TG_TABLE_NAME);
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER produtos_operacao_pendente
+  AFTER INSERT OR UPDATE OF cod_retorno ON produtos
+  FOR EACH ROW EXECUTE FUNCTION notificar_operacao_pendente();
+
+CREATE TRIGGER produtos_status_operacao_pendente
+  AFTER INSERT OR UPDATE OF cod_retorno ON produtos_status
+  FOR EACH ROW EXECUTE FUNCTION notificar_operacao_pendente();
+
+CREATE TRIGGER operacao_categoria_ml_operacao_pendente
+  AFTER INSERT OR UPDATE OF cod_retorno ON operacao_categoria_ml
+  FOR EACH ROW EXECUTE FUNCTION notificar_operacao_pendente();
+
+---
+
+-- Reserva de linhas por instância (SELECT ... FOR UPDATE SKIP LOCKED). Permite rodar mais de um bot no mesmo banco.
+ALTER TABLE produtos ADD COLUMN IF NOT EXISTS worker_id VARCHAR(64);
+ALTER TABLE produtos_status ADD COLUMN IF NOT EXISTS worker_id VARCHAR(64);
+ALTER TABLE operacao_categoria_ml ADD COLUMN IF NOT EXISTS worker_id VARCHAR(64);
+
+-- Início do processamento de uma linha reservada. Linhas iniciadas nunca voltam à fila sozinhas: a operação
+-- pode já ter sido realizada no Mercado Livre (Ex.: produto publicado antes de uma falha).
+ALTER TABLE produtos ADD COLUMN IF NOT EXISTS started_at TIMESTAMP;
+ALTER TABLE produtos_status ADD COLUMN IF NOT EXISTS started_at TIMESTAMP;
+ALTER TABLE operacao_categoria_ml ADD COLUMN IF NOT EXISTS started_at TIMESTAMP;
+
+-- Linhas devolvidas à fila (Ex.: falha no token do vendedor, tempo esgotado) só voltam a ser reservadas após retry_at.
+ALTER TABLE produtos ADD COLUMN IF NOT EXISTS retry_at TIMESTAMP;
+ALTER TABLE produtos_status ADD COLUMN IF NOT EXISTS retry_at TIMESTAMP;
+ALTER TABLE operacao_categoria_ml ADD COLUMN IF NOT EXISTS retry_at TIMESTAMP;
+
+-- Novas tentativas seguidas de uma linha (Ex.: tempo esgotado). Ao passar de MAX_RETRIES a linha vai para erro.
+ALTER TABLE produtos ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE produtos_status ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE operacao_categoria_ml ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+-- Origem do resultado da categoria: 'api' (Mercado Livre) ou 'local' (classificador de títulos). Os resultados
+-- locais não são usados no treino do classificador.
+ALTER TABLE operacao_categoria_ml ADD COLUMN IF NOT EXISTS origem_categoria VARCHAR(10);
+
+CREATE INDEX IF NOT EXISTS produtos_pendentes_idx ON produtos (id) WHERE cod_retorno = 0;
+CREATE INDEX IF NOT EXISTS produtos_status_pendentes_idx ON produtos_status (id) WHERE cod_retorno = 0;
+CREATE INDEX IF NOT EXISTS operacao_categoria_ml_pendentes_idx ON operacao_categoria_ml (id) WHERE cod_retorno = 0;
+
+---
+
+-- Tokens de acesso e refresh tokens de cada vendedor, compartilhados por todas as instâncias do bot.
+-- O Mercado Livre troca o refresh token a cada renovação: o último recebido fica salvo aqui. A renovação é feita
+-- com pg_try_advisory_xact_lock, então apenas uma instância renova o token de um vendedor por vez (as outras releem o token salvo).
+CREATE TABLE IF NOT EXISTS meli_tokens (
+  client_id VARCHAR(32) PRIMARY KEY,
+  access_token VARCHAR(256),
+  refresh_token VARCHAR(256),
+  refresh_token_origem VARCHAR(256), -- Refresh token das linhas das tabelas que originou esta autorização.
+  expira_em TIMESTAMPTZ,
+  user_id BIGINT,
+  scope VARCHAR(256),
+  atualizado_em TIMESTAMPTZ DEFAULT now()
+);
@@ -3,17 +3,18 @@ Application services.
 
 Centralizes all services inside a same app interface.
 Provides:
-    App.ProdutosApplication: Operations for table `produtos`.
+    App.ProdutosApplication: Operations for table `produtos`. (`produtos_urgent` runs only the urgent lane).
     App.StatusApplication: Operations for table `produtos_status`.
     App.ProdutosCategoryApplication: Operations for table `operacao_categoria_ml.`
 """
 
-from .services.produtos import ProdutosApplication
+from .services.produtos import ProdutosApplication, Lane
 from .services.produtos_status import StatusApplication
 from .services.produtos_category import ProdutosCategoryApplication 
 
 class App:
-    produtos = ProdutosApplication()
+    produtos_urgent = ProdutosApplication(lane=Lane.URGENT)
+    produtos = ProdutosApplication(lane=Lane.NORMAL)
     status = StatusApplication()
     category = ProdutosCategoryApplication ()
     
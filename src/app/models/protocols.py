@@ -5,3 +5,7 @@ from typing import Protocol
 class ApplicationProtocol(Protocol):
     def execute(self) -> None:
         ...
+    
+    def backlog(self) -> int:
+        """ Pending lines the application still has to process. """
+        ...
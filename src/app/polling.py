@@ -0,0 +1,92 @@
+""" Adaptive polling interval of the main loop. """
+
+from dataclasses import dataclass, field
+
+from src.core import log
+
+
+@dataclass(frozen=True)
+class PollingMetrics:
+    """ Snapshot of the main loop polling state. """
+    interval: float = 0.0 # Seconds the loop will wait before the next tick.
+    idle_ticks: int = 0 # Consecutive ticks without backlog.
+    stalled_ticks: int = 0 # Consecutive ticks with backlog that didn't shrink.
+    backlog: dict[str, int] = field(default_factory=dict) # Pending lines by table.
+    
+    @property
+    def total_backlog(self) -> int:
+        return sum(self.backlog.values())
+
+
+class AdaptiveInterval:
+    """
+    Calculates how long the main loop must wait between ticks.
+    
+    - While the backlog shrinks, the interval is 0 (the loop doesn't sleep between batches).
+    - Each consecutive tick without backlog multiplies the interval, starting at TIMER and
+      limited by TIMER_MAX, so idle instances stop hammering the database.
+    - The same backoff applies while the backlog doesn't shrink (Ex.: lines that keep going back to the
+      queue), so the loop never spins without sleeping.
+    """
+    def __init__(self, multiplier: float = 2.0) -> None:
+        """
+        Args:
+            multiplier (float): Backoff factor applied on each idle tick.
+        """
+        self.multiplier = max(multiplier, 1.0)
+        self._metrics = PollingMetrics()
+    
+    @property
+    def metrics(self) -> PollingMetrics:
+        """ Current polling metrics (safe to read from other threads). """
+        return self._metrics
+    
+    def next(self, backlog: dict[str, int], base: float, ceiling: float) -> float:
+        """
+        Registers the backlog found on the tick and calculates the next interval.
+        Args:
+            backlog (dict[str, int]): Pending lines by table.
+            base (float): Interval of the first idle tick (TIMER).
+            ceiling (float): Max interval (TIMER_MAX).
+        Returns:
+            float: Seconds to wait before the next tick.
+        """
+        total: int = sum(backlog.values())
+        if total and total < self._metrics.total_backlog:
+            return self._update(interval=0.0, idle_ticks=0, backlog=backlog)
+        
+        if total:
+            stalled_ticks: int = self._metrics.stalled_ticks + 1
+            if stalled_ticks == 1: # The first tick of a backlog (or the first without progress) doesn't wait yet.
+                return self._update(interval=0.0, idle_ticks=0, backlog=backlog, stalled_ticks=stalled_ticks)
+            previous: float = self._metrics.interval if self._metrics.stalled_ticks > 1 else 0.0
+            interval: float = self._backoff(base, ceiling, previous)
+            return self._update(interval=interval, idle_ticks=0, backlog=backlog, stalled_ticks=stalled_ticks)
+        
+        previous: float = self._metrics.interval if self._metrics.idle_ticks else 0.0
+        interval: float = self._backoff(base, ceiling, previous)
+        idle_ticks: int = self._metrics.idle_ticks + 1
+        return self._update(interval=interval, idle_ticks=idle_ticks, backlog=backlog)
+    
+    def reset(self) -> None:
+        """ Restarts the backoff (Ex.: a new pending line was notified). """
+        self._metrics = PollingMetrics(backlog=self._metrics.backlog)
+    
+    def _backoff(self, base: float, ceiling: float, previous: float) -> float:
+        return min(previous * self.multiplier if previous else base, max(ceiling, base))
+    
+    def _update(self, interval: float, idle_ticks: int, backlog: dict[str, int], stalled_ticks: int = 0) -> float:
+        previous: PollingMetrics = self._metrics
+        self._metrics = PollingMetrics(
+            interval=interval,
+            idle_ticks=idle_ticks,
+            stalled_ticks=stalled_ticks,
+            backlog=dict(backlog)
+        )
+        
+        if interval != previous.interval or self._metrics.total_backlog != previous.total_backlog:
+            log.dev.info(
+                f"Polling: intervalo={interval:.1f}s, backlog={self._metrics.total_backlog} {self._metrics.backlog}, "
+                f"ciclos ociosos={idle_ticks}, ciclos sem progresso={stalled_ticks}"
+            )
+        return interval
@@ -0,0 +1,112 @@
+""" Concurrent scheduler for the applications executed by the main loop. """
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+
+from src.core import log
+from .models import ApplicationProtocol
+
+
+class ApplicationScheduler:
+    """
+    Runs each registered application on a shared thread pool.
+    
+    - Every application has its own concurrency limit (1 by default: the parallelism inside an application
+      comes from its seller pool). If an application already uses all its slots (Ex.: a long publication
+      backlog), it's skipped on that tick while the others keep running. Executions of a same instance
+      are safe to overlap: their claims are disjoint, the write buffer is locked and flushed before the
+      claims are released, and their seller schedulers share the same leases.
+    - Failures are isolated: an exception inside an application is logged and only frees its slot.
+    """
+    def __init__(self) -> None:
+        self._applications: dict[str, ApplicationProtocol] = {}
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._limits: dict[str, int] = {}
+        self._futures: set[Future] = set()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+    
+    def register(self, name: str, application: ApplicationProtocol, limit: int = 1) -> None:
+        """
+        Registers an application.
+        Args:
+            name (str): Application identifier. Ex.: "produtos".
+            application (ApplicationProtocol): Application to execute.
+            limit (int): Max simultaneous executions of this application.
+        """
+        if self._executor:
+            raise RuntimeError("As aplicações devem ser registradas antes da primeira execução.")
+        self._applications[name] = application
+        self._limits[name] = max(limit, 1)
+        self._slots[name] = threading.BoundedSemaphore(self._limits[name])
+    
+    def submit(self, names: list[str]) -> list[str]:
+        """
+        Starts the applications that still have a free slot. Doesn't wait for them to finish.
+        Args:
+            names (list[str]): Applications to start.
+        Returns:
+            list[str]: Names of the applications started.
+        """
+        executor = self._get_executor()
+        started: list[str] = []
+        
+        for name in names:
+            if not self._slots[name].acquire(blocking=False):
+                log.dev.info(f"[{name}] Limite de execuções simultâneas atingido, aplicação pulada neste ciclo.")
+                continue
+            
+            future: Future = executor.submit(self._run, name)
+            with self._lock:
+                self._futures.add(future)
+            future.add_done_callback(self._forget)
+            started.append(name)
+        
+        return started
+    
+    def wait_any(self, timeout: float | None = None) -> bool:
+        """
+        Waits until any running application finishes (frees a slot). Returns at once if nothing is running.
+        Args:
+            timeout (float | None): Max seconds to wait. None waits indefinitely.
+        Returns:
+            bool: True if some application was running.
+        """
+        with self._lock:
+            futures: set[Future] = set(self._futures)
+        if futures:
+            wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+        return bool(futures)
+    
+    def shutdown(self, timeout: float | None = None) -> None:
+        """
+        Waits for the running applications and releases the pool.
+        Args:
+            timeout (float | None): Max seconds to wait. None waits indefinitely.
+        """
+        with self._lock:
+            futures: set[Future] = set(self._futures)
+        wait(futures, timeout=timeout)
+        
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def _run(self, name: str) -> None:
+        """ Executes an application isolating its failures. """
+        try:
+            self._applications[name].execute()
+        except Exception as e:
+            log.dev.exception(f"[{name}] Exceção inesperada durante a execução da aplicação: {e}")
+        finally:
+            self._slots[name].release()
+    
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if not self._executor:
+            max_workers: int = sum(self._limits.values())
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="app")
+        return self._executor
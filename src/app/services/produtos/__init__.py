@@ -1,10 +1,12 @@
 """ Produtos operations Enviroment. """
 
 from .manager import ProdutosApplication
+from .lanes import Lane, OperationLanes
 
 __version__ = "v.0.0.0"
 __all__ = [
     "__version__",
     
-    "ProdutosApplication"
+    "ProdutosApplication",
+    "Lane", "OperationLanes"
 ]
@@ -1,14 +1,24 @@
 """ Attribute validator based on category. """
 
+from typing import Optional
+
 from src.infra.db.models.produtos import Product
 from src.infra.api.mercadolivre.auth import AuthResponse
-from src.infra.api.mercadolivre.category import CategoryRequests
+from src.app.shared.category.attributes import (
+    RequiredAttributesIndex,
+    RequiredAttributesResponse,
+    shared_required_attributes
+)
 from .models import AttributesValidatorResponse
 
 
 class AttributesValidator:
-    def __init__(self):
-        self.cat_manager = CategoryRequests()
+    def __init__(self, required_attributes: Optional[RequiredAttributesIndex] = None):
+        """
+        Args:
+            required_attributes (RequiredAttributesIndex, optional): Required attributes by category. Default: the process-wide index.
+        """
+        self.required_attributes = required_attributes or shared_required_attributes()
     
     def validate(self, product: Product, attributes: list[dict], token: AuthResponse) -> AttributesValidatorResponse:
         """
@@ -20,15 +30,18 @@ class AttributesValidator:
         Returns:
             list[str]: A list alert messages about the missing category attributes. (If everything ok, returns a empty list).
         """
-        category_attributes = self.cat_manager.get_category_attributes(product.category.categoria, token.access_token)
+        required_response: RequiredAttributesResponse = self.required_attributes.get(product.category.categoria, token.access_token)
         
-        if not category_attributes.success:
+        if not required_response.success:
             return AttributesValidatorResponse(
                 is_valid=False,
-                causes=[f"Falha no processo de obtenção de atributos da categoria: {category_attributes.error}"]
+                causes=[f"Falha no processo de obtenção de atributos da categoria: {required_response.error}"]
             )
         
-        misses: list = self._verify_misses(attributes, category_attributes.data)
+        misses: list[str] = [
+            attribute.message()
+            for attribute in required_response.result.missing(attr["id"] for attr in attributes)
+        ]
         
         if misses: # If something is missing
             return AttributesValidatorResponse(
@@ -39,43 +52,3 @@ class AttributesValidator:
         return AttributesValidatorResponse(
             is_valid=True
         )
-    
-    def _verify_misses(self, attributes: list[dict], category_attributes: list[dict]) -> list[str]:
-        """
-        Verify if exists missing required category attributes.
-        Args:
-            attributes (list[dict]): Product attributes list.
-            category_attributes (list[dict]): Category attributes.
-        Returns:
-            list: A alert list of messages about the missing category attributes. (If everything ok, returns a empty list).
-        """
-        attributes_ids: list[str] = [attr["id"] for attr in attributes]
-        missing: list = []
-        
-        for cat_attr in category_attributes:
-            if cat_attr.get("tags", {}).get("required"): # If it's a required attribute
-                if not cat_attr.get("id") in attributes_ids: # Verify if the attribute already is inside the created attributes list
-                    missing.append(self._build_message(cat_attr))
-        return missing
-    
-    def _build_message(self, cat_attr: dict) -> str:
-        """
-        Build a friendly message for user.
-        Args:
-            cat_attr (dict): Category attribute.
-        Returns:
-            str: A message with the ID, Name of attribute and the hint e tooltip if they exists.
-        Example:
-            >>> _build_message(cat_attr)
-            "GTIN (Código universal de produto) | hint: Pode ser um EAN, UPC ou outro GTIN | tooltip: Como posso encontrar o código?..."
-        """
-        attr_id: str = cat_attr.get("id")
-        attr_name: str = cat_attr.get("name")
-        message: str = f"{attr_id} ({attr_name})"
-        
-        if hint := cat_attr.get("hint"):
-            message += f" | {hint}"
-        elif tooltip := cat_attr.get("tooltip"):
-            message += f" | {tooltip}"
-        
-        return message
@@ -1,10 +1,11 @@
 """ Category manager. """
 
-from .manager import CategoryGenerator
+from .manager import CategoryGenerator, CategoryGeneratorResponse
 
 __version__ = "v.0.0.0"
 __all__ = [
     "__version__",
     
-    "CategoryGenerator"
+    "CategoryGenerator",
+    "CategoryGeneratorResponse"
 ]
@@ -10,9 +10,10 @@ from src.app.services.produtos.generators.models import GeneratorProtocol
 from src.infra.api.mercadolivre.category import CategoryRequests
 
 from src.app.shared.category.finders import IDFinderByPath
+from src.app.shared.category.tree import CategoryTreeIndex, shared_category_tree
 
 
-from .models import CategoryGeneratorValidationResponse
+from .models import CategoryGeneratorValidationResponse, CategoryRules
 from .validators import CategoryValidator
 
 
@@ -35,6 +36,7 @@ class CategoryGenerator(GeneratorProtocol):
         self.category_validator = CategoryValidator()
         self.category_requests = CategoryRequests()
         self.category_finder_by_path = IDFinderByPath()
+        self.category_tree: CategoryTreeIndex = shared_category_tree()
     
     def generate(self, product: Product, token: AuthResponse) -> CategoryGeneratorResponse:
         """
@@ -44,6 +46,18 @@ class CategoryGenerator(GeneratorProtocol):
             token (AuthResponse): Meli authentication credentials.
         Returns:
             CategoryGeneratorResponse: The Meli category for the product.
+        """
+        return self.generate_many([product], token)[0]
+    
+    def generate_many(self, products: list[Product], token: AuthResponse) -> list[CategoryGeneratorResponse]:
+        """
+        Generate the category of many products (Ex.: a seller chunk). On each category column the products are
+        grouped by category ID, so the rules of each category are looked up (or requested) once for the group.
+        Args:
+            products (list[Product]): Product records.
+            token (AuthResponse): Meli authentication credentials.
+        Returns:
+            list[CategoryGeneratorResponse]: One response per product, in the same order.
         Todo:
             Validations:
                 - [x] categoria         → This two are basicly the same operation.
@@ -52,106 +66,90 @@ class CategoryGenerator(GeneratorProtocol):
                 - [-] categoria_exemplo (depreacted)
                 - [-] titulo (not used anymore)
         """
-        causes: list[str] = []
+        responses: list[Optional[CategoryGeneratorResponse]] = [None] * len(products)
+        causes: list[list[str]] = [[] for _ in products]
         
-        if product.category.categoria:
-            categoria_response = self.__validate_category(product, token, product.category.categoria)
-            if categoria_response.is_valid:
-                log.user.info(f"A categoria da coluna categoria foi escolhida: {categoria_response.id_used}")
-                return CategoryGeneratorResponse(
-                    success=True,
-                    result=categoria_response.id_used
-                )
+        for column in ("categoria", "categoria_id", "categoria_caminho"):
+            groups: dict[str, list[int]] = {} # Category ID: indexes of the products.
+            for index, product in enumerate(products):
+                if responses[index] is not None or not getattr(product.category, column):
+                    continue
+                if column == "categoria_caminho":
+                    finder_response = self.category_finder_by_path.find(product.category.categoria_caminho, token.access_token)
+                    if not finder_response.success:
+                        causes[index].append(f"Coluna {column}: {finder_response.error}")
+                        continue
+                    category_id: str = finder_response.result
+                else:
+                    category_id: str = getattr(product.category, column)
+                groups.setdefault(category_id, []).append(index)
             
-            causes.append(f"Coluna categoria: {categoria_response.causes}")
+            for category_id, indexes in groups.items():
+                validations = self.__validate_category([products[index] for index in indexes], token, category_id)
+                for index, validation in zip(indexes, validations):
+                    if not validation.is_valid:
+                        causes[index].append(f"Coluna {column}: {validation.causes}")
+                        continue
+                    log.user.info(f"A categoria da coluna {column} foi escolhida: {validation.id_used}")
+                    responses[index] = CategoryGeneratorResponse(
+                        success=True,
+                        result=validation.id_used
+                    )
         
-        if product.category.categoria_id:
-            categoria_id_response = self.__validate_category(product, token, product.category.categoria_id)
-            if categoria_id_response.is_valid:
-                log.user.info(f"A categoria da coluna categoria_id foi escolhida: {categoria_id_response.id_used}")
-                return CategoryGeneratorResponse(
-                    success=True,
-                    result=categoria_id_response.id_used
+        return [
+            response or CategoryGeneratorResponse(
+                success=False,
+                result=None,
+                error=CategoryGeneratorErrorCause(
+                    causes=f"Nenhuma das colunas de categoria apresentou uma categoria válida: {product_causes}"
                 )
-            
-            causes.append(f"Coluna categoria_id: {categoria_id_response.causes}")
-        
-        if product.category.categoria_caminho:
-            categoria_caminho_response = self.__validate_category_path(product, token)
-            if categoria_caminho_response.is_valid:
-                log.user.info(f"A categoria da coluna categoria_caminho foi escolhida: {categoria_caminho_response.id_used}")
-                return CategoryGeneratorResponse(
-                    success=True,
-                    result=categoria_caminho_response.id_used
-                )
-            
-            causes.append(f"Coluna categoria_caminho: {categoria_caminho_response.causes}")
-        
-        return CategoryGeneratorResponse(
-            success=False,
-            result=None,
-            error=CategoryGeneratorErrorCause(
-                causes=f"Nenhuma das colunas de categoria apresentou uma categoria válida: {causes}"
             )
-        )
+            for response, product_causes in zip(responses, causes)
+        ]
     
-    def __validate_category(self, product: Product, token: AuthResponse, category_id: str) -> CategoryGeneratorValidationResponse:
+    def __validate_category(self, products: list[Product], token: AuthResponse, category_id: str) -> list[CategoryGeneratorValidationResponse]:
         """
-        Validate a category ID.
+        Validate a category ID for many products.
         Args:
-            product (Product): A single product record.
+            products (list[Product]): Product records.
             token (AuthResponse): Meli authentication credentials.
             category_id (str): Category ID.
         Returns:
-            CategoryGeneratorValidationResponse:
+            list[CategoryGeneratorValidationResponse]: One response per product, in the same order.
         """
         
-        data_response = self.category_requests.get_category_data(
-            category_id=category_id,
-            access_token=token.access_token
-        )
+        tree = self.category_tree.tree(token.access_token)
+        rules: Optional[CategoryRules] = self.category_validator.tree_rules(tree, category_id) if tree else None
+        rules = rules or self.category_validator.api_rules(category_id)
         
-        if not data_response.success:
-            return CategoryGeneratorValidationResponse(
-                id_used=category_id,
-                causes=[f"Falha ao obter os dados da categoria {category_id} -> {data_response.error}"]
+        if rules is None:
+            data_response = self.category_requests.get_category_data(
+                category_id=category_id,
+                access_token=token.access_token
             )
+            
+            if not data_response.success:
+                return [
+                    CategoryGeneratorValidationResponse(
+                        id_used=category_id,
+                        causes=[f"Falha ao obter os dados da categoria {category_id} -> {data_response.error}"]
+                    )
+                    for _ in products
+                ]
+            rules = self.category_validator.rules(category_id, data_response.data)
         
-        validation_response = self.category_validator.validate(
-            product=product, 
-            category_data=data_response.data
-        )
-        
-        if not validation_response.is_valid:
-            return CategoryGeneratorValidationResponse(
+        validations: list[CategoryGeneratorValidationResponse] = []
+        for product, validation_response in zip(products, self.category_validator.validate_many(products, rules)):
+            if not validation_response.is_valid:
+                validations.append(CategoryGeneratorValidationResponse(
+                    id_used=category_id,
+                    causes=validation_response.causes
+                ))
+                continue
+            
+            product.category.categoria = category_id
+            validations.append(CategoryGeneratorValidationResponse(
+                is_valid=True,
                 id_used=category_id,
-                causes=validation_response.causes
-            )
-        
-        
-        product.category.categoria = category_id
-        return CategoryGeneratorValidationResponse(
-            is_valid=True,
-            id_used=category_id,
-        )
-    
-    def __validate_category_path(self, product: Product, token: AuthResponse) -> CategoryGeneratorValidationResponse:
-        """
-        Gets the category ID by a category path and validate the ID.
-        Args:
-            product (Product): A single product record.
-            token (AuthResponse): Meli authentication credentials.
-            category_id (str): Category ID.
-        Returns:
-            CategoryGeneratorValidationResponse:
-        """
-        
-        finder_response = self.category_finder_by_path.find(product.category.categoria_caminho, token.access_token)
-        if not finder_response.success:
-            return CategoryGeneratorValidationResponse(causes=finder_response.error)
-        
-        return self.__validate_category(
-            product=product,
-            token=token,
-            category_id=finder_response.result
-        )
+            ))
+        return validations
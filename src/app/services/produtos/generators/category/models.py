@@ -18,12 +18,50 @@ class CategoryGeneratorValidationResponse:
     reason: Optional[str] = None
     causes: Optional[list] = None
 
+@dataclass(frozen=True)
+class CategoryRules:
+    """ Category settings compiled once for the validation of many products. None: no limit. """
+    category_id: Optional[str]
+    is_leaf: bool
+    buying_modes: frozenset[str]
+    item_conditions: frozenset[str]
+    max_description_length: Optional[int]
+    max_pictures_per_item: Optional[int]
+    max_title_length: Optional[int]
+    maximum_price: Optional[float]
+    minimum_price: Optional[float]
+    price_required: bool
+    shipping_options: frozenset[str]
+    enabled: bool
+    
+    @classmethod
+    def compile(cls, category_data: dict[str, Any]) -> "CategoryRules":
+        """
+        Args:
+            category_data (dict[str, Any]): Category data (/categories/{id}).
+        """
+        settings: dict[str, Any] = category_data.get("settings") or {}
+        return cls(
+            category_id=category_data.get("id"),
+            is_leaf=category_data.get("children_categories") == [],
+            buying_modes=frozenset(settings.get("buying_modes") or ()),
+            item_conditions=frozenset(settings.get("item_conditions") or ()),
+            max_description_length=settings.get("max_description_length"),
+            max_pictures_per_item=settings.get("max_pictures_per_item") or None,
+            max_title_length=settings.get("max_title_length") or None,
+            maximum_price=settings.get("maximum_price") or None,
+            minimum_price=settings.get("minimum_price") or None,
+            price_required=settings.get("price") == "required",
+            shipping_options=frozenset(settings.get("shipping_options") or ()),
+            enabled=settings.get("status") == "enabled"
+        )
+
 class CategoryValidateProtocol(Protocol):
     """ Validate a especific category term. """
-    def validate(self, produto: Product, category_data: list[str, Any]):
+    def validate(self, produto: Product, rules: CategoryRules):
         """ 
         Validate a category term.
         Args:
             produto: (Product): Dataclass table product.
-            category_data: (list[str, Any]): Category data.
+            rules: (CategoryRules): Compiled category settings.
         """
@@ -1,42 +1,46 @@
 """ Validators for a category based on a Product line. """
 
 import re
-from typing import Any
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
 
 from src.infra.db.models.produtos import Product
-from .models import ValidationResponse, CategoryValidateProtocol
+from src.app.shared.category.tree import CategoryTree
+from .models import ValidationResponse, CategoryRules, CategoryValidateProtocol
 
 
 class IsLeaf(CategoryValidateProtocol):
     """ Valida se é uma categoria folha """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        if category_data.get("children_categories") != []:
+    def validate(self, produto: Product, rules: CategoryRules):
+        if not rules.is_leaf:
             return ValidationResponse(reason=f"Apenas categorias sem subcategorias são permitidas.")
         return ValidationResponse(True)
 
 
 class BuyingModes(CategoryValidateProtocol):
     """ Valida se o modo de venda do produto está dentro do permitido pela categoria """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        buying_modes: list = category_data["settings"]["buying_modes"]
-        if produto.sale.modo_compra not in buying_modes:
-            return ValidationResponse(reason=f"Apenas os modos de venda ({buying_modes}) são aceitos")
+    def validate(self, produto: Product, rules: CategoryRules):
+        if produto.sale.modo_compra not in rules.buying_modes:
+            return ValidationResponse(reason=f"Apenas os modos de venda ({sorted(rules.buying_modes)}) são aceitos")
         return ValidationResponse(True)
 
 
 class ItemConditions(CategoryValidateProtocol):
     """ Valida se a condição do produto é permitida pela categoria """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        item_conditions: list = category_data["settings"]["item_conditions"]
-        if produto.technical.condicao_produto not in item_conditions:
-            return ValidationResponse(reason=f"Apenas as condições ({item_conditions}) são permitidas")
+    def validate(self, produto: Product, rules: CategoryRules):
+        if produto.technical.condicao_produto not in rules.item_conditions:
+            return ValidationResponse(reason=f"Apenas as condições ({sorted(rules.item_conditions)}) são permitidas")
         return ValidationResponse(True)
 
 
 class MaxDescriptionLength(CategoryValidateProtocol):
     """ Valida se o tamanho da descrição está dentro do permitido """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        max_description_length: int = category_data["settings"]["max_description_length"]
+    def validate(self, produto: Product, rules: CategoryRules):
+        max_description_length: int = rules.max_description_length
+        if max_description_length is None:
+            return ValidationResponse(True)
         if len(produto.sale.descricao) > max_description_length:
             return ValidationResponse(reason=f"Tamanho da descrição excede o máximo permitido ({max_description_length})")
         return ValidationResponse(True)
@@ -44,8 +48,8 @@ class MaxDescriptionLength(CategoryValidateProtocol):
 
 class MaxPicturesPerItem(CategoryValidateProtocol):
     """ Valida se a quantidade de imagens está dentro do permitido """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        max_pictures_per_item: int = category_data["settings"]["max_pictures_per_item"]
+    def validate(self, produto: Product, rules: CategoryRules):
+        max_pictures_per_item: int = rules.max_pictures_per_item
         
         if not max_pictures_per_item:
             return ValidationResponse(True)
@@ -62,8 +66,8 @@ class MaxPicturesPerItem(CategoryValidateProtocol):
 
 class TitleLength(CategoryValidateProtocol):
     """ Valida se o tamanho do título está dentro do permitido """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        max_title_length: int = category_data["settings"]["max_title_length"]
+    def validate(self, produto: Product, rules: CategoryRules):
+        max_title_length: int = rules.max_title_length
         if not max_title_length:
             return ValidationResponse(True)
         if len(produto.sale.titulo) > max_title_length:
@@ -73,8 +77,8 @@ class TitleLength(CategoryValidateProtocol):
 
 class MaximumPrice(CategoryValidateProtocol):
     """ Eu tenho que ter cuidado, se isso returnar "null" eu preciso pular a validação e retornar verdadeiro logo de cara. """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        maximum_price: int = category_data["settings"]["maximum_price"]
+    def validate(self, produto: Product, rules: CategoryRules):
+        maximum_price: int = rules.maximum_price
         if not maximum_price:
             return ValidationResponse(True)
         if produto.sale.preco > maximum_price:
@@ -84,8 +88,8 @@ class MaximumPrice(CategoryValidateProtocol):
 
 class MinimumPrice(CategoryValidateProtocol):
     """ Valida se o preço do produto corresponde ao valor mínimo da categoria """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        minimum_price: int = category_data["settings"]["minimum_price"]
+    def validate(self, produto: Product, rules: CategoryRules):
+        minimum_price: int = rules.minimum_price
         if not minimum_price:
             return ValidationResponse(True)
         if produto.sale.preco < minimum_price:
@@ -95,41 +99,48 @@ class MinimumPrice(CategoryValidateProtocol):
 
 class Price(CategoryValidateProtocol):
     """ Valida se a categoria exige um preço """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        price: int = category_data["settings"]["price"]
-        if price != "required":
+    def validate(self, produto: Product, rules: CategoryRules):
+        if not rules.price_required:
             return ValidationResponse(True)
         if not produto.sale.preco:
-            return ValidationResponse(reason=f"Preço não informado ({price})")
+            return ValidationResponse(reason="Preço não informado (required)")
         return ValidationResponse(True)
 
 
 class ShippingOptions(CategoryValidateProtocol):
     """ Valida se o modo de entrega é compatível com a categoria """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        shipping_options: list = category_data["settings"]["shipping_options"]
-        if produto.shippiment.modo_envio not in shipping_options:
-            return ValidationResponse(reason=f"Apenas os modos de envio ({shipping_options}) são aceitos")
+    def validate(self, produto: Product, rules: CategoryRules):
+        if produto.shippiment.modo_envio not in rules.shipping_options:
+            return ValidationResponse(reason=f"Apenas os modos de envio ({sorted(rules.shipping_options)}) são aceitos")
         return ValidationResponse(True)
 
 
 class Status:
     """ Eu suspeito seriamente que isso diz respeito ao estado da categoria, se ainda está ativa ou não, se for o caso é um valor super importante. No exemplo de json que eu peguei está como "enabled" """
-    def validate(self, produto: Product, category_data: list[str, Any]):
-        status = category_data["settings"]["status"]
-        if status != "enabled":
+    def validate(self, produto: Product, rules: CategoryRules):
+        if not rules.enabled:
             return ValidationResponse(reason=f"Categoria descontinuada pelo mercado livre")
         return ValidationResponse(True)
 
 
 class CategoryValidator:
+    """
+    Validates products against a category.
+    
+    The settings of the local tree categories are compiled once into a `CategoryRules` per tree snapshot,
+    so each product validation is mostly set membership and number comparisons. A new snapshot brings the
+    fresh settings. The categories out of the tree (received from the API) are kept by category ID for
+    API_RULES_TTL seconds, so they aren't requested nor compiled again for each product.
+    """
+    MAX_RULES: int = 4096
+    API_RULES_TTL: float = 3600.0
+    
     def __init__(self):
         self.validators: list[CategoryValidateProtocol] = [
             IsLeaf(),
             BuyingModes(),
             ItemConditions(),
             MaxDescriptionLength(),
-            MaxDescriptionLength(),
             MaxPicturesPerItem(),
             TitleLength(),
             MaximumPrice(),
@@ -138,12 +149,92 @@ class CategoryValidator:
             ShippingOptions(),
             Status()
         ]
+        self._rules: OrderedDict[tuple[float, str], CategoryRules] = OrderedDict()
+        self._api_rules: OrderedDict[str, tuple[float, CategoryRules]] = OrderedDict() # ID: (compiled at, rules).
+        self._lock = threading.Lock()
+    
+    def tree_rules(self, tree: CategoryTree, category_id: str) -> Optional[CategoryRules]:
+        """
+        Compiled rules of a local tree category. Its data is only read (and the settings parsed) the first time.
+        Args:
+            tree (CategoryTree): Current category tree snapshot.
+            category_id (str): Category ID.
+        Returns:
+            CategoryRules: None if the category (or its settings) isn't in the tree.
+        """
+        key: tuple[float, str] = (tree.created_at, category_id)
+        with self._lock:
+            rules = self._rules.get(key)
+            if rules:
+                self._rules.move_to_end(key)
+                return rules
+        
+        category_data: Optional[dict[str, Any]] = tree.category_data(category_id)
+        if category_data is None:
+            return None
+        
+        rules = CategoryRules.compile(category_data)
+        with self._lock:
+            self._rules[key] = rules
+            while len(self._rules) > self.MAX_RULES: # Also drops the rules of the previous snapshots.
+                self._rules.popitem(last=False)
+        return rules
+    
+    def api_rules(self, category_id: str) -> Optional[CategoryRules]:
+        """
+        Compiled rules of a category received from the API, while they are fresher than API_RULES_TTL.
+        Args:
+            category_id (str): Category ID.
+        Returns:
+            CategoryRules: None if the category must be requested (again).
+        """
+        with self._lock:
+            cached = self._api_rules.get(category_id)
+            if cached and time.monotonic() - cached[0] < self.API_RULES_TTL:
+                self._api_rules.move_to_end(category_id)
+                return cached[1]
+        return None
+    
+    def rules(self, category_id: str, category_data: dict[str, Any]) -> CategoryRules:
+        """
+        Compiles the rules of a category received from the API and keeps them (see `api_rules`).
+        Args:
+            category_id (str): Category ID.
+            category_data (dict[str, Any]): Category data (/categories/{id}).
+        """
+        if not category_id:
+            return CategoryRules.compile(category_data)
+        
+        rules = self.api_rules(category_id)
+        if rules:
+            return rules
+        
+        rules = CategoryRules.compile(category_data)
+        with self._lock:
+            self._api_rules[category_id] = (time.monotonic(), rules)
+            self._api_rules.move_to_end(category_id)
+            while len(self._api_rules) > self.MAX_RULES:
+                self._api_rules.popitem(last=False)
+        return rules
+    
+    def validate(self, product: Product, category_data: dict[str, Any]) -> ValidationResponse:
+        return self.check(product, self.rules(category_data.get("id"), category_data))
     
+    def validate_many(self, products: Iterable[Product], rules: CategoryRules) -> list[ValidationResponse]:
+        """
+        Validates many products against the same category.
+        Args:
+            products (Iterable[Product]): Product records.
+            rules (CategoryRules): Compiled category rules (see `tree_rules` and `rules`).
+        Returns:
+            list[ValidationResponse]: One response per product, in the same order.
+        """
+        return [self.check(product, rules) for product in products]
     
-    def validate(self, product: Product, category_data: dict[str, Any]):
+    def check(self, product: Product, rules: CategoryRules) -> ValidationResponse:
         causes: list = []
         for validator in self.validators:
-            response = validator.validate(product, category_data)
+            response = validator.validate(product, rules)
             if not response.is_valid:
                 causes.append(response.reason)
         if causes:
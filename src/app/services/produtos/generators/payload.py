@@ -1,11 +1,11 @@
 """ Generate the payload data for mercado libre requests. """
 
-from typing import Any
+from typing import Any, Optional
 
 from src.core import log
 from src.infra.db.models.produtos import Product
 from src.infra.api.mercadolivre.auth import AuthResponse
-from .category import CategoryGenerator
+from .category import CategoryGenerator, CategoryGeneratorResponse
 from .attributes import AttributesGenerator
 from .pictures import PicturesGenerator
 from .shipping import ShippingGenerator
@@ -20,12 +20,31 @@ class PayloadGenerator:
         self.pictures_generator = PicturesGenerator()
         self.category_generator = CategoryGenerator()
     
-    def build_publication_payload(self, product: Product, token: AuthResponse) -> PayloadGeneratorResponse:
+    def generate_categories(self, products: list[Product], token: AuthResponse) -> dict[int, CategoryGeneratorResponse]:
+        """
+        Generates the categories of many products at once (see `CategoryGenerator.generate_many`).
+        Args:
+            products (list[Product]): Product records.
+            token (AuthResponse): Meli authentication credentials.
+        Returns:
+            dict[int, CategoryGeneratorResponse]: Valid categories by line ID. The others are left out, to be
+                generated again (inside the line deadline) by `build_publication_payload`.
+        """
+        responses = self.category_generator.generate_many(products, token)
+        return {product.id: category for product, category in zip(products, responses) if category.success}
+    
+    def build_publication_payload(
+            self,
+            product: Product,
+            token: AuthResponse,
+            category: Optional[CategoryGeneratorResponse] = None
+        ) -> PayloadGeneratorResponse:
         """
         Constructs the item publication payload for Mercado Livre API.
         Args:
             product (Product): A single product record.
             token (AuthResponse): Meli authentication credentials.
+            category (CategoryGeneratorResponse, optional): Category already generated (see `generate_categories`).
         Returns:
             PayloadGeneratorResponse:
         """
@@ -38,7 +57,7 @@ class PayloadGenerator:
                     error=shipping.error
                 )
             
-            category = self.category_generator.generate(product, token)
+            category = category or self.category_generator.generate(product, token)
             if not category.success:
                 return PayloadGeneratorResponse(
                     success=False,
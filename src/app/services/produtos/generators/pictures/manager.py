@@ -1,11 +1,13 @@
 """ Manage the creation of a mercado libre images IDs """
 
 import os
+import asyncio
 
 from src.core import log
 from src.infra.db.models.produtos import Product
 from src.infra.api.mercadolivre.auth import AuthResponse
 from src.infra.api.mercadolivre.images import MeliImageManager
+from src.infra.api.mercadolivre.aio import AsyncMeliImageManager
 from src.infra.api.mercadolivre.models import MeliResponse
 from src.infra.api.cloudinary.manager import CloudinaryManager
 from src.app.shared.image_normalizer import ImageNormalizer
@@ -25,6 +27,7 @@ class PicturesGenerator:
         self.image_normalizer = ImageNormalizer
         self.correct_image = CorretImageProperties()
         self.meli_image_manager = MeliImageManager()
+        self.async_meli_image_manager = AsyncMeliImageManager(self.meli_image_manager)
     
     def generate(self, product: Product, token: AuthResponse) -> PicturesGeneratorResponse:
         """
@@ -107,7 +110,7 @@ class PicturesGenerator:
     
     def __create_meli_ids(self, urls: list[UrlGeneratorResponse], token: AuthResponse) -> PicturesGeneratorResponse:
         """
-        Upload a list of URLs to mercado libre and create the meli image IDs.
+        Upload a list of URLs to mercado libre and create the meli image IDs. The uploads are in flight at once.
         Args:
             urls (list[UrlGeneratorResponse]): List with the UrlGeneratorResponse what contains the images urls.
         Returns:
@@ -116,8 +119,9 @@ class PicturesGenerator:
         failed_pictures_ids: list[str] = []
         meli_pictures_ids: list[str] = []
         
-        for url in urls:
-            meli_picture_id = self.__upload_url(url.data.url, token)
+        uploads: list[PicturesGeneratorResponse] = asyncio.run(self.__upload_urls([url.data.url for url in urls], token))
+        
+        for url, meli_picture_id in zip(urls, uploads):
             if not meli_picture_id.success:
                 failed_pictures_ids.append(f"url: {url.data.url}, causa: {meli_picture_id.error.message}")
             meli_pictures_ids.append({"id": meli_picture_id.result.get("id")}) # Gets the meli image id
@@ -138,7 +142,18 @@ class PicturesGenerator:
             result=meli_pictures_ids
         )
     
-    def __upload_url(self, url: str, token: AuthResponse) -> PicturesGeneratorResponse:
+    async def __upload_urls(self, urls: list[str], token: AuthResponse) -> list[PicturesGeneratorResponse]:
+        """
+        Uploads the URLs concurrently.
+        Args:
+            urls (list[str]): Images urls.
+            token (AuthResponse): Meli token for upload url request.
+        Returns:
+            list[PicturesGeneratorResponse]: One response for each url, in the same order.
+        """
+        return await asyncio.gather(*(self.__upload_url(url, token) for url in urls))
+    
+    async def __upload_url(self, url: str, token: AuthResponse) -> PicturesGeneratorResponse:
         """
         Returns a MeliResponse with the mercado libre picture data.
         Args:
@@ -147,7 +162,7 @@ class PicturesGenerator:
         Returns:
             MeliResponse: Response with the IDs content.
         """
-        meli_id_response = self.meli_image_manager.get_meli_picture(image_url=url, access_token=token.access_token)
+        meli_id_response = await self.async_meli_image_manager.get_meli_picture(image_url=url, access_token=token.access_token)
         
         if not meli_id_response.success:
             log.user.error(f"{meli_id_response.error.message}. Exception: {meli_id_response.error.exception}")
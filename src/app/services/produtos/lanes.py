@@ -0,0 +1,77 @@
+""" Priority lanes of the Produtos table operations. """
+
+from enum import Enum
+from typing import Iterable
+
+from sqlalchemy import ColumnElement, and_, case, func, not_, or_
+
+from src.infra.db.models.produtos import Product, Produtos
+
+
+PUBLICATION: int = 1
+EDITION: int = 2
+URGENT_OPERATIONS: tuple[int, ...] = (3, 5) # Pause, Deletion.
+
+
+class Lane(Enum):
+    URGENT = "urgente"
+    NORMAL = "normal"
+
+
+class OperationLanes:
+    """
+    Classifies the Produtos lines into priority lanes.
+    
+    - URGENT: cheap operations that stop overselling: `URGENT_OPERATIONS` (pause, deletion) and the
+      editions that zero the stock.
+    - NORMAL: everything else. Inside this lane the publications (the most expensive operation) go last.
+    
+    Price edits stay in the NORMAL lane: an edition line carries the whole product (the table keeps no
+    previous price to compare with), so a price change can't be told apart from a full (expensive) edition.
+    The urgent lane runs on its own seller pool and its chunks go ahead of the normal ones of the same
+    seller (see `SellerScheduler.priority`).
+    """
+    COLUMNS: tuple[str, ...] = ("operacao", "estoque") # Columns read by `is_urgent` and `sort`.
+    
+    def __init__(self, urgent_operations: Iterable[int] = URGENT_OPERATIONS) -> None:
+        """
+        Args:
+            urgent_operations (Iterable[int]): `operacao` values always treated as urgent.
+        """
+        self.urgent_operations: frozenset[int] = frozenset(urgent_operations)
+    
+    def where(self, lane: Lane) -> ColumnElement[bool]:
+        """
+        SQL filter of the lane lines.
+        Args:
+            lane (Lane): Priority lane.
+        """
+        urgent = self._urgent_clause()
+        return urgent if lane == Lane.URGENT else not_(urgent)
+    
+    def order_by(self) -> list[ColumnElement]:
+        """ SQL claim order: urgent lines first and publications after every other operation. """
+        return [
+            case((self._urgent_clause(), 0), else_=1),
+            case((func.coalesce(Produtos.operacao, 0) == PUBLICATION, 1), else_=0)
+        ]
+    
+    def is_urgent(self, line: Product) -> bool:
+        """ Same rule of `where(Lane.URGENT)`, applied to an already loaded line. """
+        operacao: int = line.controllers.operacao
+        return operacao in self.urgent_operations or (operacao == EDITION and line.sale.estoque == 0)
+    
+    def sort(self, lines: list[Product]) -> list[Product]:
+        """ Orders the lines by priority, keeping the claim (ID) order inside each priority. """
+        return sorted(lines, key=lambda line: (
+            not self.is_urgent(line),
+            line.controllers.operacao == PUBLICATION
+        ))
+    
+    def _urgent_clause(self) -> ColumnElement[bool]:
+        # Coalesce avoids NULL results, so every line belongs to exactly one lane.
+        operacao = func.coalesce(Produtos.operacao, 0)
+        return or_(
+            operacao.in_(self.urgent_operations),
+            and_(operacao == EDITION, func.coalesce(Produtos.estoque, -1) == 0)
+        )
@@ -1,15 +1,20 @@
 """ Execution flow of Produtos table operations. """
 
+from typing import Optional
+
 from src.core import log
+from src.config import AppConfigManager
 from src.infra.api.mercadolivre.auth import AuthResponse, MeliAuthCredentials
 from src.infra.api.mercadolivre.items import ItemsRequests
 from src.infra.db.models.produtos import Product
 from src.infra.db.repo import ProdutosRepository
 from src.app.shared.oganizer import GroupBy
+from src.app.shared.seller_scheduler import SellerScheduler, shared_seller_leases
 from src.app.shared.token_manager import MeliTokenManager
 from .generators.payload import PayloadGenerator
+from .lanes import Lane, OperationLanes
 from .operations import (
-    ProdutosOperationProtocol, 
+    ProdutosOperationProtocol, LINE_COLUMNS,
     Publication, Edition, Pause, Activation, Deletion,
     JustSleep, InvalidOperation
 )
@@ -20,18 +25,20 @@ class OperationFactory:
         self, 
         repo: ProdutosRepository, 
         payload_generator: PayloadGenerator = None,
-        items_requests: ItemsRequests = None
+        items_requests: ItemsRequests = None,
+        operation_deadline: Optional[float] = None
     ) -> ProdutosOperationProtocol:
         self.repo = repo
         self.payload_generator = payload_generator
         self.items_requests = items_requests
+        self.operation_deadline = operation_deadline
     
     def create(self, operation_id: int) -> ProdutosOperationProtocol:
         match operation_id:
             case 1:
-                return Publication(log, self.repo, self.payload_generator, self.items_requests)
+                return Publication(log, self.repo, self.payload_generator, self.items_requests, self.operation_deadline)
             case 2:
-                return Edition(log, self.repo, self.items_requests, self.payload_generator)
+                return Edition(log, self.repo, self.items_requests, self.payload_generator, self.operation_deadline)
             case 3:
                 return Pause(log, self.repo, self.items_requests)
             case 4:
@@ -44,8 +51,29 @@ class OperationFactory:
 
 
 class ProdutosApplication:
-    def __init__(self):
+    def __init__(self, lane: Optional[Lane] = None):
+        """
+        Args:
+            lane (Lane, optional): Priority lane processed by this application. None processes every line,
+                urgent ones first.
+        """
+        config = AppConfigManager()
+        scheduler_config = config.load_scheduler_config()
+        self.lane = lane
+        self.lanes = OperationLanes(scheduler_config.urgent_operations)
+        # Claimed columns: enough for the status operations. The others load the rest of their lines.
+        self.claim_columns: frozenset[str] = frozenset((*LINE_COLUMNS, *OperationLanes.COLUMNS))
+        self.worker_config = config.load_worker_config()
+        urgent: bool = lane == Lane.URGENT
+        self.seller_scheduler = SellerScheduler(
+            max_workers=scheduler_config.urgent_seller_workers if urgent else scheduler_config.seller_workers,
+            chunk_size=scheduler_config.seller_chunk_size,
+            leases=shared_seller_leases(), # The urgent chunks of a seller go ahead of its normal chunks.
+            priority=urgent
+        )
         self.repo = ProdutosRepository()
+        self.repo.update.retry_delay = self.worker_config.retry_delay
+        self.repo.update.max_retries = self.worker_config.max_retries
         self.payload_generator = PayloadGenerator()
         self.items_requests = ItemsRequests()
         self.meli_auth = MeliAuthCredentials()
@@ -56,23 +84,78 @@ class ProdutosApplication:
         self.operation_factory = OperationFactory(
             repo=self.repo,
             payload_generator=self.payload_generator, 
-            items_requests=self.items_requests
+            items_requests=self.items_requests,
+            operation_deadline=config.load_http_config().operation_deadline
         )
     
+    def backlog(self) -> int:
+        """ Pending lines of this application lane. """
+        return self.repo.get.count_pending(where=self._lane_filter())
+    
     def execute(self) -> None:
-        pending_lines = self.repo.get.pending_operations()
+        pending_lines = self.repo.get.claim_pending_operations(
+            worker_id=self.worker_config.worker_id,
+            limit=self.worker_config.claim_limit,
+            where=self._lane_filter(),
+            order_by=self.lanes.order_by(),
+            columns=self.claim_columns
+        )
         
         if not pending_lines:
             # print("Nenhuma linha pendente no momento")
             return
         
-        user_lines = GroupBy.column(pending_lines, "credentials.client_id")
+        user_lines = GroupBy.column(self.lanes.sort(pending_lines), "credentials.client_id")
         
-        for user, lines in user_lines.items():
-            if token := self.token_manager.get_token(lines):
-                self._execute_operations(lines, token.data)
-            else:
+        tokens: dict[str, Optional[AuthResponse]] = {}
+        try:
+            with self.repo.update.batch(): # Line results are written grouped at the end of the batch.
+                self.seller_scheduler.run(
+                    user_lines,
+                    lambda user, lines: self._execute_seller(user, lines, tokens)
+                )
+        finally:
+            # Lines left in EXECUTING: the ones never started go back to the queue, the others to PROGRAM_ERROR.
+            self.repo.update.release_claims(
+                [line.id for line in pending_lines],
+                retry_delay=self.worker_config.retry_delay
+            )
+    
+    def _execute_seller(self, user: str, lines: list[Product], tokens: dict[str, Optional[AuthResponse]]) -> None:
+        """
+        Processes a chunk of a seller lines. The token is requested once, on the seller first chunk.
+        Args:
+            user (str): Seller client_id.
+            lines (list[Product]): Chunk of the seller lines.
+            tokens (dict[str, Optional[AuthResponse]]): Tokens already requested on this execution.
+        """
+        if user not in tokens:
+            token = self.token_manager.get_token(lines)
+            tokens[user] = token.data if token else None
+            if not token:
                 print(f"Falha ao obter token para usuário {user}")
+        
+        if tokens[user]:
+            self._execute_operations(lines, tokens[user])
+    
+    def _load_columns(self, lines: list[Product], operation: ProdutosOperationProtocol) -> list[Product]:
+        """
+        Reloads the lines when the operation reads columns that weren't claimed.
+        Args:
+            lines (list[Product]): Claimed lines of the operation.
+            operation (ProdutosOperationProtocol): Operation that will execute the lines.
+        Returns:
+            list[Product]: The lines with the operation columns, in the same order.
+        """
+        columns = operation.columns
+        if columns is not None and self.claim_columns.issuperset(columns):
+            return lines
+        
+        loaded: dict[int, Product] = {line.id: line for line in self.repo.get.by_ids([line.id for line in lines], columns)}
+        return [loaded[line.id] for line in lines if line.id in loaded]
+    
+    def _lane_filter(self):
+        return self.lanes.where(self.lane) if self.lane else None
     
     def _execute_operations(self, user_lines: list[Product], token: AuthResponse):
         oper_lines = GroupBy.column(user_lines, "controllers.operacao")
@@ -81,7 +164,7 @@ class ProdutosApplication:
         for oper_id, items in oper_lines.items():
             try:
                 operation = self.operation_factory.create(oper_id)
-                operation.execute(items, token)
+                operation.execute(self._load_columns(items, operation), token)
             except ValueError as e:
                 log.user.exception(f"Erro: {e}")
             except AttributeError as e:
@@ -1,6 +1,6 @@
 """  """
 
-from .models import ProdutosOperationProtocol
+from .models import ProdutosOperationProtocol, LINE_COLUMNS
 from .publication import Publication
 from .edition import Edition
 from .status_changers import Pause, Activation, Deletion
@@ -11,6 +11,7 @@ __all__ = [
     "__version__",
     
     "ProdutosOperationProtocol",
+    "LINE_COLUMNS",
     
     "Publication",
     "Edition",
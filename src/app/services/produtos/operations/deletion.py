@@ -11,11 +11,13 @@ from src.infra.db.repo.models import ResponseCode
 from src.app.shared.validators import ValidatorsProtocol, EmptyColumnsValidator, EmptyCredentialColumnsValidator
 
 
-from .models import ProdutosOperationProtocol
+from .models import ProdutosOperationProtocol, LINE_COLUMNS
 from .tools import ProdutosValidator
 
 
 class Deletion(ProdutosOperationProtocol):
+    columns: tuple[str, ...] = LINE_COLUMNS
+    
     def __init__(
         self,
         log: log,
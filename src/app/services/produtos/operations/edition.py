@@ -15,10 +15,15 @@ Provides:
     EditionAbortError: Excpetion for controled errors during the executiong flow.
 """
 
+import asyncio
+from typing import Optional
+
 from src.core.log import log
 from src.infra.api.mercadolivre.auth import AuthResponse
 from src.infra.api.mercadolivre.items import ItemsRequests
+from src.infra.api.mercadolivre.aio import AsyncItemsRequests
 from src.infra.api.mercadolivre.models import MeliResponse
+from src.infra.api.mercadolivre.timeouts import deadline_scope, no_deadline
 from src.infra.db.models.produtos import Product
 from src.infra.db.repo import ProdutosRepository
 from src.infra.db.repo.models import ResponseCode
@@ -44,17 +49,27 @@ class EditionAbortError(Exception):
 
 
 class Edition(ProdutosOperationProtocol):
+    columns = None # Builds the payload from the whole line.
+    
     def __init__(
         self,
         log: log,
         repo: ProdutosRepository,
         items_requests: ItemsRequests,
-        payload_generator: PayloadGenerator
+        payload_generator: PayloadGenerator,
+        deadline: Optional[float] = None
     ) -> None:
+        """
+        Args:
+            deadline (float, optional): Max seconds to update the description of each product, and then to edit
+                it. The reactivation is never cut short.
+        """
         self.log = log
         self.repo = repo
         self.items_requests = items_requests
+        self.async_items_requests = AsyncItemsRequests(items_requests)
         self.payload_generator = payload_generator
+        self.deadline = deadline
         self.validator = ProdutosValidator(log, repo)
         self.validators: list[ValidatorsProtocol] = [
             EmptyCredentialColumnsValidator(),
@@ -65,34 +80,58 @@ class Edition(ProdutosOperationProtocol):
     
     def execute(self, lines: list[Product], token: AuthResponse) -> None:
         """
-        Validate and excute the edit operation for each operation line. 
+        Validate and excute the edit operation for each operation line. The descriptions of every line are
+        updated at once, then each product is paused, edited and reactivated.
         Args:
             line (Product): A list of database product lines as a dataclasses.
             token (AuthResponse): Token object with access token.
         """
         print(f"Executando {self.__class__.__name__}")
         
-        for line in lines:
+        valid_lines: list[Product] = [
+            line for line in lines if self.validator.validate(line, self.validators) # Já arualiza o banco com logs de validação.
+        ]
+        if not valid_lines:
+            return
+        
+        for line in valid_lines:
+            self.repo.update.executing(id=line.id)
+        
+        descriptions: list[tuple[Optional[EditionAbortError], bool]] = asyncio.run(
+            self._update_descriptions(valid_lines, token)
+        )
+        
+        for line, (description_error, retryable) in zip(valid_lines, descriptions):
             self.current_step = None
             
-            if not self.validator.validate(line, self.validators): # Já arualiza o banco com logs de validação.
-                continue
+            if not retryable:
+                with deadline_scope(self.deadline) as deadline:
+                    self.edit(line, token, description_error)
+                retryable = bool(deadline and deadline.retryable)
             
-            self.edit(line, token)
+            if retryable: # Editions are idempotent (PUT), safe to repeat.
+                self.repo.update.log_retry(
+                    id=line.id, 
+                    log_erro=f"Tempo limite da edição ({self.deadline}s) esgotado. A operação será repetida."
+                )
     
-    def edit(self, line: Product, token: AuthResponse) -> None:
+    def edit(self, line: Product, token: AuthResponse, description_error: Optional[EditionAbortError] = None) -> None:
         """
         Manage the methods responsible for make the editation steps.
         Args:
             line (Product): Database product line as a dataclass.
             token (AuthResponse): Token object with access token.
+            description_error (EditionAbortError, optional): Failure of the description update. Aborts the edition.
         """
         try:
             
             product_data: MeliResponse | None = None
-            self.repo.update.executing(id=line.id)
+            product_data_response: MeliResponse | None = None
+            
+            if description_error:
+                self.current_step = "Atualizar a descrição do produto"
+                raise description_error
             
-            description_response: MeliResponse = self._update_description(line, token)
             product_data_response: MeliResponse = self._get_product_data(line, token)
             product_data_response: MeliResponse = self._pause(line, token, product_data_response) 
             edition_payload: PayloadGeneratorResponse = self._build_edition_payload(line, token, product_data_response)
@@ -182,37 +221,57 @@ class Edition(ProdutosOperationProtocol):
         
         return edition_payload
 
-    def _update_description(self, line: Product, token: AuthResponse) -> MeliResponse:
+    async def _update_descriptions(
+        self, 
+        lines: list[Product], 
+        token: AuthResponse
+    ) -> list[tuple[Optional[EditionAbortError], bool]]:
+        """
+        Updates the descriptions of every line concurrently, each one with its own deadline.
+        Args:
+            lines (list[Product]): Database product lines as dataclasses.
+            token (AuthResponse): Token object with access token.
+        Returns:
+            list[tuple[Optional[EditionAbortError], bool]]: (failure, deadline expired) of each line, in the same order.
+        """
+        return await asyncio.gather(*(self._update_description(line, token) for line in lines))
+    
+    async def _update_description(self, line: Product, token: AuthResponse) -> tuple[Optional[EditionAbortError], bool]:
         """
         Identifies if a update on product description is necessery, if it is, update it.
         Args:
             line (Product): Database product line as a dataclass.
             token (AuthResponse): Token object with access token.
         Returns:
-            MeliResponse:
+            tuple[Optional[EditionAbortError], bool]: The failure (None on success) and whether the deadline
+                expired (the update can be repeated).
         """
-        try:
-            get_description_response = self.items_requests.get_description(
-                access_token=token.access_token,
-                item_id=line.identfiers.ml_id_produto
-            )
-            
-            if not get_description_response.success:
-                raise EditionAbortError(f"Falha ao obter dados de descrição durante o processo de edição.")
-            
-            description_plain_text: str = get_description_response.data.get("plain_text")
-            
-            if not description_plain_text:
-                add_description_response = self._add_description(line, token)
-                return add_description_response
-            
-            self._change_description(line, token, description_plain_text)
-        except EditionAbortError:
-            raise
-        except Exception as e:
-            raise EditionAbortError(f"Falha inesperada na descrição: {e}") from e
+        error: Optional[EditionAbortError] = None
+        with deadline_scope(self.deadline) as deadline:
+            try:
+                get_description_response = await self.async_items_requests.get_description(
+                    access_token=token.access_token,
+                    item_id=line.identfiers.ml_id_produto
+                )
+                
+                if not get_description_response.success:
+                    raise EditionAbortError(
+                        f"Falha ao obter dados de descrição durante o processo de edição: {get_description_response.error}"
+                    )
+                
+                description_plain_text: str = get_description_response.data.get("plain_text")
+                
+                if not description_plain_text:
+                    await self._add_description(line, token)
+                else:
+                    await self._change_description(line, token, description_plain_text)
+            except EditionAbortError as e:
+                error = e
+            except Exception as e:
+                error = EditionAbortError(f"Falha inesperada na descrição: {e}")
+        return error, bool(deadline and deadline.retryable)
     
-    def _add_description(self, line: Product, token: AuthResponse, change_description: bool = False) -> MeliResponse:
+    async def _add_description(self, line: Product, token: AuthResponse, change_description: bool = False) -> MeliResponse:
         """
         Adds a description for a product.
         Args:
@@ -222,7 +281,7 @@ class Edition(ProdutosOperationProtocol):
         Returns:
             MeliResponse:
         """
-        add_description_response = self.items_requests.add_description(
+        add_description_response = await self.async_items_requests.add_description(
             access_token=token.access_token, 
             item_id=line.identfiers.ml_id_produto,
             descrption=line.sale.descricao,
@@ -233,7 +292,7 @@ class Edition(ProdutosOperationProtocol):
         
         return add_description_response
     
-    def _change_description(self, line: Product, token: AuthResponse, description_plain_text: str) -> None:
+    async def _change_description(self, line: Product, token: AuthResponse, description_plain_text: str) -> None:
         """
         If it has a description, and it's diferent, change it.
         Args:
@@ -245,7 +304,7 @@ class Edition(ProdutosOperationProtocol):
         if line.sale.descricao == description_plain_text:
             return
         
-        self._add_description(
+        await self._add_description(
             line=line,
             token=token,
             change_description=True
@@ -329,11 +388,12 @@ class Edition(ProdutosOperationProtocol):
         
         self.current_step = "Reativar o produto"
         
-        activate_response: MeliResponse = self.items_requests.edit(
-            access_token=token.access_token,
-            item_id=line.identfiers.ml_id_produto,
-            edition_data={"status":"active"}
-        )
+        with no_deadline(): # The product must not stay paused because the edition deadline expired.
+            activate_response: MeliResponse = self.items_requests.edit(
+                access_token=token.access_token,
+                item_id=line.identfiers.ml_id_produto,
+                edition_data={"status":"active"}
+            )
         
         log.dev.info(f"[BD-ID {line.id}] Reativando o produto")
         if not activate_response.success:
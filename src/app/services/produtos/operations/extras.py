@@ -6,6 +6,8 @@ from src.infra.db.repo import ProdutosRepository
 from src.infra.db.repo.models import ResponseCode
 
 class JustSleep:
+    columns: tuple[str, ...] = ("operacao",)
+    
     def __init__(self, repo: ProdutosRepository):
         self.repo = repo
     
@@ -16,6 +18,8 @@ class JustSleep:
             self.repo.update.got_to_sleep(line.id)
 
 class InvalidOperation:
+    columns: tuple[str, ...] = ("operacao",)
+    
     def __init__(self, repo: ProdutosRepository):
         self.repo = repo
     
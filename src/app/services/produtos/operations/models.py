@@ -12,7 +12,16 @@ class ValidationResponse:
     reason: Optional[str] = None
     causes: Optional[list] = None
 
+LINE_COLUMNS: tuple[str, ...] = ( # Columns of the operations that only change the product status.
+    "client_id", "client_secret", "redirect_uri", "refresh_token",
+    "operacao", "cod_retorno", "log_erro",
+    "cod_produto", "ml_id_produto",
+    "produto_status"
+)
+
 @runtime_checkable
 class ProdutosOperationProtocol(Protocol):
+    columns: Optional[tuple[str, ...]] # Columns the operation reads. None: the whole line.
+    
     def execute(self, lines: list[Product], token: AuthResponse) -> None:
         ...
@@ -1,18 +1,20 @@
 
 import os
 import re
-from typing import Any
+from typing import Any, Optional
 
 from src.core.log import log
 from src.infra.api.mercadolivre.auth import AuthResponse
 from src.infra.api.mercadolivre.items import ItemsRequests
 from src.infra.api.mercadolivre.models import MeliResponse
 from src.infra.api.mercadolivre.catalog_compatibilities import CatalogCompatibilitiesRequests
+from src.infra.api.mercadolivre.timeouts import deadline_scope
 from src.infra.db.models.produtos import Product
 from src.infra.db.repo import ProdutosRepository
 from src.infra.db.repo.models import ResponseCode
 from src.app.shared.validators import ValidatorsProtocol, EmptyColumnsValidator, EmptyCredentialColumnsValidator
 from src.app.services.produtos.generators import PayloadGenerator, PayloadGeneratorResponse
+from src.app.services.produtos.generators.category import CategoryGeneratorResponse
 from .models import ProdutosOperationProtocol
 from .tools import ProdutosValidator
 
@@ -23,6 +25,8 @@ class PublicationErrorHandler:
         self.repo = repo
     
     def handle_publication_request(self, line, publication_response: MeliResponse) -> None:
+        if publication_response.error.retryable: # Nothing was created: `Publication.execute` gives the line back to the queue.
+            return
         if self._is_logistic_erro(line, publication_response): # Especific error
             return
         self.repo.update.log_error(
@@ -34,7 +38,8 @@ class PublicationErrorHandler:
     def _is_logistic_erro(self, line, publication_response: MeliResponse) -> bool:
         
         fullfilment_not_allowed_error: str = '"message":"Client not allowed to update item null logistic_type."'
-        if publication_response.error.details.find(fullfilment_not_allowed_error) != -1:
+        details: str = publication_response.error.details or "" # Timeouts have no response body.
+        if details.find(fullfilment_not_allowed_error) != -1:
             self.repo.update.log_error(
                 line.id, 
                 return_code=ResponseCode.PROGRAM_ERROR, 
@@ -44,17 +49,25 @@ class PublicationErrorHandler:
         return False
 
 class Publication(ProdutosOperationProtocol):
+    columns = None # Builds the payload from the whole line.
+    
     def __init__(
         self, 
         log: log, 
         repo: ProdutosRepository, 
         payload_generator: PayloadGenerator, 
-        items_requests: ItemsRequests
+        items_requests: ItemsRequests,
+        deadline: Optional[float] = None
     ) -> None:
+        """
+        Args:
+            deadline (float, optional): Max seconds to publish each product (payload, publication, description and compatibilities).
+        """
         self.log = log
         self.repo = repo
         self.payload_generator = payload_generator
         self.items_requests = items_requests
+        self.deadline = deadline
         self.handler = PublicationErrorHandler(log, repo)
         self.validator = ProdutosValidator(log, repo)
         self.comp_requests = CatalogCompatibilitiesRequests()
@@ -76,43 +89,91 @@ class Publication(ProdutosOperationProtocol):
         """
         print(f"Executando {self.__class__.__name__}")
         
+        categories: dict[int, CategoryGeneratorResponse] = self.__generate_categories(lines, token)
         for line in lines:
-            self.repo.update.executing(id=line.id)
-            
-            if not self.validator.validate(line, self.validators):
-                continue
-            
-            payload_response: PayloadGeneratorResponse = self.__create_payload(line, token)
-            if not payload_response.success:
-                continue
-            
-            publication_response: MeliResponse = self.__publish(line, token.access_token, payload_data=payload_response.result)
-            if not publication_response.success:
+            try:
+                with deadline_scope(self.deadline) as deadline:
+                    retryable: bool = self.__publish_line(line, token, categories.get(line.id))
+            except Exception as e: # Isolates the line: the others of the group are still published.
+                self.log.dev.exception(f"[DB-ID: {line.id}] Falha inesperada na publicação: {e}")
+                self.repo.update.log_error(
+                    line.id, 
+                    return_code=ResponseCode.PROGRAM_ERROR, 
+                    log_erro=f"Falha inesperada na publicação: {e}",
+                    durable=True
+                )
                 continue
             
-            description_response: MeliResponse = self.__add_description(line, token.access_token)
-            if not description_response.success:
-                continue
-            
-            compatibility_response: MeliResponse = self.__add_compatibility(
-                line=line, 
-                access_token=token.access_token, 
-                publication_data=publication_response.data
-            )
-            if not compatibility_response.success:
-                continue
-            
-            self.__register_publication_success(line=line, publication_data=publication_response.data)
+            # Cut short before the item was created on mercado libre: safe to publish again later.
+            if retryable or (deadline and deadline.retryable and not deadline.committed):
+                self.repo.update.log_retry(
+                    id=line.id, 
+                    log_erro=f"Tempo limite da publicação ({self.deadline}s) esgotado. A operação será repetida."
+                )
     
-    def __create_payload(self, line: Product, token: AuthResponse) -> PayloadGeneratorResponse:
+    def __generate_categories(self, lines: list[Product], token: AuthResponse) -> dict[int, CategoryGeneratorResponse]:
+        """
+        Generates the categories of the lines at once, so the lines of a same category share its rules.
+        Failures are left to the line publication, which generates its category again inside its own deadline.
+        Args:
+            lines (list[Product]): Database product lines.
+            token (AuthResponse): Token object with access token.
+        """
+        try:
+            with deadline_scope(self.deadline):
+                return self.payload_generator.generate_categories(lines, token)
+        except Exception as e:
+            self.log.dev.exception(f"Falha ao gerar as categorias do lote: {e}")
+            return {}
+    
+    def __publish_line(self, line: Product, token: AuthResponse, category: Optional[CategoryGeneratorResponse] = None) -> bool:
+        """
+        Publish a single product (payload, publication, description and compatibilities).
+        Args:
+            line (Product): Database product line as a dataclass.
+            token (AuthResponse): Token object with access token.
+            category (CategoryGeneratorResponse, optional): Category already generated for the line.
+        Returns:
+            bool: True if the publication request failed before creating the item and can be repeated.
+        """
+        self.repo.update.executing(id=line.id)
+        
+        if not self.validator.validate(line, self.validators):
+            return False
+        
+        payload_response: PayloadGeneratorResponse = self.__create_payload(line, token, category)
+        if not payload_response.success:
+            return False
+        
+        publication_response: MeliResponse = self.__publish(line, token.access_token, payload_data=payload_response.result)
+        if not publication_response.success:
+            return publication_response.error.retryable
+        
+        description_response: MeliResponse = self.__add_description(line, token.access_token)
+        if not description_response.success:
+            return False
+        
+        compatibility_response: MeliResponse = self.__add_compatibility(
+            line=line, 
+            access_token=token.access_token, 
+            publication_data=publication_response.data
+        )
+        if not compatibility_response.success:
+            return False
+        
+        self.__register_publication_success(line=line, publication_data=publication_response.data)
+        return False
+    
+    def __create_payload(self, line: Product, token: AuthResponse, category: Optional[CategoryGeneratorResponse] = None) -> PayloadGeneratorResponse:
         """
         Creates a dictionary with publication data.
         Args:
             line Product: Product dataclass table line.
+            category (CategoryGeneratorResponse, optional): Category already generated for the line.
         Returns:
             (dict[str, Any]): A dictiornary with the product payload data
         """
-        payload_response = self.payload_generator.build_publication_payload(product=line, token=token)
+        payload_response = self.payload_generator.build_publication_payload(product=line, token=token, category=category)
         if not payload_response.success:
             self.repo.update.log_error(
                 line.id, 
@@ -146,6 +207,8 @@ class Publication(ProdutosOperationProtocol):
         link: str = publication_response.data.get("permalink", "Link não encontrado")
         cod_produto: str = line.identfiers.cod_produto
         
+        self.repo.update.register_publication(line.id, ml_id_produto=ml_id, link_publicacao=link)
+        
         self.__register_publication(
             ml_id=ml_id, 
             link=link, 
@@ -176,7 +239,8 @@ class Publication(ProdutosOperationProtocol):
             self.repo.update.log_error(
                 line.id, 
                 return_code=ResponseCode.PROGRAM_ERROR, 
-                log_erro=descripition_response.error
+                log_erro=descripition_response.error,
+                durable=True # After the publication: never leave the line EXECUTING.
             )
         
         self.log.user.info("Descrição adicionada com sucesso.")
@@ -213,7 +277,8 @@ class Publication(ProdutosOperationProtocol):
             self.repo.update.log_error(
                 line.id, 
                 return_code=ResponseCode.PROGRAM_ERROR, 
-                log_erro=compatibilities_response.error
+                log_erro=compatibilities_response.error,
+                durable=True
             )
             return compatibilities_response
         
@@ -230,7 +295,8 @@ class Publication(ProdutosOperationProtocol):
             self.repo.update.log_error(
                 line.id, 
                 return_code=ResponseCode.PROGRAM_ERROR, 
-                log_erro=compatibility_addition_response.error
+                log_erro=compatibility_addition_response.error,
+                durable=True
             )
         
         return compatibility_addition_response
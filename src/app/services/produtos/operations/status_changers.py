@@ -10,11 +10,13 @@ from src.infra.db.models.produtos import Product
 from src.infra.db.repo import ProdutosRepository
 from src.infra.db.repo.models import ResponseCode
 from src.app.shared.validators import ValidatorsProtocol, EmptyColumnsValidator, EmptyCredentialColumnsValidator
-from .models import ProdutosOperationProtocol
+from .models import ProdutosOperationProtocol, LINE_COLUMNS
 from .tools import ProdutosValidator
 
 
 class StatusChanger(ProdutosOperationProtocol):
+    columns: tuple[str, ...] = LINE_COLUMNS
+    
     def __init__(
         self,
         log: log,
@@ -126,6 +128,8 @@ class Activation(StatusChanger):
         )
 
 class Deletion(ProdutosOperationProtocol):
+    columns: tuple[str, ...] = LINE_COLUMNS
+    
     def __init__(
         self,
         log: log,
@@ -4,7 +4,7 @@ Operacao = 1 -> pesquisar usando o caminho completo da categoria. E retornar o i
 Operacao = 2 -> pesquisar por titulo_produto. Retornar o caminho completo da categoria e o id.
 Operacao = 3 -> pesquisar por id. Retornar o caminho completo da categoria.
 """
-from typing import Any
+from typing import Any, Optional
 
 from src.core import log
 from src.app.shared.operations import TableOperationProtocol
@@ -15,8 +15,11 @@ from src.infra.api.mercadolivre.category import CategoryRequests
 from src.infra.api.mercadolivre.models import MeliResponse
 from src.infra.db.models.produtos_category import ProdutosCategoryDataclass
 from src.infra.db.repo import ProdutosCategroyRepository
-from src.infra.db.repo.models import ResponseCode
+from src.infra.db.repo.models import ResponseCode, ResultSource
 from src.app.shared.category.finders import IDFinderByPath, CategoryFinderResponse
+from src.app.shared.category.tree import CategoryTree, shared_category_tree
+from src.app.shared.category.names import normalize_title
+from src.app.shared.category.predictions import TitleCategoryPredictor
 from src.app.shared.validators import (
     ValidatorsProtocol, 
     EmptyColumnsValidator, 
@@ -190,6 +193,7 @@ class CategoryIDFromTitle(TableOperationProtocol):
         self.log = log
         self.repo = repo
         self.items_requests = items_requests
+        self.predictor = TitleCategoryPredictor(items_requests=items_requests)
         self.validator = OperationValidator(self.log, self.repo)
         self.validators: list[ValidatorsProtocol] = [
             EmptyCredentialColumnsValidator(),
@@ -200,16 +204,26 @@ class CategoryIDFromTitle(TableOperationProtocol):
     
     def execute(self, lines: list[ProdutosCategoryDataclass], token: AuthResponse) -> None:
         print(self.__class__.__name__)
-        for line in lines:
+        valid_lines: list[ProdutosCategoryDataclass] = [
+            line for line in lines if self.__validate(line)
+        ]
+        
+        # Rows with the same normalized title share a single domain discovery request.
+        try:
+            predictions: dict[str, MeliResponse] = self.predictor.predict_many(
+                titles=(line.category.titulo_produto for line in valid_lines),
+                access_token=token.access_token
+            )
+        except Exception as e:
+            self.log.dev.exception(f"Erro inesperado: {e} ")
+            for line in valid_lines:
+                self.repo.update.log_error(id=line.id, return_code=ResponseCode.PROGRAM_ERROR, log_erro=f"Faha inesperada: {e}")
+            return
+        
+        new_results: dict[int, list[tuple[str, str, str]]] = {} # Extra results of each line, inserted at once.
+        for line in valid_lines:
             try:
-                
-                if not self.validator.validate(line, self.validators):
-                    continue
-                
-                categories_response: MeliResponse = self.items_requests.get_category_by_item_name(
-                    access_token=token.access_token,
-                    item_name=line.category.titulo_produto
-                )
+                categories_response: MeliResponse = predictions[normalize_title(line.category.titulo_produto)]
                 
                 print(f"{categories_response = }")
                 
@@ -221,7 +235,8 @@ class CategoryIDFromTitle(TableOperationProtocol):
                     )
                     continue
                 
-                self._register_results(line, categories_response.data)
+                if results := self._register_results(line, categories_response.data):
+                    new_results[line.id] = results
                 
             except Exception as e:
                 self.log.dev.exception(f"Erro inesperado: {e} ")
@@ -230,8 +245,31 @@ class CategoryIDFromTitle(TableOperationProtocol):
                     return_code=ResponseCode.PROGRAM_ERROR,
                     log_erro=f"Faha inesperada: {e}"
                 )
+        
+        if not new_results:
+            return
+        try:
+            # The buffered results of the lines are written with the extra rows: a crash never keeps one without the other.
+            with self.repo.update.transaction() as session:
+                self.repo.insert.add_new_results([result for results in new_results.values() for result in results], session=session)
+        except Exception as e:
+            self.log.dev.exception(f"Erro inesperado: {e} ")
+            for id in new_results:
+                self.repo.update.log_error(id=id, return_code=ResponseCode.PROGRAM_ERROR, log_erro=f"Faha inesperada: {e}")
     
-    def _register_results(self, line: ProdutosCategroyRepository, categories_response: list[dict[str, Any]]) -> None:
+    def __validate(self, line: ProdutosCategoryDataclass) -> bool:
+        try:
+            return bool(self.validator.validate(line, self.validators))
+        except Exception as e:
+            self.log.dev.exception(f"Erro inesperado: {e} ")
+            self.repo.update.log_error(
+                id=line.id, 
+                return_code=ResponseCode.PROGRAM_ERROR,
+                log_erro=f"Faha inesperada: {e}"
+            )
+            return False
+    
+    def _register_results(self, line: ProdutosCategoryDataclass, categories_response: list[dict[str, Any]]) -> list[tuple[str, str, str]]:
         """
         Process and store category search results.
         
@@ -241,30 +279,35 @@ class CategoryIDFromTitle(TableOperationProtocol):
                 [{
                     "category_id": str,
                     "category_name": str,
-                    "attributes": list
+                    "attributes": list,
+                    "source": str # Only in the local predictions.
                 }]
+        Returns:
+            list[tuple[str, str, str]]: (cod_produto, category_id, source) of the results to be added as new lines.
         """
+        new_results: list[tuple[str, str, str]] = []
         for index, category in enumerate(categories_response):
             category_id: str = category.get("category_id")
+            source: str = category.get("source", ResultSource.API)
             
             if index == 0:
                 self.repo.update.register_single_result(
                     id=line.id,
-                    category_id=category_id
+                    category_id=category_id,
+                    source=source
                 )
                 if line.controllers.operacao == 2:
-                    return
+                    return new_results
             
-            self.repo.insert.add_new_result(
-                cod_produto=line.cod_produto,
-                category_id=category_id
-            )
+            new_results.append((line.cod_produto, category_id, source))
+        return new_results
 
 class PathByCategoryID(TableOperationProtocol):
     def __init__(self, log: log, repo: ProdutosCategroyRepository, category_requests: CategoryRequests) -> None:
         self.log = log
         self.repo = repo
         self.category_requests = category_requests
+        self.category_tree = shared_category_tree()
         self.validator = OperationValidator(self.log, self.repo)
         self.validators: list[ValidatorsProtocol] = [
             EmptyCredentialColumnsValidator(),
@@ -292,6 +335,10 @@ class PathByCategoryID(TableOperationProtocol):
                 self.__handle_error(id=line.id, message=f"[{self.__class__.__name__}] Excessão inesperada: {e}", log=True)
     
     def _get_category_path(self, line: ProdutosCategoryDataclass, token: AuthResponse) -> str:
+        tree: Optional[CategoryTree] = self.category_tree.tree(token.access_token)
+        names: Optional[list[str]] = tree.path(line.category.categoria_id) if tree else None
+        if names:
+            return " > ".join(names)
         
         response = self.category_requests.get_category_data(
             category_id=line.category.categoria_id,
@@ -1,7 +1,10 @@
 """ Status checker for products. """
 
+import asyncio
+
 from src.infra.api.mercadolivre.models import MeliResponse, MeliRequestFail
 from src.infra.api.mercadolivre.items import ItemsRequests
+from src.infra.api.mercadolivre.aio import AsyncItemsRequests
 from src.infra.api.mercadolivre.auth import AuthResponse
 from src.infra.db.models import ProdutosStatusDataclass
 from src.infra.db.repo import ProdutosStatusRepository
@@ -31,6 +34,7 @@ class StatusChecker:
         self.log = log
         self.repo = repo
         self.items_requests = items_requests
+        self.async_items_requests = AsyncItemsRequests(items_requests)
         self.validator = OperationValidator(self.log, self.repo)
         self.validators: list[ValidatorsProtocol] = [
             EmptyCredentialColumnsValidator(),
@@ -41,24 +45,29 @@ class StatusChecker:
     
     def execute(self, lines: list[ProdutosStatusDataclass], token: AuthResponse) -> None:
         """
-        Check the status of a product.
+        Check the status of the products. The status requests of every line are in flight at once.
         Args:
-            line (ProdutosStatusDataclass): Produtos_status table line as dataclass.
+            lines (list[ProdutosStatusDataclass]): Produtos_status table lines as dataclass.
             token (AuthResponse): Meli token.
         """
-        for line in lines:
+        valid_lines: list[ProdutosStatusDataclass] = [
+            line for line in lines if self.validator.validate(line, self.validators)
+        ]
+        if not valid_lines:
+            return
+        
+        responses: list[MeliResponse | BaseException] = asyncio.run(self._get_responses(valid_lines, token))
+        
+        for line, response in zip(valid_lines, responses):
             try:
                 
-                if not self.validator.validate(line, self.validators):
-                    return
+                if isinstance(response, BaseException):
+                    raise response
                 
                 product_name: str = f"Produto [DB-ID: {line.id} | MELI-ID: {line.mercado_livre_id}]"
                 
-                self.repo.update.executing(line.id)
-                
                 status: str = self._get_status(
-                    line=line, 
-                    token=token, 
+                    status_response=response, 
                     product_name=product_name
                 )
                 
@@ -82,23 +91,41 @@ class StatusChecker:
                     log_erro=f"Falha inesperada: {e}"
                 )
     
-    def _get_status(self, line: ProdutosStatusDataclass, token: AuthResponse, product_name: str) -> str:
+    async def _get_responses(
+        self, 
+        lines: list[ProdutosStatusDataclass], 
+        token: AuthResponse
+    ) -> list[MeliResponse | BaseException]:
         """
-        Gets the product status
+        Requests the data of every product concurrently.
         Args:
-            line (ProdutosStatusDataclass): Produtos_status table line as dataclass.
+            lines (list[ProdutosStatusDataclass]): Validated lines.
             token (AuthResponse): Meli token.
+        Returns:
+            list[MeliResponse | BaseException]: One response (or raised exception) for each line, in the same order.
+        """
+        return await asyncio.gather(
+            *(
+                self.async_items_requests.get_item_info(
+                    access_token=token.access_token, 
+                    item_id=line.mercado_livre_id
+                ) 
+                for line in lines
+            ),
+            return_exceptions=True
+        )
+    
+    def _get_status(self, status_response: MeliResponse, product_name: str) -> str:
+        """
+        Gets the product status
+        Args:
+            status_response (MeliResponse): Response of the item data request.
             product_name (str): Identifier for current product.
         Returns:
             str: Product status.
         Raises:
             MeliRequestFail: Meli request fail.
         """
-        status_response: MeliResponse = self.items_requests.get_item_info(
-            access_token=token.access_token, 
-            item_id=line.mercado_livre_id
-        )
-        
         if not status_response.success:
             raise MeliRequestFail(status_response.error)
         
@@ -1,7 +1,11 @@
 """ Status operations. """
 
+from typing import Optional
+
 from src.core import log
+from src.config import AppConfigManager
 from src.app.shared.oganizer import GroupBy
+from src.app.shared.seller_scheduler import SellerScheduler
 from src.app.models import ApplicationProtocol
 from src.app.shared.operations import InvalidOperation, TableOperationProtocol, TableOperationFactoryProtocol
 from src.app.shared.token_manager import MeliTokenManager
@@ -35,6 +39,13 @@ class StatusOperationFactory(TableOperationFactoryProtocol):
 class StatusApplication(ApplicationProtocol):
     def __init__(self) -> None:
         self.log = log
+        config = AppConfigManager()
+        scheduler_config = config.load_scheduler_config()
+        self.worker_config = config.load_worker_config()
+        self.seller_scheduler = SellerScheduler(
+            max_workers=scheduler_config.seller_workers,
+            chunk_size=scheduler_config.seller_chunk_size
+        )
         self.repo = ProdutosStatusRepository()
         self.meli_auth = MeliAuthCredentials()
         self.items_requests = ItemsRequests()
@@ -48,8 +59,15 @@ class StatusApplication(ApplicationProtocol):
             items_requests=self.items_requests
         )
     
+    def backlog(self) -> int:
+        """ Pending lines of the table. """
+        return self.repo.get.count_pending()
+    
     def execute(self) -> None:
-        pending_lines: list[ProdutosStatusDataclass] = self.repo.get.pending_operations()
+        pending_lines: list[ProdutosStatusDataclass] = self.repo.get.claim_pending_operations(
+            worker_id=self.worker_config.worker_id,
+            limit=self.worker_config.claim_limit
+        )
         
         if not pending_lines:
             # print("Nenhuma linha pendente no momento")
@@ -57,11 +75,36 @@ class StatusApplication(ApplicationProtocol):
         
         user_lines: dict[str, list[ProdutosStatusDataclass]] = GroupBy.column(pending_lines, "credentials.client_id")
         
-        for user, lines in user_lines.items():
-            if token := self.token_manager.get_token(lines):
-                self._execute_operations(lines, token.data)
-            else:
+        tokens: dict[str, Optional[AuthResponse]] = {}
+        try:
+            with self.repo.update.batch(): # Line results are written grouped at the end of the batch.
+                self.seller_scheduler.run(
+                    user_lines,
+                    lambda user, lines: self._execute_seller(user, lines, tokens)
+                )
+        finally:
+            # Lines left in EXECUTING: the ones never started go back to the queue, the others to PROGRAM_ERROR.
+            self.repo.update.release_claims(
+                [line.id for line in pending_lines],
+                retry_delay=self.worker_config.retry_delay
+            )
+    
+    def _execute_seller(self, user: str, lines: list[ProdutosStatusDataclass], tokens: dict[str, Optional[AuthResponse]]) -> None:
+        """
+        Processes a chunk of a seller lines. The token is requested once, on the seller first chunk.
+        Args:
+            user (str): Seller client_id.
+            lines (list[ProdutosStatusDataclass]): Chunk of the seller lines.
+            tokens (dict[str, Optional[AuthResponse]]): Tokens already requested on this execution.
+        """
+        if user not in tokens:
+            token = self.token_manager.get_token(lines)
+            tokens[user] = token.data if token else None
+            if not token:
                 print(f"Falha ao obter token para usuário {user}")
+        
+        if tokens[user]:
+            self._execute_operations(lines, tokens[user])
     
     def _execute_operations(self, user_lines: list[ProdutosStatusDataclass], token: AuthResponse) -> None:
         oper_lines = GroupBy.column(user_lines, "controllers.operacao")
@@ -1,9 +1,38 @@
 """ Advanced category requests. """
 
 from .finders import IDFinderByPath
+from .attributes import (
+    RequiredAttribute,
+    RequiredAttributes,
+    RequiredAttributesIndex,
+    RequiredAttributesResponse,
+    shared_required_attributes
+)
+from .names import NameMatch, NameTrie, normalize_name, normalize_title
+from .classifier import TitleClassifier, TitleClassifierIndex, TitlePrediction, shared_title_classifier
+from .predictions import TitleCategoryPredictor
+from .tree import CategoryTree, CategoryTreeIndex, PathResolution, shared_category_tree
 
 __version__ = "v.0.0.0"
 __all__ = [
     "__version__",
-    "IDFinderByPath"
+    "IDFinderByPath",
+    "RequiredAttribute",
+    "RequiredAttributes",
+    "RequiredAttributesIndex",
+    "RequiredAttributesResponse",
+    "shared_required_attributes",
+    "NameMatch",
+    "NameTrie",
+    "normalize_name",
+    "PathResolution",
+    "normalize_title",
+    "TitleClassifier",
+    "TitleClassifierIndex",
+    "TitlePrediction",
+    "shared_title_classifier",
+    "TitleCategoryPredictor",
+    "CategoryTree",
+    "CategoryTreeIndex",
+    "shared_category_tree"
 ]
@@ -0,0 +1,178 @@
+""" Index of the required attributes of each category. """
+
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from src.config import AppConfigManager
+from src.infra.api.mercadolivre.category import CategoryRequests
+from src.infra.api.mercadolivre.models import MeliResponse
+
+
+@dataclass(frozen=True)
+class RequiredAttribute:
+    id: str
+    name: Optional[str] = None
+    hint: Optional[str] = None
+    tooltip: Optional[str] = None
+    
+    def message(self) -> str:
+        """
+        A friendly message for the user.
+        Example:
+            "GTIN (Código universal de produto) | Pode ser um EAN, UPC ou outro GTIN"
+        """
+        message: str = f"{self.id} ({self.name})"
+        if self.hint:
+            message += f" | {self.hint}"
+        elif self.tooltip:
+            message += f" | {self.tooltip}"
+        return message
+
+
+@dataclass(frozen=True)
+class RequiredAttributes:
+    category_id: str
+    attributes: tuple[RequiredAttribute, ...] = ()
+    ids: frozenset[str] = frozenset()
+    
+    @classmethod
+    def from_category_attributes(cls, category_id: str, category_attributes: list[dict[str, Any]]) -> "RequiredAttributes":
+        """
+        Args:
+            category_id (str): Category ID.
+            category_attributes (list[dict[str, Any]]): /categories/{id}/attributes response.
+        """
+        attributes: tuple[RequiredAttribute, ...] = tuple(
+            RequiredAttribute(
+                id=attribute.get("id"),
+                name=attribute.get("name"),
+                hint=attribute.get("hint"),
+                tooltip=attribute.get("tooltip")
+            )
+            for attribute in category_attributes
+            if (attribute.get("tags") or {}).get("required")
+        )
+        return cls(category_id=category_id, attributes=attributes, ids=frozenset(attribute.id for attribute in attributes))
+    
+    def missing(self, attribute_ids: Iterable[str]) -> list[RequiredAttribute]:
+        """ Required attributes that aren't in `attribute_ids`, in the category order. """
+        missing_ids: frozenset[str] = self.ids.difference(attribute_ids)
+        if not missing_ids:
+            return []
+        return [attribute for attribute in self.attributes if attribute.id in missing_ids]
+
+
+@dataclass
+class RequiredAttributesResponse:
+    success: bool = False
+    result: Optional[RequiredAttributes] = None
+    error: Optional[str] = None
+
+
+class RequiredAttributesIndex:
+    """
+    Required attributes by category ID, kept in memory for the attributes TTL of the reference cache.
+    
+    The attributes are read through `CategoryRequests` (so through the persistent reference cache) only once
+    per category: validating a product is then a set difference without any request.
+    """
+    def __init__(
+        self,
+        ttl: int,
+        max_entries: int = 4096,
+        max_workers: int = 4,
+        category_requests: Optional[CategoryRequests] = None
+    ) -> None:
+        """
+        Args:
+            ttl (int): Seconds an index entry is used.
+            max_entries (int): Max categories kept in memory.
+            max_workers (int): Max parallel requests of `get_many`.
+            category_requests (CategoryRequests, optional): Category requests.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_workers = max_workers
+        self.category_requests = category_requests or CategoryRequests()
+        self._entries: OrderedDict[str, tuple[float, RequiredAttributes]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, category_id: str, access_token: str) -> RequiredAttributesResponse:
+        """
+        Required attributes of a category.
+        Args:
+            category_id (str): Category ID. Ex.: "MLB47113".
+            access_token (str): Token used when the category isn't indexed yet.
+        """
+        if cached := self._cached(category_id):
+            return RequiredAttributesResponse(success=True, result=cached)
+        
+        response: MeliResponse = self.category_requests.get_category_attributes(category_id, access_token)
+        if not response.success:
+            return RequiredAttributesResponse(error=response.error)
+        if not isinstance(response.data, list):
+            return RequiredAttributesResponse(error=f"Resposta inesperada dos atributos da categoria {category_id}.")
+        
+        required = RequiredAttributes.from_category_attributes(category_id, response.data)
+        self._store(required)
+        return RequiredAttributesResponse(success=True, result=required)
+    
+    def get_many(self, category_ids: Iterable[str], access_token: str) -> dict[str, RequiredAttributesResponse]:
+        """
+        Required attributes of a batch of categories. The categories that aren't indexed are requested in parallel.
+        Args:
+            category_ids (Iterable[str]): Category IDs (repeated IDs are requested once).
+            access_token (str): Token used when the categories aren't indexed yet.
+        Returns:
+            dict[str, RequiredAttributesResponse]: Responses by category ID.
+        """
+        responses: dict[str, RequiredAttributesResponse] = {}
+        pending: list[str] = []
+        for category_id in dict.fromkeys(category_ids):
+            if cached := self._cached(category_id):
+                responses[category_id] = RequiredAttributesResponse(success=True, result=cached)
+            else:
+                pending.append(category_id)
+        
+        if len(pending) == 1:
+            responses[pending[0]] = self.get(pending[0], access_token)
+        elif pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending)), thread_name_prefix="attributes") as executor:
+                for category_id, response in zip(pending, executor.map(lambda category_id: self.get(category_id, access_token), pending)):
+                    responses[category_id] = response
+        return responses
+    
+    def _cached(self, category_id: str) -> Optional[RequiredAttributes]:
+        with self._lock:
+            entry = self._entries.get(category_id)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._entries[category_id]
+                return None
+            self._entries.move_to_end(category_id)
+            return entry[1]
+    
+    def _store(self, required: RequiredAttributes) -> None:
+        with self._lock:
+            self._entries[required.category_id] = (time.monotonic(), required)
+            self._entries.move_to_end(required.category_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_shared_index: Optional[RequiredAttributesIndex] = None
+_shared_index_lock = threading.Lock()
+
+def shared_required_attributes() -> RequiredAttributesIndex:
+    """ Process-wide required attributes index. """
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            config = AppConfigManager().load_reference_cache_config()
+            _shared_index = RequiredAttributesIndex(ttl=config.ttl_attributes)
+        return _shared_index
@@ -0,0 +1,267 @@
+""" Local title -> category classifier, trained on the past category results. """
+
+import re
+import math
+import time
+import zlib
+import heapq
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from src.core import log
+from src.config import AppConfigManager, TitleClassifierConfig
+from src.infra.db.repo import ProdutosCategroyRepository, ProdutosRepository
+from .names import normalize_title
+
+CATEGORY_ID_PATTERN = re.compile(r"^[A-Z]{3}\d+$")
+
+
+@dataclass(frozen=True)
+class TitlePrediction:
+    category_id: str
+    score: float # Cosine similarity between the title and the category (0 to 1).
+
+
+class TitleClassifier:
+    """
+    TF-IDF nearest centroid classifier of product titles.
+    
+    - Features: words, word bigrams and character trigrams of each word (so plurals, abbreviations and
+      small typos still share most of the features). Titles are normalized with `normalize_title`.
+    - Each category is the normalized sum of the TF-IDF vectors of its titles, keeping its MAX_FEATURES
+      heaviest features. An inverted index (feature -> categories) makes a prediction proportional to the
+      features of the title, not to the number of categories.
+    """
+    MAX_FEATURES: int = 300
+    
+    def __init__(self, idf: dict[str, float], index: dict[str, list[tuple[str, float]]], samples: int) -> None:
+        """
+        Args:
+            idf (dict[str, float]): Inverse document frequency of each known feature.
+            index (dict[str, list[tuple[str, float]]]): Feature -> (category ID, centroid weight).
+            samples (int): Titles used in the training.
+        """
+        self.idf = idf
+        self.index = index
+        self.samples = samples
+        self.created_at: float = time.time()
+    
+    @staticmethod
+    def features(title: str) -> Counter:
+        words: list[str] = normalize_title(title).split()
+        features: Counter = Counter(words)
+        features.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+        for word in words:
+            padded: str = f"#{word}#"
+            features.update(f"~{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return features
+    
+    @classmethod
+    def train(cls, samples: Iterable[tuple[str, str]]) -> "TitleClassifier":
+        """
+        Args:
+            samples (Iterable[tuple[str, str]]): (title, category ID) pairs.
+        """
+        documents: list[tuple[Counter, str]] = [
+            (features, category_id)
+            for title, category_id in samples
+            if (features := cls.features(title))
+        ]
+        frequency: Counter = Counter()
+        for features, _ in documents:
+            frequency.update(features.keys())
+        idf: dict[str, float] = {
+            feature: math.log((1 + len(documents)) / (1 + count)) + 1.0 for feature, count in frequency.items()
+        }
+        
+        centroids: dict[str, Counter] = defaultdict(Counter)
+        for features, category_id in documents:
+            vector: dict[str, float] = cls._normalize({
+                feature: (1.0 + math.log(count)) * idf[feature] for feature, count in features.items()
+            })
+            centroids[category_id].update(vector)
+        
+        index: dict[str, list[tuple[str, float]]] = defaultdict(list)
+        for category_id, centroid in centroids.items():
+            for feature, weight in cls._normalize(dict(centroid.most_common(cls.MAX_FEATURES))).items():
+                index[feature].append((category_id, weight))
+        return cls(idf=idf, index=dict(index), samples=len(documents))
+    
+    def predict(self, title: str, limit: int = 8) -> list[TitlePrediction]:
+        """
+        Most similar categories of a title, best first.
+        Args:
+            title (str): Product title.
+            limit (int): Max predictions.
+        """
+        vector: dict[str, float] = self._normalize({
+            feature: (1.0 + math.log(count)) * self.idf[feature]
+            for feature, count in self.features(title).items()
+            if feature in self.idf
+        })
+        scores: dict[str, float] = defaultdict(float)
+        for feature, weight in vector.items():
+            for category_id, centroid_weight in self.index.get(feature, ()):
+                scores[category_id] += weight * centroid_weight
+        best: list[tuple[str, float]] = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [TitlePrediction(category_id=category_id, score=round(score, 4)) for category_id, score in best]
+    
+    def age(self) -> float:
+        return time.time() - self.created_at
+    
+    @staticmethod
+    def _normalize(vector: dict[str, float]) -> dict[str, float]:
+        norm: float = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {feature: weight / norm for feature, weight in vector.items()} if norm else {}
+
+
+class TitleClassifierIndex:
+    """
+    Keeps the title classifier of the process, trained in background from the successful results of
+    operacao_categoria_ml and the published products, and trained again every `retrain_interval` seconds.
+    Meanwhile the callers get the previous classifier (or None, and use domain discovery).
+    
+    The titles of one normalized title in every HOLDOUT_EVERY are kept out of the training. A new classifier is
+    only used when its confident predictions hit the category of at least `min_accuracy` percent of them.
+    """
+    MIN_MARGIN: float = 0.05 # Min score difference between the two best categories of a confident prediction.
+    HOLDOUT_EVERY: int = 10
+    MIN_HOLDOUT_ANSWERS: int = 30 # Confident predictions on the holdout titles needed to measure the hit rate.
+    
+    def __init__(
+        self,
+        config: TitleClassifierConfig,
+        category_repo: Optional[ProdutosCategroyRepository] = None,
+        produtos_repo: Optional[ProdutosRepository] = None
+    ) -> None:
+        """
+        Args:
+            config (TitleClassifierConfig): Classifier settings.
+            category_repo (ProdutosCategroyRepository, optional): operacao_categoria_ml repository.
+            produtos_repo (ProdutosRepository, optional): produtos repository.
+        """
+        self.config = config
+        self.min_score: float = config.min_confidence / 100
+        self.category_repo = category_repo or ProdutosCategroyRepository()
+        self.produtos_repo = produtos_repo or ProdutosRepository()
+        self._classifier: Optional[TitleClassifier] = None
+        self._training: bool = False
+        self._retry_at: float = 0.0
+        self._lock = threading.Lock()
+    
+    def predict(self, title: str, limit: int = 8) -> list[TitlePrediction]:
+        """
+        Confident local predictions of a title.
+        Args:
+            title (str): Product title.
+            limit (int): Max predictions.
+        Returns:
+            list[TitlePrediction]: The predictions above `min_confidence`, best first. Empty when there's no
+                classifier yet or the best category isn't clearly ahead of the second.
+        """
+        classifier: Optional[TitleClassifier] = self.classifier()
+        if classifier is None:
+            return []
+        return self._confident(classifier.predict(title, limit=max(limit, 2)))[:limit]
+    
+    def evaluate(self, classifier: TitleClassifier, samples: Iterable[tuple[str, str]]) -> tuple[int, int]:
+        """
+        Args:
+            classifier (TitleClassifier): Classifier to be measured.
+            samples (Iterable[tuple[str, str]]): (title, category ID) pairs left out of its training.
+        Returns:
+            tuple[int, int]: Confident predictions and how many of them hit the category.
+        """
+        answers, hits = 0, 0
+        for title, category_id in samples:
+            predictions: list[TitlePrediction] = self._confident(classifier.predict(title, limit=2))
+            if predictions:
+                answers += 1
+                hits += predictions[0].category_id == category_id
+        return answers, hits
+    
+    def classifier(self) -> Optional[TitleClassifier]:
+        """ Returns the current classifier, scheduling a training when it's missing or old. """
+        if not self.config.enabled:
+            return None
+        with self._lock:
+            classifier: Optional[TitleClassifier] = self._classifier
+            expired: bool = classifier is None or classifier.age() > self.config.retrain_interval
+            if expired and not self._training and time.time() >= self._retry_at:
+                self._training = True
+                threading.Thread(target=self._train, name="title-classifier", daemon=True).start()
+        return classifier
+    
+    def samples(self) -> list[tuple[str, str]]:
+        """ (title, category ID) pairs of the past results. """
+        samples: list[tuple[str, str]] = list(self.category_repo.get.title_samples(self.config.max_samples))
+        for titulo, categoria, categoria_id in self.produtos_repo.get.title_samples(self.config.max_samples):
+            category_id: Optional[str] = categoria if categoria and CATEGORY_ID_PATTERN.match(categoria) else categoria_id
+            if category_id:
+                samples.append((titulo, category_id))
+        return samples
+    
+    def _confident(self, predictions: list[TitlePrediction]) -> list[TitlePrediction]:
+        if not predictions or predictions[0].score < self.min_score:
+            return []
+        if len(predictions) > 1 and predictions[0].score - predictions[1].score < self.MIN_MARGIN:
+            return []
+        return [prediction for prediction in predictions if prediction.score >= self.min_score]
+    
+    def _is_holdout(self, title: str) -> bool:
+        # By normalized title: the same title repeated in the history never lands on both sides.
+        return zlib.crc32(normalize_title(title).encode()) % self.HOLDOUT_EVERY == 0
+    
+    def _train(self) -> None:
+        try:
+            started: float = time.monotonic()
+            training: list[tuple[str, str]] = []
+            holdout: list[tuple[str, str]] = []
+            for sample in self.samples():
+                (holdout if self._is_holdout(sample[0]) else training).append(sample)
+            
+            classifier = TitleClassifier.train(training)
+            if not classifier.samples:
+                return
+            
+            answers, hits = self.evaluate(classifier, holdout)
+            accuracy: float = hits / answers * 100 if answers else 0.0
+            if answers < self.MIN_HOLDOUT_ANSWERS or accuracy < self.config.min_accuracy:
+                with self._lock:
+                    self._classifier = None
+                    self._retry_at = time.time() + self.config.retrain_interval
+                log.dev.warning(
+                    f"Classificador de categorias descartado: {hits} acertos em {answers} previsões confiantes "
+                    f"({accuracy:.1f}%, mínimo {self.config.min_accuracy}% em {self.MIN_HOLDOUT_ANSWERS} previsões). "
+                    f"As categorias seguem vindo do domain discovery."
+                )
+                return
+            
+            with self._lock:
+                self._classifier = classifier
+            log.dev.info(
+                f"Classificador de categorias treinado com {classifier.samples} títulos "
+                f"em {time.monotonic() - started:.1f}s ({accuracy:.1f}% de acertos em {answers} títulos de validação)."
+            )
+        except Exception as e:
+            log.dev.exception(f"Falha no treino do classificador de categorias: {e}")
+        finally:
+            with self._lock:
+                self._training = False
+                expired: bool = self._classifier is None or self._classifier.age() > self.config.retrain_interval
+                if expired and self._retry_at <= time.time():
+                    self._retry_at = time.time() + 300 # Without history (or after a failure) tries again later.
+
+
+_shared_index: Optional[TitleClassifierIndex] = None
+_shared_index_lock = threading.Lock()
+
+def shared_title_classifier() -> TitleClassifierIndex:
+    """ Process-wide title classifier. """
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = TitleClassifierIndex(AppConfigManager().load_title_classifier_config())
+        return _shared_index
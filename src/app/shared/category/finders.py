@@ -1,11 +1,13 @@
 """ Shared categorie finders functionalities. """
 
 import re
-from typing import Protocol, Any
+from typing import Protocol, Any, Optional
 from abc import abstractmethod
 from dataclasses import dataclass
 
 from src.infra.api.mercadolivre.category import CategoryRequests
+from .names import NameTrie
+from .tree import CategoryTree, CategoryTreeIndex, PathResolution, shared_category_tree
 
 @dataclass
 class CategoryFinderResponse:
@@ -20,8 +22,13 @@ class CategoryFinderProtocol(Protocol):
 
 # class CategoryFinderByPath:
 class IDFinderByPath:
-    def __init__(self):
+    def __init__(self, category_tree: Optional[CategoryTreeIndex] = None):
+        """
+        Args:
+            category_tree (CategoryTreeIndex, optional): Local category tree. Default: the process-wide tree.
+        """
         self.category_requests = CategoryRequests()
+        self.category_tree = category_tree or shared_category_tree()
     
     def find(self, category_path: str, access_token: str) -> CategoryFinderResponse: 
         """
@@ -40,6 +47,13 @@ class IDFinderByPath:
         """
         
         category_names: list[str] = [nome.strip() for nome in re.split(r'[;>]', category_path)]
+        
+        tree: Optional[CategoryTree] = self.category_tree.tree(access_token)
+        resolution: Optional[PathResolution] = tree.resolve(category_names) if tree else None
+        if resolution and resolution.category_id:
+            return CategoryFinderResponse(success=True, result=resolution.category_id)
+        
+        # Without local tree (or a category newer than it): level by level through the API.
         categories_response = self.category_requests.get_root_categories(access_token)
         
         if not categories_response.success:
@@ -49,10 +63,11 @@ class IDFinderByPath:
         current_category = None
         
         for level, category_name in enumerate(category_names):
-            current_category = self._find_category_level_name(category_name, categories)
+            level_names: NameTrie[dict[str, str]] = NameTrie((cat.get("name", ""), cat) for cat in categories)
+            current_category = self._find_category_level_name(category_name, level_names)
             
             if not current_category:
-                return CategoryFinderResponse(error=f"Nível '{category_name}' não encontrado.")
+                return CategoryFinderResponse(error=self._not_found_message(category_name, level_names))
             
             if level < len(category_names) - 1:
                 category_data_response = self.category_requests.get_category_data(current_category["id"], access_token)
@@ -68,19 +83,24 @@ class IDFinderByPath:
         
         return CategoryFinderResponse(success=True, result=current_category["id"])
     
-    def _find_category_level_name(self, category_name: str, categories: list[dict[str, str]]) -> dict[str, str] | None:
+    def _find_category_level_name(self, category_name: str, level: NameTrie[dict[str, str]]) -> dict[str, str] | None:
         """
-        Returns a category data if finds it inside the categories list.
+        Returns a category data if finds it inside the categories of a level.
         Args:
             category_name (str): The name of the atual category.
-            categories (list[dict[str, str]]): The list of categories.
+            level (NameTrie[dict[str, str]]): The categories of the level by name.
         Returns:
-            (dict[str, str]): Returns the category data if it has the same name of the `category_name`. None If not.
+            (dict[str, str]): The category data whose name is `category_name` (ignoring accents, case and spacing).
+                None If not, the close names are only suggested in the error.
         """
-        for cat in categories:
-            if cat.get("name", "").strip().lower() == category_name.strip().lower():
-                return cat
-        return None
+        return level.get(category_name)
+    
+    @staticmethod
+    def _not_found_message(category_name: str, level: NameTrie[dict[str, str]]) -> str:
+        suggestions: list[str] = [match.name for match in level.suggest(category_name)]
+        if not suggestions:
+            return f"Nível '{category_name}' não encontrado."
+        return f"Nível '{category_name}' não encontrado. Você quis dizer: {', '.join(repr(name) for name in suggestions)}?"
     
 # class ICategoryFinderBy:
 #     def __init__(self):
@@ -0,0 +1,124 @@
+""" Category name normalization and matching. """
+
+import re
+import difflib
+import unicodedata
+from dataclasses import dataclass
+from typing import Generic, Iterable, Iterator, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Comparison form of a category name: without accents, case insensitive and with single spaces.
+    Ex.: " Acessórios  para VEÍCULOS " -> "acessorios para veiculos".
+    """
+    decomposed: str = unicodedata.normalize("NFKD", name)
+    folded: str = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(folded.casefold().split())
+
+
+def normalize_title(title: str) -> str:
+    """
+    Comparison form of a product title: `normalize_name` without punctuation.
+    Ex.: "Volante  Ducato - Original!" -> "volante ducato original".
+    """
+    return normalize_name(re.sub(r"[^\w\s]", " ", title))
+
+
+@dataclass(frozen=True)
+class NameMatch(Generic[V]):
+    name: str # Original name.
+    value: V
+    score: float # 1.0 for an exact (normalized) match.
+
+
+class _TrieNode:
+    __slots__ = ("children", "match")
+    
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.match: Optional[NameMatch] = None
+
+
+class NameTrie(Generic[V]):
+    """
+    Prefix tree of the normalized names of a category level.
+    
+    - `get` finds a name in O(len(name)), whatever the number of names of the level.
+    - `suggest` ranks the closest names (prefixes like "Peças de Carros e Camin" first, then typos like
+      "Pecas de Caros"), for the error messages. They're never used in place of the searched name: a
+      wrong category would be published.
+    """
+    def __init__(self, names: Iterable[tuple[str, V]] = ()) -> None:
+        """
+        Args:
+            names (Iterable[tuple[str, V]]): Pairs of (name, value). Repeated names keep the first value.
+        """
+        self._root = _TrieNode()
+        self._size: int = 0
+        for name, value in names:
+            self.add(name, value)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def add(self, name: str, value: V) -> None:
+        node: _TrieNode = self._root
+        for char in normalize_name(name):
+            node = node.children.setdefault(char, _TrieNode())
+        if node.match is None:
+            node.match = NameMatch(name=name, value=value, score=1.0)
+            self._size += 1
+    
+    def get(self, name: str) -> Optional[V]:
+        """ Value of an exact (normalized) name. """
+        node: Optional[_TrieNode] = self._node(normalize_name(name))
+        return node.match.value if node and node.match else None
+    
+    def startswith(self, prefix: str) -> list[NameMatch[V]]:
+        """ Names starting with `prefix` (normalized). """
+        node: Optional[_TrieNode] = self._node(normalize_name(prefix))
+        return list(self._matches(node)) if node else []
+    
+    def suggest(self, name: str, limit: int = 3, cutoff: float = 0.6) -> list[NameMatch[V]]:
+        """
+        Closest names, best first. Names starting with `name` are always candidates.
+        Args:
+            name (str): Searched name.
+            limit (int): Max suggestions.
+            cutoff (float): Min similarity (0 to 1) of the other names.
+        """
+        key: str = normalize_name(name)
+        prefix_node: Optional[_TrieNode] = self._node(key) if key else None
+        prefixed: set[int] = {id(match) for match in self._matches(prefix_node)} if prefix_node else set()
+        
+        matcher = difflib.SequenceMatcher(b=key, autojunk=False)
+        scored: list[tuple[bool, NameMatch[V]]] = []
+        for match in self._matches(self._root):
+            is_prefixed: bool = id(match) in prefixed
+            matcher.set_seq1(normalize_name(match.name))
+            if is_prefixed or (matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff):
+                score: float = matcher.ratio()
+                if score >= cutoff or is_prefixed:
+                    scored.append((is_prefixed, NameMatch(name=match.name, value=match.value, score=score)))
+        scored.sort(key=lambda item: (item[0], item[1].score), reverse=True)
+        return [match for _, match in scored[:limit]]
+    
+    def _node(self, key: str) -> Optional[_TrieNode]:
+        node: Optional[_TrieNode] = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+    
+    @staticmethod
+    def _matches(node: _TrieNode) -> Iterator[NameMatch]:
+        stack: list[_TrieNode] = [node]
+        while stack:
+            current: _TrieNode = stack.pop()
+            if current.match:
+                yield current.match
+            stack.extend(current.children.values())
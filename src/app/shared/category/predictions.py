@@ -0,0 +1,93 @@
+""" Category predictions by product title (domain discovery), cached by normalized title. """
+
+from typing import Iterable, Optional
+
+from src.infra.api.mercadolivre.items import ItemsRequests
+from src.infra.api.mercadolivre.models import MeliResponse
+from src.infra.api.mercadolivre.reference_cache import ReferenceCache, shared_reference_cache
+from src.infra.db.repo.models import ResultSource
+from .names import normalize_title
+from .classifier import TitleClassifierIndex, TitlePrediction, shared_title_classifier
+
+
+class TitleCategoryPredictor:
+    """
+    Predicts the categories of product titles with the local `TitleClassifier` and, when it isn't confident,
+    with /sites/{site}/domain_discovery/search.
+    
+    - Titles differing only by accents, case, spacing or punctuation share the same prediction. The normalized
+      title is only the cache key, the first original title of each group is the one sent to the API.
+    - The predictions are kept in the persistent reference cache for `ttl_domain_discovery` seconds.
+    - `predict_many` requests each normalized title of a batch once.
+    """
+    def __init__(
+        self,
+        items_requests: Optional[ItemsRequests] = None,
+        cache: Optional[ReferenceCache] = None,
+        classifier: Optional[TitleClassifierIndex] = None,
+        limit: int = 8,
+        site: str = "MLB"
+    ) -> None:
+        """
+        Args:
+            items_requests (ItemsRequests, optional): Items requests.
+            cache (ReferenceCache, optional): Custom reference cache. Default: the process-wide cache.
+            classifier (TitleClassifierIndex, optional): Local classifier. Default: the process-wide classifier.
+            limit (int): Max predictions by title (1 to 8).
+            site (str): Site ID.
+        """
+        self.items_requests = items_requests or ItemsRequests()
+        self.cache = cache or shared_reference_cache()
+        self.classifier = classifier or shared_title_classifier()
+        self.limit = limit
+        self.site = site
+    
+    def predict(self, title: str, access_token: str) -> MeliResponse:
+        """
+        Categories predicted for a product title.
+        Args:
+            title (str): Product title.
+            access_token (str): Access token used when the title isn't cached.
+        Returns:
+            MeliResponse: data=[{"category_id", "category_name", "attributes"...}]. Local predictions have
+                only "category_id", "score" and "source" (ResultSource.LOCAL).
+        """
+        local: list[TitlePrediction] = self.classifier.predict(title, limit=self.limit)
+        if local:
+            return MeliResponse(
+                success=True,
+                data=[
+                    {"category_id": prediction.category_id, "score": prediction.score, "source": ResultSource.LOCAL}
+                    for prediction in local
+                ],
+                http_status=200
+            )
+        
+        normalized: str = normalize_title(title)
+        return self.cache.fetch(
+            key=f"/sites/{self.site}/domain_discovery/search?limit={self.limit}&q={normalized}",
+            ttl=self.cache.config.ttl_domain_discovery,
+            request=lambda etag: self.items_requests.get_category_by_item_name(
+                access_token=access_token,
+                item_name=title, # The original title: the accents and punctuation help domain discovery.
+                limit=self.limit,
+                site=self.site
+            )
+        )
+    
+    def predict_many(self, titles: Iterable[str], access_token: str) -> dict[str, MeliResponse]:
+        """
+        Categories predicted for a batch of titles, requesting each normalized title once.
+        Args:
+            titles (Iterable[str]): Product titles.
+            access_token (str): Access token used when a title isn't cached.
+        Returns:
+            dict[str, MeliResponse]: Predictions by normalized title (see `normalize_title`), made with the first
+                original title of each one.
+        """
+        predictions: dict[str, MeliResponse] = {}
+        for title in titles:
+            normalized: str = normalize_title(title)
+            if normalized not in predictions:
+                predictions[normalized] = self.predict(title, access_token)
+        return predictions
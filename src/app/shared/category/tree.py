@@ -0,0 +1,421 @@
+""" Local index of the full Mercado Libre category tree. """
+
+import os
+import json
+import mmap
+import time
+import struct
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+from src.core import log
+from src.config import AppConfigManager
+from src.infra.api.mercadolivre.category import CategoryRequests
+from src.infra.api.mercadolivre.models import MeliResponse
+from .names import NameTrie, normalize_name
+
+
+@dataclass
+class PathResolution:
+    category_id: Optional[str] = None
+    names: list[str] = field(default_factory=list) # Names of the resolved levels, as in the tree.
+    missing: Optional[str] = None # First level not found.
+    suggestions: list[str] = field(default_factory=list) # Closest names of the missing level.
+
+
+class CategoryTree:
+    """
+    Category tree stored in a compact binary buffer, usually a read-only mmap of the snapshot file: the
+    workers start without parsing anything and every process shares the same memory pages.
+    
+    File format (little endian):
+        header    MAGIC, VERSION, created_at, counts and the offset of each section.
+        nodes     One record per category, sorted by ID: id, name (string indexes), parent (node index),
+                  children range (edges), settings offset and length.
+        edges     (parent node, normalized name, child node), sorted by parent and name. The children of a
+                  node are contiguous, the roots come last (parent = NO_PARENT).
+        strings   Offsets table + UTF-8 blob. IDs, names and normalized names are interned.
+        settings  Category `settings` (compact JSON), read through zero-copy memoryviews.
+    
+    - `resolve` finds a path ("A > B > C") with a binary search among the siblings on each level. When a
+      level is missing, a `NameTrie` of its siblings gives the closest names.
+    - `path` rebuilds the names from the root of a category ID following the parents.
+    """
+    MAGIC: bytes = b"MLCT"
+    VERSION: int = 2 # Increase when the format or `normalize_name` changes: older files are downloaded again.
+    NO_PARENT: int = 0xFFFFFFFF
+    
+    HEADER = struct.Struct("<4sHHdIIIIIIIIIII")
+    NODE = struct.Struct("<IIIIIII") # id, name, parent, first_edge, children, settings_offset, settings_length
+    EDGE = struct.Struct("<III") # parent, normalized name, child
+    OFFSET = struct.Struct("<I")
+    
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        """
+        Args:
+            buffer (bytes | mmap.mmap): Tree built by `build`.
+        Raises:
+            ValueError: If the buffer isn't a tree of the current VERSION.
+        """
+        if len(buffer) < self.HEADER.size:
+            raise ValueError("Arquivo da árvore de categorias incompleto.")
+        (
+            magic, version, _, self.created_at,
+            self.node_count, self.edge_count, string_count,
+            self._nodes_at, self._edges_at, self._offsets_at, self._strings_at, self._settings_at,
+            self._root_edge, self._root_count, _
+        ) = self.HEADER.unpack_from(buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"Formato da árvore de categorias não suportado: {magic!r} v{version}.")
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+    
+    def __len__(self) -> int:
+        return self.node_count
+    
+    def age(self) -> float:
+        return time.time() - self.created_at
+    
+    def find_id(self, names: list[str]) -> Optional[str]:
+        """
+        Resolves a category path.
+        Args:
+            names (list[str]): Category names from the root. Ex.: ["Acessórios para Veículos", "Peças de Carros e Caminhonetes"].
+        Returns:
+            str: ID of the last category of the path. None if any level isn't found.
+        """
+        return self.resolve(names).category_id
+    
+    def resolve(self, names: list[str]) -> PathResolution:
+        """
+        Resolves a category path. Only accent, case and spacing differences are accepted on each level.
+        Args:
+            names (list[str]): Category names from the root.
+        Returns:
+            PathResolution: The category ID, or the missing level and its closest names.
+        """
+        resolution = PathResolution()
+        node: Optional[int] = None
+        first, count = self._root_edge, self._root_count
+        for name in names:
+            node = self._find_child(first, count, normalize_name(name).encode())
+            if node is None:
+                resolution.missing = name
+                resolution.suggestions = [suggestion.name for suggestion in self._level(first, count).suggest(name)]
+                return resolution
+            
+            _, category_name, _, first, count, _, _ = self._node(node)
+            resolution.names.append(self._string(category_name))
+        
+        if node is not None:
+            resolution.category_id = self._string(self._node(node)[0])
+        return resolution
+    
+    def path(self, category_id: str) -> Optional[list[str]]:
+        """
+        Category names from the root to `category_id`.
+        Returns:
+            list[str]: None if the category isn't in the tree.
+        """
+        node: Optional[int] = self._find_node(category_id)
+        if node is None:
+            return None
+        names: list[str] = []
+        while node != self.NO_PARENT:
+            _, name, node, *_ = self._node(node)
+            names.append(self._string(name))
+        return names[::-1]
+    
+    def settings_view(self, category_id: str) -> Optional[memoryview]:
+        """ Zero-copy view of the category settings (compact JSON). None if the category or its settings are missing. """
+        node: Optional[int] = self._find_node(category_id)
+        if node is None:
+            return None
+        *_, offset, length = self._node(node)
+        if not length:
+            return None
+        start: int = self._settings_at + offset
+        return self._view[start:start + length]
+    
+    def category_data(self, category_id: str) -> Optional[dict[str, Any]]:
+        """
+        Category data in the /categories/{id} format used by the validators (`id`, `name`,
+        `children_categories` and `settings`).
+        Returns:
+            dict[str, Any]: None if the category or its settings aren't in the tree.
+        """
+        node: Optional[int] = self._find_node(category_id)
+        settings: Optional[memoryview] = self.settings_view(category_id)
+        if node is None or settings is None:
+            return None
+        _, name, _, first, count, _, _ = self._node(node)
+        children: list[dict[str, str]] = []
+        for edge in range(first, first + count):
+            _, _, child = self.EDGE.unpack_from(self._buffer, self._edges_at + edge * self.EDGE.size)
+            child_id, child_name, *_ = self._node(child)
+            children.append({"id": self._string(child_id), "name": self._string(child_name)})
+        return {
+            "id": category_id,
+            "name": self._string(name),
+            "children_categories": children,
+            "settings": json.loads(settings.tobytes())
+        }
+    
+    def _node(self, index: int) -> tuple[int, ...]:
+        return self.NODE.unpack_from(self._buffer, self._nodes_at + index * self.NODE.size)
+    
+    def _string_bytes(self, index: int) -> bytes:
+        start, = self.OFFSET.unpack_from(self._buffer, self._offsets_at + index * self.OFFSET.size)
+        end, = self.OFFSET.unpack_from(self._buffer, self._offsets_at + (index + 1) * self.OFFSET.size)
+        return self._buffer[self._strings_at + start:self._strings_at + end]
+    
+    def _string(self, index: int) -> str:
+        return self._string_bytes(index).decode("utf-8")
+    
+    def _level(self, first: int, count: int) -> NameTrie[int]:
+        """ Trie of the children names of a node (by their edges range). """
+        level: NameTrie[int] = NameTrie()
+        for edge in range(first, first + count):
+            _, _, child = self.EDGE.unpack_from(self._buffer, self._edges_at + edge * self.EDGE.size)
+            level.add(self._string(self._node(child)[1]), child)
+        return level
+    
+    def _find_node(self, category_id: str) -> Optional[int]:
+        """ Binary search of a node index by ID. """
+        key: bytes = category_id.encode()
+        low, high = 0, self.node_count
+        while low < high:
+            middle: int = (low + high) // 2
+            value: bytes = self._string_bytes(self._node(middle)[0])
+            if value < key:
+                low = middle + 1
+            elif value > key:
+                high = middle
+            else:
+                return middle
+        return None
+    
+    def _find_child(self, first: int, count: int, key: bytes) -> Optional[int]:
+        """ Binary search of a child by normalized name, inside the children range of a node. """
+        low, high = first, first + count
+        while low < high:
+            middle: int = (low + high) // 2
+            _, name, child = self.EDGE.unpack_from(self._buffer, self._edges_at + middle * self.EDGE.size)
+            value: bytes = self._string_bytes(name)
+            if value < key:
+                low = middle + 1
+            elif value > key:
+                high = middle
+            else:
+                return child
+        return None
+    
+    @classmethod
+    def build(cls, dump: dict[str, dict[str, Any]], created_at: Optional[float] = None) -> bytes:
+        """
+        Builds the binary tree from the /sites/{site_id}/categories/all response.
+        Args:
+            dump (dict[str, dict[str, Any]]): Categories by ID, each one with its `path_from_root` and `settings`.
+            created_at (float, optional): Snapshot time (time.time() reference). Default: now.
+        """
+        strings: dict[bytes, int] = {}
+        
+        def intern(value: str) -> int:
+            return strings.setdefault(value.encode("utf-8"), len(strings))
+        
+        ids: list[str] = sorted(dump, key=lambda category_id: category_id.encode())
+        indexes: dict[str, int] = {category_id: index for index, category_id in enumerate(ids)}
+        
+        parents: list[int] = []
+        for category_id in ids:
+            path: list[dict[str, str]] = dump[category_id].get("path_from_root") or []
+            parent_id: Optional[str] = path[-2].get("id") if len(path) > 1 else None
+            parents.append(indexes.get(parent_id, cls.NO_PARENT))
+        
+        edges: dict[tuple[int, bytes], int] = {} # Repeated sibling names keep the first category.
+        for index, category_id in enumerate(ids):
+            key: bytes = normalize_name(dump[category_id].get("name") or "").encode("utf-8")
+            edges.setdefault((parents[index], key), index)
+        sorted_edges: list[tuple[tuple[int, bytes], int]] = sorted(edges.items())
+        
+        first_edge: dict[int, int] = {}
+        children: dict[int, int] = {}
+        for position, ((parent, _), _) in enumerate(sorted_edges):
+            first_edge.setdefault(parent, position)
+            children[parent] = children.get(parent, 0) + 1
+        
+        settings_blob = bytearray()
+        nodes = bytearray()
+        for index, category_id in enumerate(ids):
+            category: dict[str, Any] = dump[category_id]
+            settings: bytes = (
+                json.dumps(category["settings"], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                if category.get("settings") else b""
+            )
+            nodes += cls.NODE.pack(
+                intern(category_id),
+                intern(category.get("name") or ""),
+                parents[index],
+                first_edge.get(index, 0),
+                children.get(index, 0),
+                len(settings_blob),
+                len(settings)
+            )
+            settings_blob += settings
+        
+        edges_blob = bytearray()
+        for (parent, key), child in sorted_edges:
+            edges_blob += cls.EDGE.pack(parent, strings.setdefault(key, len(strings)), child)
+        
+        offsets = bytearray()
+        strings_blob = bytearray()
+        for value in strings: # Dicts keep the insertion order, the same of the indexes.
+            offsets += cls.OFFSET.pack(len(strings_blob))
+            strings_blob += value
+        offsets += cls.OFFSET.pack(len(strings_blob))
+        
+        nodes_at: int = cls.HEADER.size
+        edges_at: int = nodes_at + len(nodes)
+        offsets_at: int = edges_at + len(edges_blob)
+        strings_at: int = offsets_at + len(offsets)
+        settings_at: int = strings_at + len(strings_blob)
+        header: bytes = cls.HEADER.pack(
+            cls.MAGIC, cls.VERSION, 0, created_at or time.time(),
+            len(ids), len(sorted_edges), len(strings),
+            nodes_at, edges_at, offsets_at, strings_at, settings_at,
+            first_edge.get(cls.NO_PARENT, 0), children.get(cls.NO_PARENT, 0), 0
+        )
+        return b"".join((header, nodes, edges_blob, offsets, strings_blob, settings_blob))
+    
+    @classmethod
+    def from_dump(cls, dump: dict[str, dict[str, Any]]) -> "CategoryTree":
+        """ In memory tree (without snapshot file). """
+        return cls(cls.build(dump))
+    
+    @classmethod
+    def open(cls, path: str) -> "CategoryTree":
+        """ Maps a snapshot file (read only). """
+        with open(path, "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    
+    @staticmethod
+    def write(data: bytes, path: str) -> None:
+        """ Writes a snapshot atomically, so other processes never map a partial file. """
+        temp_path: str = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+
+class CategoryTreeIndex:
+    """
+    Keeps the category tree of the process.
+    
+    - The tree is mapped from the local snapshot file (shared by every bot process) on the first use.
+    - A missing or expired snapshot is downloaded again in background, with the token of the caller.
+      Meanwhile the callers get the previous tree (or None, and use the API).
+    """
+    def __init__(
+        self,
+        path: str,
+        ttl: int,
+        site_id: str = "MLB",
+        category_requests: Optional[CategoryRequests] = None
+    ) -> None:
+        """
+        Args:
+            path (str): Snapshot file. Empty disables the tree.
+            ttl (int): Snapshot max age (seconds).
+            site_id (str): Site ID.
+            category_requests (CategoryRequests, optional): Category requests.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.site_id = site_id
+        self.category_requests = category_requests or CategoryRequests()
+        self._tree: Optional[CategoryTree] = None
+        self._loaded: bool = False
+        self._refreshing: bool = False
+        self._retry_at: float = 0.0
+        self._lock = threading.Lock()
+    
+    def tree(self, access_token: Optional[str] = None) -> Optional[CategoryTree]:
+        """
+        Returns the current tree, scheduling its refresh when it's missing or expired.
+        Args:
+            access_token (str, optional): Token used by a background download.
+        Returns:
+            CategoryTree: None while there's no tree.
+        """
+        if not self.path:
+            return None
+        
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                self._tree = self._read_snapshot()
+            
+            tree: Optional[CategoryTree] = self._tree
+            expired: bool = tree is None or tree.age() > self.ttl
+            if expired and access_token and not self._refreshing and time.time() >= self._retry_at:
+                self._refreshing = True
+                threading.Thread(target=self._refresh, args=(access_token,), name="category-tree", daemon=True).start()
+        return tree
+    
+    def _read_snapshot(self) -> Optional[CategoryTree]:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            tree = CategoryTree.open(self.path)
+            log.dev.info(f"Árvore de categorias carregada de {self.path}: {len(tree)} categorias.")
+            return tree
+        except (OSError, ValueError, struct.error) as e:
+            log.dev.warning(f"Falha na leitura da árvore de categorias {self.path}: {e}")
+            return None
+    
+    def _refresh(self, access_token: str) -> None:
+        try:
+            tree: Optional[CategoryTree] = self._read_snapshot() # Another process may have refreshed it.
+            if tree is None or tree.age() > self.ttl:
+                tree = self._download(access_token)
+            if tree is not None:
+                with self._lock:
+                    self._tree = tree
+        except Exception as e:
+            log.dev.exception(f"Exceção inesperada na atualização da árvore de categorias: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+                if self._tree is None or self._tree.age() > self.ttl:
+                    self._retry_at = time.time() + 300 # Avoids downloading it on every tick after a failure.
+    
+    def _download(self, access_token: str) -> Optional[CategoryTree]:
+        log.dev.info(f"Baixando a árvore de categorias {self.site_id}...")
+        response: MeliResponse = self.category_requests.get_categories_dump(access_token, self.site_id)
+        if not response.success or not isinstance(response.data, dict):
+            log.dev.warning(f"Falha ao baixar a árvore de categorias {self.site_id}: {response.error}")
+            return None
+        
+        data: bytes = CategoryTree.build(response.data)
+        try:
+            CategoryTree.write(data, self.path)
+            tree = CategoryTree.open(self.path)
+        except OSError as e: # Ex.: on Windows a mapped file can't be replaced.
+            log.dev.warning(f"Falha ao salvar a árvore de categorias em {self.path}: {e}")
+            tree = CategoryTree(data)
+        log.dev.info(f"Árvore de categorias {self.site_id} atualizada: {len(tree)} categorias.")
+        return tree
+
+
+_shared_index: Optional[CategoryTreeIndex] = None
+_shared_index_lock = threading.Lock()
+
+def shared_category_tree() -> CategoryTreeIndex:
+    """ Process-wide category tree, shared by every finder. """
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            config = AppConfigManager().load_reference_cache_config()
+            _shared_index = CategoryTreeIndex(path=config.category_tree_path, ttl=config.ttl_category_tree)
+        return _shared_index
@@ -0,0 +1,156 @@
+""" Fair scheduler that interleaves the work of several sellers (Mercado Livre users). """
+
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
+
+from src.core import log
+
+
+class SellerLeases:
+    """
+    Chunks of each seller, shared by the schedulers of a same table (Ex.: the urgent and normal lanes of the
+    produtos table).
+    
+    - The normal chunks of a seller respect `per_seller_limit` on every scheduler together.
+    - Priority chunks have their own seller slots: they never wait behind a normal chunk of the seller, and
+      while a seller has priority chunks waiting or running none of its normal chunks start.
+    """
+    def __init__(self) -> None:
+        self.running: Counter = Counter() # Normal chunks running by seller.
+        self.priority: Counter = Counter() # Priority chunks waiting or running by seller.
+        self.condition = threading.Condition() # Notified whenever a chunk of any of the schedulers finishes.
+
+
+class SellerScheduler:
+    """
+    Splits the lines of each seller into chunks and runs them round-robin on a thread pool.
+    
+    - Sellers take turns: a seller with thousands of pending lines only gets its next chunk after every
+      other seller had its turn, so the small sellers are never starved.
+    - Each seller runs at most `per_seller_limit` chunks at a time (1 by default), which keeps its calls
+      sequential and inside its own API quota, while different sellers run in parallel. Schedulers sharing
+      the same `SellerLeases` respect this limit together: a seller busy on one of them waits on the others.
+    - A `priority` scheduler pre-empts the others at the chunk boundaries: its chunks don't wait for the
+      seller normal chunk, and the seller next normal chunks wait for them (see `SellerLeases`).
+    """
+    def __init__(
+        self,
+        max_workers: int = 4,
+        chunk_size: int = 20,
+        per_seller_limit: int = 1,
+        leases: Optional[SellerLeases] = None,
+        priority: bool = False
+    ) -> None:
+        """
+        Args:
+            max_workers (int): Pool size (max sellers processed at the same time).
+            chunk_size (int): Max lines processed on each seller turn.
+            per_seller_limit (int): Max simultaneous chunks of a same seller.
+            leases (SellerLeases, optional): Running chunks shared with other schedulers. Default: only this one.
+            priority (bool): Whether the chunks go ahead of the normal chunks of the schedulers sharing the leases.
+        """
+        self.max_workers = max(max_workers, 1)
+        self.chunk_size = max(chunk_size, 1)
+        self.per_seller_limit = max(per_seller_limit, 1)
+        self.leases = leases or SellerLeases()
+        self.priority = priority
+    
+    def run(self, work: dict[Hashable, list[Any]], process: Callable[[Hashable, list[Any]], None]) -> None:
+        """
+        Processes every chunk and waits for all of them to finish.
+        Args:
+            work (dict[Hashable, list[Any]]): Lines grouped by seller. Ex.: GroupBy.column(lines, "credentials.client_id").
+            process (Callable): Called as `process(seller, chunk)`. Exceptions are logged and don't stop the other chunks.
+        """
+        queues: dict[Hashable, deque] = {
+            seller: deque(self._chunks(lines)) for seller, lines in work.items() if lines
+        }
+        if not queues:
+            return
+        
+        turns: deque = deque(queues) # Sellers waiting for their next turn, in round-robin order.
+        running: dict[Hashable, int] = {seller: 0 for seller in queues} # Chunks of this run.
+        condition: threading.Condition = self.leases.condition
+        # Normal chunks are leased when they start, priority chunks as soon as they're queued (which holds
+        # back the seller normal chunks).
+        leased: Counter = self.leases.priority if self.priority else self.leases.running
+        if self.priority:
+            with condition:
+                for seller, chunks in queues.items():
+                    leased[seller] += len(chunks)
+        
+        def done(seller: Hashable) -> None:
+            with condition:
+                running[seller] -= 1
+                leased[seller] -= 1
+                if not leased[seller]:
+                    del leased[seller]
+                condition.notify_all()
+        
+        max_workers: int = min(self.max_workers, len(queues) * self.per_seller_limit)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="seller") as executor:
+            with condition:
+                while turns or any(running.values()):
+                    seller = self._next_turn(turns, running) if sum(running.values()) < max_workers else None
+                    if seller is None:
+                        condition.wait()
+                        continue
+                    
+                    chunk: list[Any] = queues[seller].popleft()
+                    running[seller] += 1
+                    if not self.priority:
+                        leased[seller] += 1
+                    if queues[seller]:
+                        turns.append(seller)
+                    executor.submit(self._run, seller, chunk, process, done)
+    
+    def _next_turn(self, turns: deque, running: dict[Hashable, int]) -> Optional[Hashable]:
+        """ Takes the first seller in the turns queue that can start a chunk (see `_available`). """
+        for index, seller in enumerate(turns):
+            if self._available(seller, running):
+                del turns[index]
+                return seller
+        return None
+    
+    def _available(self, seller: Hashable, running: dict[Hashable, int]) -> bool:
+        """
+        Whether a chunk of the seller can start now.
+        Args:
+            seller (Hashable): Seller identifier.
+            running (dict[Hashable, int]): Chunks of this run by seller.
+        """
+        if self.priority:
+            return running[seller] < self.per_seller_limit # Own slots: never waits for a normal chunk.
+        return self.leases.running[seller] < self.per_seller_limit and not self.leases.priority[seller]
+    
+    def _run(
+        self,
+        seller: Hashable,
+        chunk: list[Any],
+        process: Callable[[Hashable, list[Any]], None],
+        done: Callable[[Hashable], None]
+    ) -> None:
+        """ Executes a chunk isolating its failures. """
+        try:
+            process(seller, chunk)
+        except Exception as e:
+            log.dev.exception(f"[{seller}] Exceção inesperada durante o processamento do vendedor: {e}")
+        finally:
+            done(seller)
+    
+    def _chunks(self, lines: list[Any]) -> list[list[Any]]:
+        return [lines[i:i + self.chunk_size] for i in range(0, len(lines), self.chunk_size)]
+
+
+_shared_leases: Optional[SellerLeases] = None
+_shared_leases_lock = threading.Lock()
+
+def shared_seller_leases() -> SellerLeases:
+    """ Process-wide seller leases. """
+    global _shared_leases
+    with _shared_leases_lock:
+        if _shared_leases is None:
+            _shared_leases = SellerLeases()
+        return _shared_leases
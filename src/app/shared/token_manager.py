@@ -1,30 +1,86 @@
 """ Manager the creation of meercado libre API token for an user application """
 
-from typing import Optional
+from dataclasses import asdict
+from typing import Callable, Optional
 
+from src.config import AppConfigManager
 from src.infra.db.repo.models import ResponseCode
 from src.infra.db.repo.models import DataclassTable
-from src.infra.api.mercadolivre.auth import MeliAuthCredentials, AuthResponse
+from src.infra.db.repo.meli_tokens import MeliTokensRepository, AdvisoryLockTimeout
+from src.infra.db.models.meli_tokens import MeliTokenDataclass
+from src.infra.api.mercadolivre.auth import (
+    MeliAuthCredentials,
+    AuthResponse,
+    StoredToken,
+    TokenCache,
+    TokenLockTimeout,
+    shared_token_cache
+)
 from src.infra.db.repo.interfaces.base_protocol import TableRepositoryProtocol
 
 
 # Criar um modélo de repositorie para usar como typing
 
+class DatabaseTokenStore:
+    """ TokenStoreProtocol backed by the meli_tokens table (shared by every bot instance). """
+    def __init__(self, repo: Optional[MeliTokensRepository] = None) -> None:
+        """
+        Args:
+            repo (MeliTokensRepository, optional): meli_tokens table repository.
+        """
+        self.repo = repo or MeliTokensRepository()
+    
+    def token(self, client_id: str) -> Optional[StoredToken]:
+        line: Optional[MeliTokenDataclass] = self.repo.get.token(client_id)
+        return StoredToken(**asdict(line)) if line else None
+    
+    def exchange(
+        self,
+        client_id: str,
+        refresh: Callable[[Optional[StoredToken]], Optional[StoredToken]],
+        adopt: Optional[Callable[[Optional[StoredToken]], bool]] = None
+    ) -> Optional[StoredToken]:
+        def refresh_line(line: Optional[MeliTokenDataclass]) -> Optional[MeliTokenDataclass]:
+            current: Optional[StoredToken] = StoredToken(**asdict(line)) if line else None
+            token: Optional[StoredToken] = refresh(current)
+            if token is None or token is current:
+                return line
+            return MeliTokenDataclass(**asdict(token))
+        
+        def adopt_line(line: Optional[MeliTokenDataclass]) -> bool:
+            return adopt(StoredToken(**asdict(line)) if line else None)
+        
+        try:
+            line: Optional[MeliTokenDataclass] = self.repo.update.exchange(client_id, refresh_line, adopt_line if adopt else None)
+        except AdvisoryLockTimeout as e:
+            raise TokenLockTimeout(str(e)) from e
+        return StoredToken(**asdict(line)) if line else None
+
+
+def default_token_cache() -> TokenCache:
+    """ Process-wide token cache, persisted on the meli_tokens table unless SHARED_TOKENS=OFF. """
+    shared_tokens: bool = AppConfigManager().load_http_config().shared_tokens
+    return shared_token_cache(store=DatabaseTokenStore() if shared_tokens else None)
+
+
 class MeliTokenManager:
     """ Gets and validation the creation of a token. """
     def __init__(
         self, 
         repo: TableRepositoryProtocol, 
-        meli_auth: MeliAuthCredentials
+        meli_auth: MeliAuthCredentials,
+        token_cache: Optional[TokenCache] = None
     ) -> None:
         """
         
         Args:
             repo (TableRepositoryProtocol): Table repository.
             meli_auth (MeliAuthCredentials): Mercado libre auth tools.
+            token_cache (TokenCache, optional): Access tokens cache. Default: the process-wide cache, shared by every application.
         """
         self.repo = repo
         self.auth = meli_auth
+        self.token_cache = token_cache or default_token_cache()
     
     def get_token(self, lines: list[DataclassTable]) -> Optional[AuthResponse]:
         """
@@ -61,7 +117,7 @@ class MeliTokenManager:
         ]):
             self.repo.update.log_error(
                 id=line.id, 
-                cod_erro=ResponseCode.TABLE_ERROR, 
+                return_code=ResponseCode.TABLE_ERROR, 
                 log_erro="Informações de credencial de usuário ausentes!!"
             )
             return None
@@ -75,11 +131,11 @@ class MeliTokenManager:
         Returns:
             AuthResponse: If the request was successful, else None.
         """
-        token = self.auth.get_refresh_token(line.credentials)
+        token = self.token_cache.get_token(line.credentials)
         if not token.success:
             self.repo.update.log_error(
                 id=line.id, 
-                cod_erro=ResponseCode.PROGRAM_ERROR, 
+                return_code=ResponseCode.PROGRAM_ERROR, 
                 log_erro=str(token.error)
             )
             return None
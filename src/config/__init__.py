@@ -11,7 +11,13 @@ Exports:
 from .manager import AppConfigManager
 from .models import (
     AppConfig, 
-    DatabaseConfig
+    DatabaseConfig,
+    EngineConfig,
+    SchedulerConfig,
+    WorkerConfig,
+    HttpConfig,
+    ReferenceCacheConfig,
+    TitleClassifierConfig
 )
 from .validators import (
     RequiredKeysValidator,
@@ -36,7 +42,7 @@ __all__ = [
     "__version__",
     
     "AppConfigManager", 
-    "AppConfig", "DatabaseConfig",
+    "AppConfig", "DatabaseConfig", "EngineConfig", "SchedulerConfig", "WorkerConfig", "HttpConfig", "ReferenceCacheConfig", "TitleClassifierConfig",
     "validators",
     
     "EnvFileNotFoundError",
@@ -1,12 +1,15 @@
 """ Environment variable manager. """
 
+import os
 import sys
+import socket
 from typing import Dict, List, Optional
 
 from src.core import log
 from .exceptions import (
     # EnvFileNotFoundError,
-    ConfigValidationError
+    ConfigValidationError,
+    InvalidConfigVariableError
 )
 from .validators import (
     EnvValidator,
@@ -20,12 +23,20 @@ from .validators import (
 from .models import (
     AppConfig,
     DatabaseConfig,
+    EngineConfig,
+    SchedulerConfig,
+    WorkerConfig,
+    HttpConfig,
+    ReferenceCacheConfig,
+    TitleClassifierConfig,
     ApiBrasilCredentials,
     ApiBrasilDevices
 )
 
 
 FALLBACK_TIMER: int = 2
+FALLBACK_TIMER_MAX: int = 60
+OFF_VALUES: tuple = ("", "0", "OFF", "FALSE", "N", "NAO", "NÃO")
 DATABASE_REQUIRED_KEYS: list = ["HOSTNAME", "DATABASE", "PASSWORD", "USER"]
 IGNORED_KEYS: list = ["STILL_ON"]
 
@@ -75,8 +86,108 @@ class RealTimeEnvManager:
         
         return AppConfig(
             still_on=bool(env_data.get("STILL_ON", False)),
-            timer=int(env_data.get("TIMER", FALLBACK_TIMER))
+            timer=int(env_data.get("TIMER", FALLBACK_TIMER)),
+            listen_notify=self._is_on(env_data.get("LISTEN_NOTIFY", "")),
+            timer_max=self._optional_int(env_data, "TIMER_MAX", FALLBACK_TIMER_MAX)
         )
+    
+    def load_scheduler_config(self) -> SchedulerConfig:
+        """ Loads the applications and sellers concurrency limits. Every key is optional. """
+        env_data = self._read_env_file()
+        return SchedulerConfig(
+            produtos_concurrency=self._optional_int(env_data, "PRODUTOS_CONCURRENCY", 1),
+            status_concurrency=self._optional_int(env_data, "STATUS_CONCURRENCY", 1),
+            category_concurrency=self._optional_int(env_data, "CATEGORY_CONCURRENCY", 1),
+            urgent_concurrency=self._optional_int(env_data, "URGENT_CONCURRENCY", 1),
+            seller_workers=self._optional_int(env_data, "SELLER_WORKERS", 4),
+            seller_chunk_size=self._optional_int(env_data, "SELLER_CHUNK_SIZE", 20),
+            urgent_seller_workers=self._optional_int(env_data, "URGENT_SELLER_WORKERS", 2),
+            urgent_operations=self._optional_int_list(env_data, "URGENT_OPERATIONS", (3, 5))
+        )
+    
+    def load_http_config(self) -> HttpConfig:
+        """ Loads the HTTP connection pool sizes and rate limits. Every key is optional. """
+        env_data = self._read_env_file()
+        return HttpConfig(
+            pool_connections=self._optional_int(env_data, "HTTP_POOL_CONNECTIONS", 10),
+            pool_maxsize=self._optional_int(env_data, "HTTP_POOL_MAXSIZE", 16),
+            max_in_flight=self._optional_int(env_data, "HTTP_MAX_IN_FLIGHT", 16),
+            rate_limit=self._optional_int(env_data, "HTTP_RATE_LIMIT", 10),
+            rate_burst=self._optional_int(env_data, "HTTP_RATE_BURST", 20),
+            throttle_retries=self._optional_int(env_data, "HTTP_429_RETRIES", 4),
+            operation_deadline=self._optional_int(env_data, "OPERATION_DEADLINE", 60),
+            coalesce_ttl=self._optional_int(env_data, "HTTP_COALESCE_TTL", 2),
+            token_refresh_ahead=self._optional_int(env_data, "TOKEN_REFRESH_AHEAD", 600),
+            shared_tokens=self._is_on(env_data.get("SHARED_TOKENS", "ON"))
+        )
+    
+    def load_reference_cache_config(self) -> ReferenceCacheConfig:
+        """
+        Loads the reference data cache settings. Every key is optional.
+        
+        REFERENCE_CACHE_PATH=OFF disables the persistent cache and CATEGORY_TREE_PATH=OFF the local category tree.
+        """
+        env_data = self._read_env_file()
+        path: str = env_data.get("REFERENCE_CACHE_PATH") or ReferenceCacheConfig.path
+        tree_path: str = env_data.get("CATEGORY_TREE_PATH") or ReferenceCacheConfig.category_tree_path
+        return ReferenceCacheConfig(
+            path=path if self._is_on(path) else "",
+            max_entries=self._optional_int(env_data, "REFERENCE_CACHE_MAX_ENTRIES", 20000),
+            max_mb=self._optional_int(env_data, "REFERENCE_CACHE_MAX_MB", 64),
+            ttl_root_categories=self._optional_int(env_data, "REFERENCE_TTL_ROOT_CATEGORIES", 86400),
+            ttl_category=self._optional_int(env_data, "REFERENCE_TTL_CATEGORY", 86400),
+            ttl_attributes=self._optional_int(env_data, "REFERENCE_TTL_ATTRIBUTES", 21600),
+            ttl_top_values=self._optional_int(env_data, "REFERENCE_TTL_TOP_VALUES", 86400),
+            ttl_domain_discovery=self._optional_int(env_data, "REFERENCE_TTL_DOMAIN_DISCOVERY", 21600),
+            category_tree_path=tree_path if self._is_on(tree_path) else "",
+            ttl_category_tree=self._optional_int(env_data, "REFERENCE_TTL_CATEGORY_TREE", 86400)
+        )
+    
+    def load_title_classifier_config(self) -> TitleClassifierConfig:
+        """ Loads the local title classifier settings. Every key is optional, CATEGORY_CLASSIFIER=OFF disables it. """
+        env_data = self._read_env_file()
+        return TitleClassifierConfig(
+            enabled=self._is_on(env_data.get("CATEGORY_CLASSIFIER", "ON")),
+            min_confidence=self._optional_int(env_data, "CATEGORY_CLASSIFIER_MIN_CONFIDENCE", 55),
+            min_accuracy=self._optional_int(env_data, "CATEGORY_CLASSIFIER_MIN_ACCURACY", 95),
+            max_samples=self._optional_int(env_data, "CATEGORY_CLASSIFIER_MAX_SAMPLES", 20000),
+            retrain_interval=self._optional_int(env_data, "CATEGORY_CLASSIFIER_RETRAIN_INTERVAL", 86400)
+        )
+    
+    def load_worker_config(self) -> WorkerConfig:
+        """
+        Loads the worker identification used to claim pending lines.
+        
+        WORKER_ID is optional, the default is "<hostname>-<pid>". Set a fixed value per instance to
+        recover, on startup, the lines left in EXECUTING by an interrupted run.
+        """
+        env_data = self._read_env_file()
+        return WorkerConfig(
+            worker_id=env_data.get("WORKER_ID") or f"{socket.gethostname()}-{os.getpid()}",
+            claim_limit=self._optional_int(env_data, "CLAIM_LIMIT", 100),
+            retry_delay=self._optional_int(env_data, "RETRY_DELAY", 60),
+            max_retries=self._optional_int(env_data, "MAX_RETRIES", 5)
+        )
+    
+    def _optional_int(self, env_data: Dict[str, str], key: str, default: int) -> int:
+        """ Reads an optional int variable, falling back to `default` when it's absent or empty. """
+        if not env_data.get(key):
+            return default
+        TypeConversionValidator(key, int).validate(env_data)
+        return int(env_data[key])
+    
+    def _optional_int_list(self, env_data: Dict[str, str], key: str, default: tuple[int, ...]) -> tuple[int, ...]:
+        """ Reads an optional comma separated int list. Ex.: URGENT_OPERATIONS=3,5 """
+        if not env_data.get(key):
+            return default
+        try:
+            return tuple(int(value) for value in env_data[key].split(",") if value.strip())
+        except ValueError as e:
+            raise InvalidConfigVariableError(f"{key} deve ser uma lista de números separados por vírgula. Ex.: {key}=3,5") from e
+    
+    def _is_on(self, value: str) -> bool:
+        """ Interprets an optional ON/OFF flag. Empty, "0", "OFF", "FALSE" and "N" are considered off. """
+        return value.strip().upper() not in OFF_VALUES
 
 class AppConfigManager(RealTimeEnvManager):
     def __init__(self) -> None:
@@ -103,6 +214,24 @@ class AppConfigManager(RealTimeEnvManager):
         
         return self._db_config
     
+    def load_engine_config(self) -> EngineConfig:
+        """ Loads the database engine settings. Every key is optional. """
+        env_data = self._read_env_file()
+        executemany_mode: str = env_data.get("DB_EXECUTEMANY_MODE") or EngineConfig.executemany_mode
+        if executemany_mode not in ("values_only", "values_plus_batch"):
+            raise InvalidConfigVariableError("DB_EXECUTEMANY_MODE deve ser values_only ou values_plus_batch.")
+        return EngineConfig(
+            pool_size=self._optional_int(env_data, "DB_POOL_SIZE", 10),
+            max_overflow=self._optional_int(env_data, "DB_MAX_OVERFLOW", 10),
+            pool_timeout=self._optional_int(env_data, "DB_POOL_TIMEOUT", 30),
+            pool_recycle=self._optional_int(env_data, "DB_POOL_RECYCLE", 1800),
+            pool_pre_ping=self._is_on(env_data.get("DB_POOL_PRE_PING", "ON")),
+            statement_timeout=self._optional_int(env_data, "DB_STATEMENT_TIMEOUT", 60),
+            lock_timeout=self._optional_int(env_data, "DB_LOCK_TIMEOUT", 0),
+            executemany_mode=executemany_mode,
+            executemany_page_size=self._optional_int(env_data, "DB_EXECUTEMANY_PAGE_SIZE", 1000)
+        )
+    
     @property
     def database_url(self) -> str:
         """ Create connection URL. """
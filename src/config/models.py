@@ -10,10 +10,82 @@ class DatabaseConfig:
     user: str
     port: int = 5432
 
+@dataclass(frozen=True)
+class EngineConfig:
+    """ SQLAlchemy engine (connection pool and psycopg2) settings. """
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: int = 30 # Seconds waiting for a free connection.
+    pool_recycle: int = 1800 # Seconds before a connection is replaced (avoids connections dropped by the server/firewall).
+    pool_pre_ping: bool = True
+    statement_timeout: int = 60 # Seconds. Server side, 0: no limit.
+    lock_timeout: int = 0 # Seconds. Server side, 0: no limit.
+    executemany_mode: str = "values_plus_batch"
+    executemany_page_size: int = 1000
+
 @dataclass(frozen=True)
 class AppConfig:
     still_on: bool
     timer: int
+    listen_notify: bool = False
+    timer_max: int = 60 # Adaptive interval ceiling (seconds) while there's no backlog.
+
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """ Max simultaneous executions of each application and the sellers pool used inside them. """
+    produtos_concurrency: int = 1
+    status_concurrency: int = 1
+    category_concurrency: int = 1
+    urgent_concurrency: int = 1 # Executions of the produtos urgent lane.
+    seller_workers: int = 4
+    seller_chunk_size: int = 20
+    urgent_seller_workers: int = 2 # Pool of the produtos urgent lane, reserved for it.
+    urgent_operations: tuple[int, ...] = (3, 5) # `operacao` values of the produtos urgent lane.
+
+@dataclass(frozen=True)
+class HttpConfig:
+    """ Connection pool of the shared Mercado Libre HTTP session. """
+    pool_connections: int = 10 # Hosts kept in the pool.
+    pool_maxsize: int = 16 # Keep-alive connections per host (should cover every worker thread).
+    max_in_flight: int = 16 # Max simultaneous requests of the async clients.
+    rate_limit: int = 10 # Requests per second for each seller and endpoint family.
+    rate_burst: int = 20
+    throttle_retries: int = 4 # Retries after an HTTP 429.
+    operation_deadline: int = 60 # Max seconds of each product publication/edition.
+    coalesce_ttl: int = 2 # Seconds an identical GET reuses the last successful response (0: only in-flight sharing).
+    token_refresh_ahead: int = 600 # Seconds before expiration the access tokens are refreshed in background.
+    shared_tokens: bool = True # Share the seller tokens between bot instances through the meli_tokens table.
+
+@dataclass(frozen=True)
+class ReferenceCacheConfig:
+    """ Persistent cache of the Mercado Libre reference data (categories, attributes, top values). """
+    path: str = "referencias_ml.sqlite3" # SQLite file shared by every bot process. Empty: cache disabled.
+    max_entries: int = 20000
+    max_mb: int = 64
+    ttl_root_categories: int = 86400 # Seconds each resource is used without revalidation.
+    ttl_category: int = 86400
+    ttl_attributes: int = 21600
+    ttl_top_values: int = 86400
+    ttl_domain_discovery: int = 21600 # Category predictions by normalized product title.
+    category_tree_path: str = "categorias_ml.bin" # Local snapshot of the full category tree. Empty: disabled.
+    ttl_category_tree: int = 86400
+
+@dataclass(frozen=True)
+class TitleClassifierConfig:
+    """ Local title -> category classifier, trained on the past category results. """
+    enabled: bool = True
+    min_confidence: int = 55 # Min similarity (%) to trust a local prediction. Below it domain discovery is used.
+    min_accuracy: int = 95 # Min hit rate (%) of the confident predictions on the holdout titles to use the model.
+    max_samples: int = 20000 # Most recent titles used in the training (it runs inside the bot process).
+    retrain_interval: int = 86400 # Seconds between two trainings.
+
+@dataclass(frozen=True)
+class WorkerConfig:
+    """ Identifies this bot instance when claiming pending lines. """
+    worker_id: str
+    claim_limit: int = 100
+    retry_delay: int = 60 # Seconds a line given back to the queue waits before being claimed again.
+    max_retries: int = 5 # Retries in a row (Ex.: timeouts) before a line goes to PROGRAM_ERROR.
 
 @dataclass
 class ApiBrasilDevices:
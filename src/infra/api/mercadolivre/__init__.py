@@ -1,6 +1,6 @@
 """ Meracado libre funcs """
 
-from .client import MLBaseClient
+from .client import MLBaseClient, shared_session
 from .auth import AuthManager
 
 __version__ = "v.0.0.0"
@@ -8,5 +8,6 @@ __all__ = [
     "__version__",
     
     "MLBaseClient",
+    "shared_session",
     "AuthManager"
 ]
@@ -0,0 +1,25 @@
+"""
+Async Mercado Libre clients.
+
+Provides:
+    AsyncMLBaseClient: Async counterpart of MLBaseClient.
+    AsyncItemsRequests: Async /items requests.
+    AsyncCategoryRequests: Async category requests.
+    AsyncMeliImageManager: Async pictures upload.
+"""
+
+from .client import AsyncMLBaseClient, shared_executor
+from .items import AsyncItemsRequests
+from .category import AsyncCategoryRequests
+from .images import AsyncMeliImageManager
+
+__version__ = "v.0.0.1"
+__all__ = [
+    "__version__",
+    
+    "AsyncMLBaseClient",
+    "shared_executor",
+    "AsyncItemsRequests",
+    "AsyncCategoryRequests",
+    "AsyncMeliImageManager"
+]
@@ -0,0 +1,23 @@
+""" Async category requests. """
+
+from typing import Optional
+
+from ..category import CategoryRequests
+from ..models import MeliResponse
+from .client import AsyncMLBaseClient
+
+
+class AsyncCategoryRequests:
+    """ Async version of CategoryRequests (same arguments and MeliResponse results). """
+    def __init__(self, category_requests: Optional[CategoryRequests] = None, client: Optional[AsyncMLBaseClient] = None):
+        self.category_requests = category_requests or CategoryRequests()
+        self.client = client or AsyncMLBaseClient(self.category_requests.client)
+    
+    async def get_root_categories(self, access_token: str, site_id: str = "MLB") -> MeliResponse:
+        return await self.client.run(self.category_requests.get_root_categories, access_token, site_id)
+    
+    async def get_category_data(self, category_id: str, access_token: str) -> MeliResponse:
+        return await self.client.run(self.category_requests.get_category_data, category_id, access_token)
+    
+    async def get_category_attributes(self, category_id: str, access_token: str) -> MeliResponse:
+        return await self.client.run(self.category_requests.get_category_attributes, category_id, access_token)
@@ -0,0 +1,75 @@
+""" Async client interface for Mercado Libre API """
+
+import asyncio
+import threading
+import contextvars
+from functools import partial
+from typing import Callable, Optional, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import AppConfigManager
+from ..client import MLBaseClient
+from ..models import MeliResponse, MeliContext
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def shared_executor() -> ThreadPoolExecutor:
+    """
+    Process-wide pool where the async clients run the requests. Its size (HTTP_MAX_IN_FLIGHT) is the
+    max number of requests in flight; keep HTTP_POOL_MAXSIZE at least as large to reuse every connection.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            max_in_flight: int = AppConfigManager().load_http_config().max_in_flight
+            _executor = ThreadPoolExecutor(max_workers=max(max_in_flight, 1), thread_name_prefix="meli-http")
+        return _executor
+
+
+class AsyncMLBaseClient:
+    """
+    Async counterpart of MLBaseClient. Returns the same MeliResponse / MeliErrorDetail objects.
+    
+    The requests go through the shared (blocking) session on a dedicated thread pool, so the
+    coroutines of hundreds of items can be awaited together (Ex.: asyncio.gather) while the
+    connections and retries stay the same of the sync clients.
+    """
+    def __init__(self, client: Optional[MLBaseClient] = None, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Args:
+            client (MLBaseClient, optional): Sync client used on the requests. Default: a client over the shared session.
+            executor (ThreadPoolExecutor, optional): Pool for the requests. Default: the process-wide pool.
+        """
+        self.client = client or MLBaseClient()
+        self.executor = executor
+    
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Runs a blocking call on the requests pool. The caller context (Ex.: the operation deadline) is kept.
+        Args:
+            func (Callable): Blocking function. Ex.: ItemsRequests().get_item_info
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor or shared_executor(), 
+            partial(context.run, func, *args, **kwargs)
+        )
+    
+    async def request(self, method: str, endpoint: str, context: MeliContext, **kwargs) -> MeliResponse:
+        return await self.run(self.client.request, method, endpoint, context, **kwargs)
+    
+    async def get(self, endpoint: str, context: MeliContext, **kwargs) -> MeliResponse:
+        return await self.request("GET", endpoint, context, **kwargs)
+    
+    async def post(self, endpoint: str, context: MeliContext, **kwargs) -> MeliResponse:
+        return await self.request("POST", endpoint, context, **kwargs)
+    
+    async def put(self, endpoint: str, context: MeliContext, **kwargs) -> MeliResponse:
+        return await self.request("PUT", endpoint, context, **kwargs)
+    
+    async def delete(self, endpoint: str, context: MeliContext, **kwargs) -> MeliResponse:
+        return await self.request("DELETE", endpoint, context, **kwargs)
@@ -0,0 +1,23 @@
+""" Async manager for mercado libre images requests. """
+
+from typing import Optional
+
+from ..images import MeliImageManager
+from ..models import MeliResponse
+from .client import AsyncMLBaseClient
+
+
+class AsyncMeliImageManager:
+    """ Async version of MeliImageManager (same arguments and MeliResponse results). """
+    def __init__(self, image_manager: Optional[MeliImageManager] = None, client: Optional[AsyncMLBaseClient] = None):
+        self.image_manager = image_manager or MeliImageManager()
+        self.client = client or AsyncMLBaseClient(self.image_manager.client)
+    
+    async def get_meli_picture(self, image_url: str, access_token: str) -> MeliResponse:
+        """
+        Downloads the image and uploads it to mercado libre.
+        Args:
+            image_url (str): The image url.
+            access_token (str): Access token to get the images IDs.
+        """
+        return await self.client.run(self.image_manager.get_meli_picture, image_url, access_token)
@@ -0,0 +1,65 @@
+""" Async items requests. """
+
+from typing import Any, Optional
+
+from ..items import ItemsRequests
+from ..models import MeliResponse
+from .client import AsyncMLBaseClient
+
+
+class AsyncItemsRequests:
+    """ Async version of ItemsRequests (same arguments and MeliResponse results). """
+    def __init__(self, items_requests: Optional[ItemsRequests] = None, client: Optional[AsyncMLBaseClient] = None):
+        self.items_requests = items_requests or ItemsRequests()
+        self.client = client or AsyncMLBaseClient(self.items_requests.client)
+    
+    async def publish(self, access_token: str, publication_data: dict[str, Any]) -> MeliResponse:
+        return await self.client.run(self.items_requests.publish, access_token, publication_data)
+    
+    async def add_description(
+        self, 
+        access_token: str, 
+        item_id: str, 
+        descrption: str, 
+        change_description: bool = False
+    ) -> MeliResponse:
+        return await self.client.run(
+            self.items_requests.add_description, access_token, item_id, descrption, change_description
+        )
+    
+    async def get_description(self, access_token: str, item_id: str) -> MeliResponse:
+        return await self.client.run(self.items_requests.get_description, access_token, item_id)
+    
+    async def edit(self, access_token: str, item_id: str, edition_data: dict) -> MeliResponse:
+        return await self.client.run(self.items_requests.edit, access_token, item_id, edition_data)
+    
+    async def list_items(self, access_token: str, user_id: str, limit: int = 50, offset: int = 0) -> MeliResponse:
+        return await self.client.run(self.items_requests.list_items, access_token, user_id, limit, offset)
+    
+    async def get_items_info(self, access_token: str, items_list: str) -> MeliResponse:
+        return await self.client.run(self.items_requests.get_items_info, access_token, items_list)
+    
+    async def get_item_info(self, access_token: str, item_id: str) -> MeliResponse:
+        return await self.client.run(self.items_requests.get_item_info, access_token, item_id)
+    
+    async def get_category_by_item_name(
+        self, 
+        access_token: str, 
+        item_name: str, 
+        limit: int = 8, 
+        site: str = "MLB"
+    ) -> MeliResponse:
+        return await self.client.run(
+            self.items_requests.get_category_by_item_name, access_token, item_name, limit, site
+        )
+    
+    async def add_compatibilities(
+        self, 
+        access_token: str, 
+        product_id: str, 
+        items_ids: list[str], 
+        limit: int = 180
+    ) -> MeliResponse:
+        return await self.client.run(
+            self.items_requests.add_compatibilities, access_token, product_id, items_ids, limit
+        )
@@ -2,7 +2,8 @@
 
 from .manager import AuthManager
 from .adpter import MeliAuthCredentials
-from .models import AuthResponse, MeliCredentials, MeliCredentialsProtocol
+from .models import AuthResponse, MeliCredentials, MeliCredentialsProtocol, StoredToken, TokenStoreProtocol, TokenLockTimeout
+from .cache import TokenCache, shared_token_cache
 
 __version__ = "v.0.0.1"
 __all__ = [
@@ -10,8 +11,13 @@ __all__ = [
     
     "AuthManager",
     "MeliAuthCredentials",
+    "TokenCache",
+    "shared_token_cache",
     
     "AuthResponse",
     "MeliCredentials",
-    "MeliCredentialsProtocol"
+    "MeliCredentialsProtocol",
+    "StoredToken",
+    "TokenStoreProtocol",
+    "TokenLockTimeout"
 ]
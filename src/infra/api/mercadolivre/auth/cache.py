@@ -0,0 +1,361 @@
+""" Process-wide cache of Mercado Libre access tokens. """
+
+import time
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from src.core import log
+from src.config import AppConfigManager
+from ..models import MeliResponse, MeliErrorDetail
+from .adpter import MeliAuthCredentials
+from .models import AuthResponse, MeliCredentials, MeliCredentialsProtocol, StoredToken, TokenStoreProtocol, TokenLockTimeout
+
+
+@dataclass
+class CachedToken:
+    auth: AuthResponse
+    credentials: MeliCredentials # Latest credentials, with the rotated refresh token.
+    source_refresh_token: str # Refresh token of the table line that created the entry.
+    expires_at: float # time.monotonic() reference.
+    last_used: float
+    retry_at: float = 0.0 # Next background attempt after a failed refresh.
+    
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+
+class TokenCache:
+    """
+    Keeps the access token of each seller (client_id) until shortly before it expires.
+    
+    - Every application (produtos, status, category) shares the same cache, so a seller token is
+      requested once per lifetime (6 hours) instead of once per application on every tick.
+    - A background thread refreshes the tokens `refresh_ahead` seconds before they expire, so the
+      ticks don't wait for the auth round trip. Sellers idle for more than `IDLE_LIMIT` are only
+      refreshed on demand.
+    - The refresh token returned by each refresh (Mercado Libre rotates it) is used on the next one.
+    - If the line credentials change (Ex.: a new authorization), a new token is requested.
+    
+    With a `store`, the tokens are also shared between bot instances: the refresh happens inside the
+    store lock (only one instance refreshes a seller at a time), the rotated refresh token is persisted
+    and the other instances reuse the stored access token instead of requesting their own.
+    """
+    EXPIRY_MARGIN: float = 60.0 # A token closer than this to its expiration is never returned.
+    IDLE_LIMIT: float = 3600.0
+    RETRY_INTERVAL: float = 30.0
+    
+    def __init__(
+        self,
+        auth: Optional[MeliAuthCredentials] = None,
+        refresh_ahead: float = 600.0,
+        store: Optional[TokenStoreProtocol] = None
+    ) -> None:
+        """
+        Args:
+            auth (MeliAuthCredentials, optional): Auth requests. Default: a new MeliAuthCredentials.
+            refresh_ahead (float): Seconds before the expiration the token is refreshed in background.
+            store (TokenStoreProtocol, optional): Persistent store shared by every bot instance.
+        """
+        self.auth = auth or MeliAuthCredentials()
+        self.refresh_ahead = max(refresh_ahead, self.EXPIRY_MARGIN)
+        self.store = store
+        self._entries: dict[str, CachedToken] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+    
+    def get_token(self, credentials: MeliCredentialsProtocol) -> MeliResponse:
+        """
+        Returns a valid access token, requesting a new one only when needed.
+        Args:
+            credentials (MeliCredentialsProtocol): The credentials columns of a table line.
+        Returns:
+            MeliResponse: `data` is an AuthResponse on success.
+        """
+        entry: Optional[CachedToken] = self._valid_entry(credentials)
+        if entry:
+            return MeliResponse(success=True, data=entry.auth)
+        
+        with self._client_lock(credentials.client_id): # One refresh per seller at a time.
+            entry = self._valid_entry(credentials)
+            if entry:
+                return MeliResponse(success=True, data=entry.auth)
+            response: MeliResponse = self._refresh(credentials, self.EXPIRY_MARGIN)
+            self._valid_entry(credentials) # Marks the seller as used.
+            return response
+    
+    def invalidate(self, client_id: str) -> None:
+        """ Discards a seller token (Ex.: the API rejected it). """
+        with self._lock:
+            self._entries.pop(client_id, None)
+    
+    def _valid_entry(self, credentials: MeliCredentialsProtocol) -> Optional[CachedToken]:
+        entry: Optional[CachedToken] = self._entries.get(credentials.client_id)
+        if not entry or not self._matches(entry, credentials) or entry.remaining() <= self.EXPIRY_MARGIN:
+            return None
+        entry.last_used = time.monotonic()
+        return entry
+    
+    def _refresh(self, credentials: MeliCredentialsProtocol, min_remaining: float) -> MeliResponse:
+        """
+        Requests a new token, through the store when there's one. Caller holds the seller lock.
+        Args:
+            min_remaining (float): A stored token with less seconds than this left is refreshed.
+        """
+        if self.store is None:
+            return self._refresh_local(credentials)
+        try:
+            return self._refresh_shared(credentials, min_remaining)
+        except TokenLockTimeout as e:
+            # Another instance is still refreshing the seller: a local refresh would race its refresh token rotation.
+            log.dev.warning(str(e))
+            return self._reread(credentials, min_remaining)
+        except Exception as e:
+            log.dev.warning(f"[{credentials.client_id}] Falha no armazenamento de tokens compartilhado: {e}")
+            entry: Optional[CachedToken] = self._entries.get(credentials.client_id)
+            if entry and self._matches(entry, credentials) and entry.remaining() > min_remaining:
+                return MeliResponse(success=True, data=entry.auth) # Refreshed before the store failure.
+            return self._refresh_local(credentials)
+    
+    def _reread(self, credentials: MeliCredentialsProtocol, min_remaining: float) -> MeliResponse:
+        """ Uses the stored token (or the one in memory) without refreshing it. """
+        try:
+            if self._adopt(credentials, self.store.token(credentials.client_id), min_remaining):
+                return MeliResponse(success=True, data=self._entries[credentials.client_id].auth)
+        except Exception as e:
+            log.dev.warning(f"[{credentials.client_id}] Falha ao ler o token armazenado: {e}")
+        
+        entry: Optional[CachedToken] = self._entries.get(credentials.client_id)
+        if entry and self._matches(entry, credentials) and entry.remaining() > min_remaining:
+            return MeliResponse(success=True, data=entry.auth)
+        return MeliResponse(
+            success=False,
+            error=MeliErrorDetail(
+                message="Token do vendedor em renovação por outra instância. Tente novamente em instantes.",
+                context="auth"
+            )
+        )
+    
+    def _refresh_local(self, credentials: MeliCredentialsProtocol) -> MeliResponse:
+        entry: Optional[CachedToken] = self._entries.get(credentials.client_id)
+        if entry and self._matches(entry, credentials):
+            return self._request_rotated(credentials, entry.credentials.refresh_token, entry.source_refresh_token)
+        return self._request(credentials, credentials.refresh_token)
+    
+    def _refresh_shared(self, credentials: MeliCredentialsProtocol, min_remaining: float) -> MeliResponse:
+        client_id: str = credentials.client_id
+        if self._adopt(credentials, self.store.token(client_id), min_remaining): # Refreshed by another instance.
+            return MeliResponse(success=True, data=self._entries[client_id].auth)
+        
+        responses: list[MeliResponse] = []
+        
+        def refresh(current: Optional[StoredToken]) -> Optional[StoredToken]:
+            if self._adopt(credentials, current, min_remaining): # Refreshed while this instance waited the lock.
+                responses.append(MeliResponse(success=True, data=self._entries[client_id].auth))
+                return current
+            
+            if current and self._stored_matches(current, credentials):
+                response = self._request_rotated(credentials, current.refresh_token, current.refresh_token_origem)
+            else:
+                response = self._request(credentials, credentials.refresh_token)
+            responses.append(response)
+            return self._stored_token(client_id) if response.success else current
+        
+        self.store.exchange(
+            client_id,
+            refresh,
+            adopt=lambda current: self._adopt(credentials, current, min_remaining)
+        )
+        if not responses: # Adopted while polling the lock.
+            return MeliResponse(success=True, data=self._entries[client_id].auth)
+        return responses[-1]
+    
+    def _request_rotated(self, credentials: MeliCredentialsProtocol, refresh_token: str, source_refresh_token: str) -> MeliResponse:
+        """ Refreshes with the rotated refresh token, falling back to the table line one. """
+        rotated = MeliCredentials(
+            client_id=credentials.client_id,
+            client_secret=credentials.client_secret,
+            redirect_uri=credentials.redirect_uri,
+            refresh_token=refresh_token
+        )
+        response: MeliResponse = self._request(rotated, source_refresh_token)
+        if response.success or refresh_token == credentials.refresh_token:
+            return response
+        log.dev.warning(f"[{credentials.client_id}] Falha com o refresh token renovado. Tentando com o da tabela.")
+        return self._request(credentials, credentials.refresh_token)
+    
+    def _request(self, credentials: MeliCredentialsProtocol, source_refresh_token: str) -> MeliResponse:
+        response: MeliResponse = self.auth.get_refresh_token(credentials)
+        if not response.success:
+            self.invalidate(credentials.client_id)
+            return response
+        
+        auth: AuthResponse = response.data
+        self._put(
+            credentials=MeliCredentials(
+                client_id=credentials.client_id,
+                client_secret=credentials.client_secret,
+                redirect_uri=credentials.redirect_uri,
+                refresh_token=auth.refresh_token or credentials.refresh_token
+            ),
+            auth=auth,
+            source_refresh_token=source_refresh_token,
+            remaining=auth.expires_in or 0
+        )
+        return response
+    
+    def _adopt(self, credentials: MeliCredentialsProtocol, stored: Optional[StoredToken], min_remaining: float) -> bool:
+        """ Uses a stored token refreshed by any instance, if it belongs to the line credentials and is still valid. """
+        if stored is None or not self._stored_matches(stored, credentials):
+            return False
+        
+        expira_em: datetime = stored.expira_em if stored.expira_em.tzinfo else stored.expira_em.replace(tzinfo=timezone.utc)
+        remaining: float = (expira_em - datetime.now(timezone.utc)).total_seconds()
+        if remaining <= min_remaining:
+            return False
+        
+        self._put(
+            credentials=MeliCredentials(
+                client_id=credentials.client_id,
+                client_secret=credentials.client_secret,
+                redirect_uri=credentials.redirect_uri,
+                refresh_token=stored.refresh_token
+            ),
+            auth=AuthResponse(
+                access_token=stored.access_token,
+                token_type="bearer",
+                expires_in=int(remaining),
+                scope=stored.scope,
+                user_id=stored.user_id,
+                refresh_token=stored.refresh_token
+            ),
+            source_refresh_token=stored.refresh_token_origem,
+            remaining=remaining
+        )
+        return True
+    
+    def _put(self, credentials: MeliCredentials, auth: AuthResponse, source_refresh_token: str, remaining: float) -> None:
+        now: float = time.monotonic()
+        with self._lock:
+            previous: Optional[CachedToken] = self._entries.get(credentials.client_id)
+            self._entries[credentials.client_id] = CachedToken(
+                auth=auth,
+                credentials=credentials,
+                source_refresh_token=source_refresh_token,
+                expires_at=now + remaining,
+                last_used=previous.last_used if previous else now # Background refreshes don't count as use.
+            )
+        self._start_refresher()
+    
+    def _stored_token(self, client_id: str) -> StoredToken:
+        """ The in memory entry, as saved on the store. """
+        entry: CachedToken = self._entries[client_id]
+        return StoredToken(
+            client_id=client_id,
+            access_token=entry.auth.access_token,
+            refresh_token=entry.credentials.refresh_token,
+            refresh_token_origem=entry.source_refresh_token,
+            expira_em=datetime.now(timezone.utc) + timedelta(seconds=entry.remaining()),
+            user_id=entry.auth.user_id,
+            scope=entry.auth.scope
+        )
+    
+    def _matches(self, entry: CachedToken, credentials: MeliCredentialsProtocol) -> bool:
+        """ Whether the line credentials are the ones that created the entry (or their rotation). """
+        return (
+            entry.credentials.client_secret == credentials.client_secret
+            and entry.credentials.redirect_uri == credentials.redirect_uri
+            and credentials.refresh_token in (entry.source_refresh_token, entry.credentials.refresh_token)
+        )
+    
+    def _stored_matches(self, stored: StoredToken, credentials: MeliCredentialsProtocol) -> bool:
+        return credentials.refresh_token in (stored.refresh_token_origem, stored.refresh_token)
+    
+    def _client_lock(self, client_id: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(client_id, threading.Lock())
+    
+    def _start_refresher(self) -> None:
+        with self._lock:
+            if self._refresher is None:
+                self._refresher = threading.Thread(target=self._refresh_loop, name="meli-token-refresher", daemon=True)
+                self._refresher.start()
+        self._wakeup.set()
+    
+    def _refresh_loop(self) -> None:
+        while True:
+            try:
+                wait: float = self._refresh_due()
+            except Exception as e:
+                log.dev.exception(f"Exceção inesperada na renovação de tokens: {e}")
+                wait = self.RETRY_INTERVAL
+            self._wakeup.wait(timeout=wait)
+            self._wakeup.clear()
+    
+    def _refresh_due(self) -> float:
+        """
+        Refreshes the tokens close to their expiration.
+        Returns:
+            float: Seconds until the next refresh.
+        """
+        now: float = time.monotonic()
+        wait: float = self.IDLE_LIMIT
+        with self._lock:
+            entries: list[tuple[str, CachedToken]] = list(self._entries.items())
+        
+        for client_id, entry in entries:
+            if now - entry.last_used > self.IDLE_LIMIT:
+                if entry.remaining() <= 0:
+                    self._discard(client_id, entry)
+                continue
+            
+            due_at: float = max(entry.expires_at - self.refresh_ahead, entry.retry_at)
+            if due_at > now:
+                wait = min(wait, due_at - now)
+                continue
+            
+            lock: threading.Lock = self._client_lock(client_id)
+            if not lock.acquire(blocking=False): # Already being refreshed on demand.
+                continue
+            try:
+                if self._entries.get(client_id) is not entry:
+                    continue
+                response: MeliResponse = self._refresh(entry.credentials, self.refresh_ahead)
+                if response.success:
+                    log.dev.info(f"[{client_id}] Token renovado antecipadamente.")
+                    wait = min(wait, max(self._entries[client_id].expires_at - self.refresh_ahead - now, 0.0))
+                else:
+                    log.dev.warning(f"[{client_id}] Falha na renovação antecipada do token: {response.error}")
+                    entry.retry_at = now + self.RETRY_INTERVAL
+                    if entry.remaining() > self.EXPIRY_MARGIN: # Keep using it until the next attempt.
+                        with self._lock:
+                            self._entries.setdefault(client_id, entry)
+                    wait = min(wait, self.RETRY_INTERVAL)
+            finally:
+                lock.release()
+        return wait
+    
+    def _discard(self, client_id: str, entry: CachedToken) -> None:
+        with self._lock:
+            if self._entries.get(client_id) is entry:
+                del self._entries[client_id]
+
+
+_shared_cache: Optional[TokenCache] = None
+_shared_cache_lock = threading.Lock()
+
+def shared_token_cache(store: Optional[TokenStoreProtocol] = None) -> TokenCache:
+    """
+    Process-wide token cache, shared by every application.
+    Args:
+        store (TokenStoreProtocol, optional): Persistent store, used when the cache is created (first call).
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            http_config = AppConfigManager().load_http_config()
+            _shared_cache = TokenCache(refresh_ahead=http_config.token_refresh_ahead, store=store)
+        return _shared_cache
@@ -1,7 +1,8 @@
 """ Models for auth requests for mercado libre api. """
 
+from datetime import datetime
 from dataclasses import dataclass
-from typing import Protocol, Optional
+from typing import Callable, Protocol, Optional
 
 @dataclass
 class AuthResponse:
@@ -27,3 +28,38 @@ class MeliCredentialsProtocol(Protocol):
     client_secret: str
     redirect_uri: str
     refresh_token: str
+
+@dataclass
+class StoredToken:
+    """ Seller tokens persisted in a store shared by every bot instance. """
+    client_id: str
+    access_token: str
+    refresh_token: str # Latest refresh token (Mercado Libre rotates it on each refresh).
+    refresh_token_origem: str # Refresh token of the table lines that created this authorization.
+    expira_em: datetime # Access token expiration (timezone aware).
+    user_id: Optional[int] = None
+    scope: Optional[str] = None
+
+class TokenLockTimeout(Exception):
+    """ The store lock of a seller wasn't released in time (another instance is still refreshing it). """
+
+class TokenStoreProtocol(Protocol):
+    """ Typing protocol model for a persistent token store. """
+    def token(self, client_id: str) -> Optional[StoredToken]:
+        """ Reads the stored tokens without locking. """
+        ...
+    
+    def exchange(
+        self,
+        client_id: str,
+        refresh: Callable[[Optional[StoredToken]], Optional[StoredToken]],
+        adopt: Optional[Callable[[Optional[StoredToken]], bool]] = None
+    ) -> Optional[StoredToken]:
+        """
+        Calls `refresh` with the stored tokens holding a lock shared by every instance and saves its result.
+        While another instance holds the lock the stored tokens are read again, and returned as soon as `adopt`
+        accepts them.
+        Raises:
+            TokenLockTimeout: If the lock wasn't released in time.
+        """
+        ...
@@ -1,16 +1,23 @@
 """ ICatalog domains requests. """
 
-from typing import Any
+import json
+from typing import Any, Optional
 
 from src.infra.api.mercadolivre.client import MLBaseClient
 from src.infra.api.mercadolivre.models import MeliResponse
+from src.infra.api.mercadolivre.reference_cache import ReferenceCache, shared_reference_cache
 
 MLB_CARS_AND_VANS: str = "MLB-CARS_AND_VANS"
 
 
 class CatalogDomainsRequests:
-    def __init__(self):
+    def __init__(self, cache: Optional[ReferenceCache] = None):
+        """
+        Args:
+            cache (ReferenceCache, optional): Custom reference cache. Default: the process-wide cache.
+        """
         self.client = MLBaseClient()
+        self.cache = cache or shared_reference_cache()
     
     def get_models(
             self, 
@@ -50,14 +57,19 @@ class CatalogDomainsRequests:
             "known_attributes": known_attributes
         }
         
-        response: MeliResponse = self.client.post(
-            endpoint=f"/catalog_domains/{domain_id}/attributes/MODEL/top_values",
-            context="get_models_by_brand",
-            headers=headers,
-            json=payload
-        )
+        endpoint: str = f"/catalog_domains/{domain_id}/attributes/MODEL/top_values"
         
-        return response
+        # Read-only POST: the payload is part of the cache key and there's no ETag to revalidate.
+        return self.cache.fetch(
+            key=f"POST {endpoint} {json.dumps(payload, sort_keys=True)}",
+            ttl=self.cache.config.ttl_top_values,
+            request=lambda etag: self.client.post(
+                endpoint=endpoint,
+                context="get_models_by_brand",
+                headers=headers,
+                json=payload
+            )
+        )
     
     def get_models_by_brand(
             self,
@@ -80,7 +92,6 @@ class CatalogDomainsRequests:
         }]
         
         return self.get_models(
-            self, 
             access_token=access_token, 
             known_attributes=known_attributes, 
             domain_id=domain_id
@@ -1,12 +1,20 @@
 """ Category requests. """
 
+from typing import Optional
+
 from src.infra.api.mercadolivre.client import MLBaseClient
-from src.infra.api.mercadolivre.models import MeliResponse
+from src.infra.api.mercadolivre.models import MeliResponse, MeliContext
+from src.infra.api.mercadolivre.reference_cache import ReferenceCache, shared_reference_cache
 
 
 class CategoryRequests:
-    def __init__(self):
+    def __init__(self, cache: Optional[ReferenceCache] = None):
+        """
+        Args:
+            cache (ReferenceCache, optional): Custom reference cache. Default: the process-wide cache.
+        """
         self.client = MLBaseClient()
+        self.cache = cache or shared_reference_cache()
     
     def get_root_categories(self, access_token: str, site_id: str = "MLB") -> MeliResponse:
         """
@@ -14,15 +22,12 @@ class CategoryRequests:
         Args:
             access_token (str): Access token to get the categories root types.
         """
-        headers: dict[str, str] = {"Authorization": f"Bearer {access_token}"}
-        
-        response: MeliResponse = self.client.get(
+        return self.__cached_get(
             endpoint=f"/sites/{site_id}/categories",
             context="category_root_types",
-            headers=headers
+            access_token=access_token,
+            ttl=self.cache.config.ttl_root_categories
         )
-        
-        return response
     
     def get_category_data(self, category_id: str, access_token: str) -> MeliResponse:
         """
@@ -31,15 +36,12 @@ class CategoryRequests:
             category_id (str): The category ID. Ex.: "MLB47113".
             access_token (str): Access token to get the category data.
         """
-        headers: dict[str, str] = {"Authorization": f"Bearer {access_token}"}
-        
-        response: MeliResponse = self.client.get(
+        return self.__cached_get(
             endpoint=f"/categories/{category_id}",
             context="category_data",
-            headers=headers
+            access_token=access_token,
+            ttl=self.cache.config.ttl_category
         )
-        
-        return response
     
     def get_category_attributes(self, category_id: str, access_token: str) -> MeliResponse:
         """
@@ -48,12 +50,40 @@ class CategoryRequests:
             category_id str: The category ID. Ex.: "MLB47113"
             access_token str: Access token to get the category attributes.
         """
+        return self.__cached_get(
+            endpoint=f"/categories/{category_id}/attributes",
+            context="category_attributes",
+            access_token=access_token,
+            ttl=self.cache.config.ttl_attributes
+        )
+    
+    def get_categories_dump(self, access_token: str, site_id: str = "MLB") -> MeliResponse:
+        """
+        Get the full category tree of a site (every category with its `path_from_root`, `children_categories`
+        and `settings`). Heavy request, used to build the local category tree.
+        Args:
+            access_token (str): Access token to get the categories.
+            site_id (str): Site ID.
+        """
         headers: dict[str, str] = {"Authorization": f"Bearer {access_token}"}
         
         response: MeliResponse = self.client.get(
-            endpoint=f"/categories/{category_id}/attributes",
-            context="category_attributes",
+            endpoint=f"/sites/{site_id}/categories/all",
+            context="category_dump",
             headers=headers
         )
         
         return response
+    
+    def __cached_get(self, endpoint: str, context: MeliContext, access_token: str, ttl: int) -> MeliResponse:
+        """
+        GET through the reference cache. The category data is the same for every seller, so the cache
+        key is only the endpoint.
+        """
+        def request(etag: Optional[str]) -> MeliResponse:
+            headers: dict[str, str] = {"Authorization": f"Bearer {access_token}"}
+            if etag:
+                headers["If-None-Match"] = etag
+            return self.client.get(endpoint=endpoint, context=context, headers=headers)
+        
+        return self.cache.fetch(endpoint, ttl, request)
@@ -1,28 +1,116 @@
 """ Client interface for Mercado Libre API """
 
+import gzip
+import json
+import time
+import threading
 import requests
-from typing import Any
+from typing import Any, Optional
 from decimal import Decimal
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError, ConnectTimeoutError
 
-from .models import MeliErrorDetail, MeliResponse, MeliContext
+from src.core import log
+from src.config import AppConfigManager, HttpConfig
+from .models import MeliErrorDetail, MeliResponse, MeliContext, DEADLINE_EXCEEDED_CODE, TIMEOUT_CODE
+from .rate_limit import RateLimiter, shared_rate_limiter, parse_retry_after, backoff_delay
+from .coalescing import RequestCoalescer, shared_coalescer
+from .timeouts import (
+    DeadlineExceeded,
+    request_timeout,
+    remaining_time,
+    is_idempotent,
+    IDEMPOTENT_METHODS,
+    mark_retryable,
+    mark_committed
+)
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+def build_session(http_config: HttpConfig) -> requests.Session:
+    """
+    Creates a session with retries and a connection pool sized by `http_config`.
+    Args:
+        http_config (HttpConfig): Pool sizes.
+    """
+    session = requests.Session()
+    # Read timeouts are never repeated here (read=False): the request may already have been processed,
+    # and each attempt would get a fresh read timeout past the operation deadline. Status retries only
+    # repeat idempotent methods, so a 5xx on POST /items can't publish the same item twice.
+    retry = Retry(
+        total=3,
+        read=False,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 504),
+        allowed_methods=IDEMPOTENT_METHODS
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=http_config.pool_connections,
+        pool_maxsize=http_config.pool_maxsize
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def wrapped_timeout(exc: Exception) -> Optional[Exception]:
+    """
+    Returns the urllib3 timeout behind a `requests.ConnectionError` raised once the retries ran out.
+    Args:
+        exc (Exception): Exception raised by the session.
+    """
+    reason = exc.args[0] if exc.args else None
+    if isinstance(reason, MaxRetryError) and isinstance(reason.reason, (ReadTimeoutError, ConnectTimeoutError)):
+        return reason.reason
+    return None
+
+def shared_session() -> requests.Session:
+    """
+    Process-wide session reused by every Mercado Libre client, so the keep-alive connections
+    (and their TLS handshakes) are shared instead of one pool per request class.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = build_session(AppConfigManager().load_http_config())
+        return _shared_session
 
 
 class MLBaseClient:
     BASE_URL: str = "https://api.mercadolibre.com"
     
-    def __init__(self):
-        self.session = requests.Session()
-        retry = Retry(
-            total=3,
-            backoff_factor=0.3,
-            status_forcelist=(500, 502, 504),
-            allowed_methods=["GET", "POST", "PUT", "DELETE"]
-        )
-        self.session.mount('https://', HTTPAdapter(max_retries=retry))
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None
+    ):
+        """
+        Args:
+            session (requests.Session, optional): Custom session. Default: the process-wide shared session.
+            rate_limiter (RateLimiter, optional): Custom limiter. Default: the process-wide limiter.
+            coalescer (RequestCoalescer, optional): Custom GET coalescer. Default: the process-wide coalescer.
+        """
+        self.session = session or shared_session()
+        self.rate_limiter = rate_limiter or shared_rate_limiter()
+        self.coalescer = coalescer or shared_coalescer()
     
     def request(self, method: str, endpoint: str, context: MeliContext, **kwargs) -> MeliResponse:
+        if method.upper() == "GET":
+            # Identical GETs (same endpoint, params and seller) share a single request.
+            headers: dict = kwargs.get("headers") or {}
+            key = self.coalescer.key(endpoint, kwargs.get("params"), self.__access_token(headers), headers.get("If-None-Match"))
+            return self.coalescer.run(key, lambda: self.__request(method, endpoint, context, **kwargs))
+        
+        try:
+            return self.__request(method, endpoint, context, **kwargs)
+        finally:
+            self.coalescer.invalidate(endpoint, self.__access_token(kwargs.get("headers")))
+    
+    def __request(self, method: str, endpoint: str, context: MeliContext, **kwargs) -> MeliResponse:
         url: str = f"{self.BASE_URL}{endpoint}"
         response = None
         
@@ -30,13 +118,20 @@ class MLBaseClient:
             kwargs["json"] = self.__convert_decimals(kwargs["json"])
         
         try:
-            response = self.session.request(method.upper(), url, **kwargs)
+            response = self.__send(method.upper(), url, endpoint, context, **kwargs)
             response.raise_for_status()
             
+            if not is_idempotent(method, context):
+                mark_committed()
+            
+            if response.status_code == 304: # Conditional GET: the cached data is still valid.
+                return MeliResponse(success=True, http_status=304, etag=response.headers.get("ETag"))
+            
             return MeliResponse(
                 success=True,
-                data=response.json(),
-                http_status=response.status_code
+                data=self.__json(response),
+                http_status=response.status_code,
+                etag=response.headers.get("ETag")
             )
             
         except requests.HTTPError as exc:
@@ -67,8 +162,28 @@ class MLBaseClient:
             
             return http_error
         
+        except DeadlineExceeded as exc:
+            # Prazo da operação esgotado: a requisição nem foi enviada.
+            mark_retryable()
+            return MeliResponse(
+                success=False,
+                error=MeliErrorDetail(
+                    message="Prazo da operação esgotado",
+                    context=context,
+                    code=DEADLINE_EXCEEDED_CODE,
+                    exception=exc,
+                    retryable=True
+                )
+            )
+        
+        except requests.Timeout as exc:
+            return self.__timeout_error(exc, method, endpoint, context)
+        
         except requests.RequestException as exc:
-            # Erros de conexão, timeout, etc
+            # O urllib3 embrulha timeouts em MaxRetryError (ConnectionError) quando esgota as tentativas.
+            if wrapped_timeout(exc):
+                return self.__timeout_error(exc, method, endpoint, context)
+            # Erros de conexão, etc
             return MeliResponse(
                 success=False,
                 error=MeliErrorDetail(
@@ -93,6 +208,31 @@ class MLBaseClient:
                 )
             )
     
+    def __timeout_error(self, exc: Exception, method: str, endpoint: str, context: MeliContext) -> MeliResponse:
+        """
+        Builds the timeout response, flagging the deadline as retryable only when repeating is safe.
+        Args:
+            exc (Exception): Timeout raised by requests.
+            method (str): HTTP method.
+            endpoint (str): Requested endpoint.
+            context (MeliContext): Request context.
+        """
+        # Connect timeout: a requisição não chegou ao servidor. Read timeout: só é seguro repetir requisições idempotentes.
+        connect_timeout: bool = isinstance(exc, requests.ConnectTimeout) or isinstance(wrapped_timeout(exc), ConnectTimeoutError)
+        retryable: bool = connect_timeout or is_idempotent(method, context)
+        if retryable:
+            mark_retryable()
+        return MeliResponse(
+            success=False,
+            error=MeliErrorDetail(
+                message=f"Tempo limite da requisição esgotado ({method.upper()} {endpoint})",
+                context=context,
+                code=TIMEOUT_CODE,
+                exception=exc,
+                retryable=retryable
+            )
+        )
+    
     def get(self, endpoint: str, context: MeliContext, **kwargs):
         return self.request("GET", endpoint, context, **kwargs)
     
@@ -106,6 +246,53 @@ class MLBaseClient:
         return self.request("DELETE", endpoint, context, **kwargs)
     
     
+    def __send(self, method: str, url: str, endpoint: str, context: MeliContext, **kwargs) -> requests.Response:
+        """
+        Sends the request inside the seller rate limit and the current operation deadline.
+        HTTP 429 responses reduce the seller rate and are retried after the Retry-After header
+        (or an exponential backoff with jitter when it's absent).
+        Raises:
+            DeadlineExceeded: If the deadline expires before the request can be sent.
+        """
+        access_token: Optional[str] = self.__access_token(kwargs.get("headers"))
+        custom_timeout: bool = "timeout" in kwargs
+        attempt: int = 0
+        
+        while True:
+            bucket = self.rate_limiter.acquire(access_token, endpoint, max_wait=remaining_time())
+            if not custom_timeout:
+                kwargs["timeout"] = request_timeout(context)
+            response = self.session.request(method, url, **kwargs)
+            
+            if response.status_code != 429:
+                bucket.succeeded()
+                return response
+            
+            retry_after: Optional[float] = parse_retry_after(response.headers.get("Retry-After"))
+            bucket.throttled(retry_after) # With Retry-After, the next acquire waits for it.
+            if attempt >= self.rate_limiter.throttle_retries:
+                return response
+            
+            log.dev.warning(f"HTTP 429 em {method} {endpoint}. Nova tentativa ({attempt + 1}/{self.rate_limiter.throttle_retries}).")
+            if retry_after is None:
+                delay: float = backoff_delay(attempt)
+                remaining: Optional[float] = remaining_time()
+                if remaining is not None and delay > remaining:
+                    raise DeadlineExceeded("Prazo da operação esgotado durante a espera do limite de requisições (HTTP 429).")
+                time.sleep(delay)
+            attempt += 1
+    
+    def __access_token(self, headers: Optional[dict]) -> Optional[str]:
+        """ Extracts the seller token from the Authorization header. """
+        authorization: str = (headers or {}).get("Authorization", "")
+        return authorization.removeprefix("Bearer ").strip() or None
+    
+    def __json(self, response: requests.Response) -> Any:
+        """ Decodes the response body, including gzip files (Ex.: /sites/MLB/categories/all). """
+        if response.content[:2] == b"\x1f\x8b":
+            return json.loads(gzip.decompress(response.content))
+        return response.json()
+    
     def __get_error_code(self, response: requests.Response) -> int:
         """Extrai código de erro da resposta da API"""
         try:
@@ -0,0 +1,179 @@
+""" Single-flight coalescing of identical Mercado Libre GET requests. """
+
+import copy
+import pickle
+import time
+import threading
+from dataclasses import replace
+from typing import Callable, Hashable, Optional
+
+from src.config import AppConfigManager
+from .models import MeliResponse
+from .rate_limit import RateLimiter, auth_scope
+from .timeouts import DeadlineExceeded, remaining_time
+
+
+class _Call:
+    """ A request in flight (or recently finished) shared by every identical caller. """
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[MeliResponse] = None
+        self.finished_at: float = 0.0
+        self.waiters: int = 0 # Callers that joined the request instead of sending their own.
+        self.frozen: Optional[bytes] = None # Pickled data of a shared successful response.
+
+
+class RequestCoalescer:
+    """
+    Shares the response of identical GET requests (same endpoint, params and seller token).
+    
+    - While a request is in flight, identical callers wait for it instead of sending their own.
+    - A successful response is reused for `ttl` seconds. Errors are only shared with the callers that
+      were already waiting, and retryable errors (timeouts, expired deadlines) are never shared, since
+      they depend on the deadline of the caller that sent the request.
+    - The caller that sent the request gets the response as is. The data is only copied for the callers
+      that share it, from a pickled snapshot taken when the response arrives (much cheaper than a
+      `deepcopy` of a big response, like the categories dump), and only if it's awaited or reused.
+    - A request with side effects (POST/PUT/DELETE) discards the responses of its endpoint family and
+      seller, so a GET made right after an edition never returns the previous state.
+    
+    Ex.: several products of a batch sharing a category make a single GET /categories/{id}.
+    """
+    def __init__(self, ttl: float = 2.0, max_entries: int = 2048) -> None:
+        """
+        Args:
+            ttl (float): Seconds a successful response is reused. 0 disables the reuse after completion.
+            max_entries (int): Max finished responses kept in memory.
+        """
+        self.ttl = max(ttl, 0.0)
+        self.max_entries = max_entries
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(
+        endpoint: str,
+        params: Optional[object] = None,
+        access_token: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> Hashable:
+        """
+        Identity of a GET request.
+        Args:
+            endpoint (str): Request endpoint. Ex.: "/categories/MLB1747".
+            params (dict | list, optional): Query string params.
+            access_token (str, optional): Seller token (only a short hash of it is kept).
+            etag (str, optional): If-None-Match of a conditional GET.
+        """
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        return (endpoint, repr(params) if params else "", auth_scope(access_token), etag or "")
+    
+    def run(self, key: Hashable, perform: Callable[[], MeliResponse]) -> MeliResponse:
+        """
+        Sends the request, or joins an identical one that is in flight or was just completed.
+        Args:
+            key (Hashable): Request identity. See `key`.
+            perform (Callable[[], MeliResponse]): Sends the request.
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            call: Optional[_Call] = self._calls.get(key)
+            leader: bool = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+        
+        if leader:
+            return self._lead(key, call, perform)
+        
+        try:
+            remaining: Optional[float] = remaining_time()
+        except DeadlineExceeded:
+            return perform() # Returns the deadline error of this caller.
+        
+        if not call.done.wait(timeout=remaining):
+            return perform()
+        
+        result: Optional[MeliResponse] = call.result
+        if result is None or (not result.success and result.error and result.error.retryable):
+            return perform()
+        return self._share(call)
+    
+    def invalidate(self, endpoint: str, access_token: Optional[str] = None) -> None:
+        """
+        Discards the shared responses of the endpoint family and seller.
+        Args:
+            endpoint (str): Endpoint of the request with side effects. Ex.: "/items/MLB123".
+            access_token (str, optional): Seller token.
+        """
+        family: str = RateLimiter.endpoint_family(endpoint)
+        scope: str = auth_scope(access_token)
+        with self._lock:
+            for key in [key for key in self._calls if RateLimiter.endpoint_family(key[0]) == family and key[2] == scope]:
+                del self._calls[key]
+    
+    def _lead(self, key: Hashable, call: _Call, perform: Callable[[], MeliResponse]) -> MeliResponse:
+        result: Optional[MeliResponse] = None
+        try:
+            result = perform()
+            return result
+        finally:
+            reusable: bool = bool(self.ttl and result and result.success)
+            with self._lock:
+                shared: bool = reusable or call.waiters > 0
+                if not reusable and self._calls.get(key) is call:
+                    del self._calls[key] # Nobody else joins it from now on.
+            call.result = result
+            if shared and result is not None and result.success:
+                self._freeze(call) # Before the caller gets (and maybe changes) the data.
+            call.finished_at = time.monotonic()
+            call.done.set()
+    
+    def _evict(self, now: float) -> None:
+        """ Drops the expired responses (and the oldest ones above `max_entries`). Caller holds the lock. """
+        finished: list[tuple[float, Hashable]] = []
+        for key, call in list(self._calls.items()):
+            if not call.done.is_set():
+                continue
+            if now - call.finished_at > self.ttl:
+                del self._calls[key]
+            else:
+                finished.append((call.finished_at, key))
+        
+        if len(finished) > self.max_entries:
+            for _, key in sorted(finished)[:len(finished) - self.max_entries]:
+                del self._calls[key]
+    
+    @staticmethod
+    def _freeze(call: _Call) -> None:
+        """ Keeps a snapshot of the response data for the callers sharing it. """
+        try:
+            call.frozen = pickle.dumps(call.result.data, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            call.result = replace(call.result, data=copy.deepcopy(call.result.data)) # Ex.: a non picklable object.
+    
+    @staticmethod
+    def _share(call: _Call) -> MeliResponse:
+        """ Copies the shared response data, so a caller changing it doesn't affect the others. """
+        result: MeliResponse = call.result
+        if not result.success:
+            return result
+        if call.frozen is not None:
+            return replace(result, data=pickle.loads(call.frozen))
+        return replace(result, data=copy.deepcopy(result.data))
+
+
+_shared_coalescer: Optional[RequestCoalescer] = None
+_shared_coalescer_lock = threading.Lock()
+
+def shared_coalescer() -> RequestCoalescer:
+    """ Process-wide coalescer, so identical requests of every client and worker are shared. """
+    global _shared_coalescer
+    with _shared_coalescer_lock:
+        if _shared_coalescer is None:
+            http_config = AppConfigManager().load_http_config()
+            _shared_coalescer = RequestCoalescer(ttl=http_config.coalesce_ttl)
+        return _shared_coalescer
@@ -3,7 +3,8 @@
 import requests
 
 from .client import MLBaseClient
-from .models import MeliResponse, MeliErrorDetail
+from .models import MeliResponse, MeliErrorDetail, TIMEOUT_CODE
+from .timeouts import DeadlineExceeded, request_timeout, mark_retryable
 
 
 class MeliImageManager:
@@ -23,9 +24,26 @@ class MeliImageManager:
             }
             
             try:
-                image_data_response: requests.Response = requests.get(image_url)
+                image_data_response: requests.Response = self.client.session.get(
+                    image_url, 
+                    timeout=request_timeout("image_upload")
+                )
                 image_data_response.raise_for_status()
+            except (requests.Timeout, DeadlineExceeded) as e:
+                mark_retryable()
+                return MeliResponse(
+                    success=False,
+                    data=None,
+                    error=MeliErrorDetail(
+                        message=f"Tempo limite esgotado ao obter os dados da url {image_url}",
+                        context="image_upload",
+                        code=TIMEOUT_CODE,
+                        exception=str(e),
+                        retryable=True
+                    )
+                )
             except requests.RequestException as e:
+                http_status: int | None = e.response.status_code if e.response is not None else None
                 return MeliResponse(
                     success=False,
                     data=None,
@@ -33,10 +51,10 @@ class MeliImageManager:
                         message=f"Falha durante a requisição para obter os dados da url {image_url}",
                         context="image_upload",
                         code=89,
-                        http_status=image_data_response.status_code,
+                        http_status=http_status,
                         exception=str(e)
                     ),
-                    http_status=image_data_response.status_code
+                    http_status=http_status
                 )
             
             files = {'file': (image_url.split('/')[-1], image_data_response.content, 'image/jpeg')}
@@ -6,24 +6,28 @@ from typing import Optional, Any, Literal
 
 MeliContext = Literal[
     "RequestException",
-    "UnspectedException"
+    "UnspectedException",
     "auth",
     "category_root_types",
     "category_data",
     "category_attributes",
+    "category_dump",
     "image_upload",
     "item_publication",
     "item_description",
     "item_editation",
     "items_listing",
     "get_item_info",
-    "get_items_info"
-    "item_add_compatibilities"
+    "get_items_info",
+    "item_add_compatibilities",
     "get_models_by_brand",
     "get_compatibilities",
     "get_category_by_item_name"
 ]
 
+DEADLINE_EXCEEDED_CODE: int = 1004 # Operation deadline expired before the request.
+TIMEOUT_CODE: int = 1005 # Connect/read timeout.
+
 
 @dataclass
 class MeliErrorDetail:
@@ -34,6 +38,7 @@ class MeliErrorDetail:
     http_status: Optional[int] = None
     exception: Optional[Exception] = None
     details: Optional[str] = None
+    retryable: bool = False # The request can be repeated later (Ex.: timeout before any side effect).
 
 @dataclass
 class MeliResponse:
@@ -42,5 +47,6 @@ class MeliResponse:
     data: Optional[Any] = None
     error: Optional[MeliErrorDetail] = None
     http_status: Optional[int] = None
+    etag: Optional[str] = None # ETag header of successful GETs (used to revalidate cached responses).
 
 class MeliRequestFail(Exception):...
\ No newline at end of file
@@ -0,0 +1,200 @@
+""" Client side rate limiter for Mercado Libre API requests. """
+
+import time
+import random
+import hashlib
+import threading
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from src.core import log
+from src.config import AppConfigManager
+from .timeouts import DeadlineExceeded
+
+
+class TokenBucket:
+    """
+    Token bucket with an adaptive rate (AIMD).
+    
+    - Each request takes a token. Tokens are refilled at `rate` per second up to `capacity` (burst).
+    - A 429 halves the rate (multiplicative decrease) and may block the bucket until the Retry-After.
+    - Each success gives back a small part of the rate (additive increase) until `max_rate`.
+    """
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        min_rate: float = 0.2,
+        increase: float = 0.1,
+        decrease: float = 0.5
+    ) -> None:
+        """
+        Args:
+            rate (float): Initial and max requests per second.
+            capacity (int): Max tokens (burst).
+            min_rate (float): The rate never goes below this value.
+            increase (float): Rate added on each success.
+            decrease (float): Rate multiplier applied on each 429.
+        """
+        self.max_rate = max(rate, min_rate)
+        self.rate = self.max_rate
+        self.capacity = max(capacity, 1)
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens: float = float(self.capacity)
+        self._updated_at: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Takes a token.
+        Returns:
+            float: Seconds the caller must wait before sending the request.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait: float = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+    
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Registers a 429 response.
+        Args:
+            retry_after (float, optional): Seconds informed by the Retry-After header.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.rate * self.decrease, self.min_rate)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+    
+    def succeeded(self) -> None:
+        """ Registers a non throttled response. """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.rate + self.increase, self.max_rate)
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._tokens + (now - self._updated_at) * self.rate, self.capacity)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """
+    Keeps a TokenBucket for each seller access token and endpoint family.
+    Ex.: the same seller has separated limits for "/items" and "/categories".
+    
+    The tokens are never stored, only a short hash of them.
+    """
+    def __init__(self, rate: float = 10.0, burst: int = 20, throttle_retries: int = 4, max_buckets: int = 1024) -> None:
+        """
+        Args:
+            rate (float): Requests per second of each bucket.
+            burst (int): Bucket capacity.
+            throttle_retries (int): Max retries of a request answered with HTTP 429.
+            max_buckets (int): Max buckets kept in memory (the least used ones are discarded).
+        """
+        self.rate = rate
+        self.burst = burst
+        self.throttle_retries = max(throttle_retries, 0)
+        self.max_buckets = max_buckets
+        self._buckets: OrderedDict[tuple[str, str], TokenBucket] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def acquire(self, access_token: Optional[str], endpoint: str, max_wait: Optional[float] = None) -> TokenBucket:
+        """
+        Waits until the request can be sent.
+        Args:
+            access_token (str, optional): Seller access token (None for public endpoints).
+            endpoint (str): Request endpoint. Ex.: "/items/MLB123".
+            max_wait (float, optional): Max seconds to wait (Ex.: time left on the operation deadline).
+        Returns:
+            TokenBucket: Bucket used, to register the response.
+        Raises:
+            DeadlineExceeded: If the wait would exceed `max_wait`.
+        """
+        bucket: TokenBucket = self.bucket(access_token, endpoint)
+        wait: float = bucket.reserve()
+        if max_wait is not None and wait > max_wait:
+            raise DeadlineExceeded(f"Limite de requisições exigiria aguardar {wait:.1f}s, além do prazo da operação.")
+        if wait > 0:
+            time.sleep(wait)
+        return bucket
+    
+    def bucket(self, access_token: Optional[str], endpoint: str) -> TokenBucket:
+        key: tuple[str, str] = (auth_scope(access_token), self.endpoint_family(endpoint))
+        with self._lock:
+            bucket: Optional[TokenBucket] = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate=self.rate, capacity=self.burst)
+                self._buckets[key] = bucket
+                if len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket
+    
+    @staticmethod
+    def endpoint_family(endpoint: str) -> str:
+        """ First endpoint segment. Ex.: "/items/MLB123/description" -> "items". """
+        return endpoint.strip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+def auth_scope(access_token: Optional[str]) -> str:
+    """ Short hash identifying a seller token (the token itself is never kept). """
+    if not access_token:
+        return "public"
+    return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Reads a Retry-After header (seconds or HTTP date).
+    Returns:
+        float: Seconds to wait. None if the header is absent or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        log.dev.warning(f"Cabeçalho Retry-After inválido: {value}")
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 0.5, ceiling: float = 30.0) -> float:
+    """
+    Exponential backoff with full jitter.
+    Args:
+        attempt (int): Attempt number, starting at 0.
+    """
+    return random.uniform(0, min(ceiling, base * 2 ** min(attempt, 16)))
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+def shared_rate_limiter() -> RateLimiter:
+    """ Process-wide limiter, so every client respects the same seller quotas. """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            http_config = AppConfigManager().load_http_config()
+            _shared_limiter = RateLimiter(
+                rate=http_config.rate_limit,
+                burst=http_config.rate_burst,
+                throttle_retries=http_config.throttle_retries
+            )
+        return _shared_limiter
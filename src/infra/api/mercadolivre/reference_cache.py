@@ -0,0 +1,181 @@
+""" Persistent cache of Mercado Libre reference data (categories, attributes, catalog top values). """
+
+import json
+import time
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from src.core import log
+from src.config import AppConfigManager, ReferenceCacheConfig
+from .models import MeliResponse
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    data: Any
+    etag: Optional[str]
+    expires_at: float # time.time() reference, shared by every process.
+    
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class ReferenceCache:
+    """
+    SQLite cache of reference GETs, shared by every bot process (and kept across restarts).
+    
+    - Fresh entries (inside the resource TTL) are returned without any request.
+    - Expired entries are revalidated with If-None-Match: a 304 renews the TTL without downloading the data again.
+    - If the revalidation fails by a transient error (network, 429, 5xx), the expired data is used.
+    - The least recently used entries are discarded above `max_entries` or `max_mb`.
+    
+    Cache failures (locked or corrupted file...) are logged and the request is sent normally.
+    """
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS reference_data (
+            key TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            etag TEXT,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    """
+    TOUCH_INTERVAL: float = 60.0 # Min seconds between two accessed_at updates of the same entry.
+    
+    def __init__(self, config: ReferenceCacheConfig) -> None:
+        """
+        Args:
+            config (ReferenceCacheConfig): File path, size limits and TTLs. An empty path disables the cache.
+        """
+        self.config = config
+        self.enabled: bool = bool(config.path)
+        self.max_bytes: int = config.max_mb * 1024 * 1024
+        self._local = threading.local()
+    
+    def fetch(self, key: str, ttl: int, request: Callable[[Optional[str]], MeliResponse]) -> MeliResponse:
+        """
+        Returns the cached data or sends the request.
+        Args:
+            key (str): Resource identity. Ex.: "/categories/MLB1747".
+            ttl (int): Seconds the response is used without revalidation.
+            request (Callable[[Optional[str]], MeliResponse]): Sends the request. Receives the ETag to be
+                sent as If-None-Match (None when there's nothing to revalidate).
+        """
+        if not self.enabled:
+            return request(None)
+        
+        entry: Optional[CacheEntry] = self.lookup(key)
+        if entry and entry.fresh:
+            return MeliResponse(success=True, data=entry.data, http_status=200, etag=entry.etag)
+        
+        response: MeliResponse = request(entry.etag if entry else None)
+        
+        if response.success and response.http_status == 304 and entry:
+            self.refresh(key, ttl)
+            return MeliResponse(success=True, data=entry.data, http_status=200, etag=entry.etag)
+        
+        if response.success:
+            self.store(key, response.data, response.etag, ttl)
+            return response
+        
+        if entry and self._transient(response):
+            log.dev.warning(f"Falha ao revalidar {key} ({response.error.message}). Usando os dados expirados do cache.")
+            return MeliResponse(success=True, data=entry.data, http_status=200, etag=entry.etag)
+        
+        return response
+    
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """ Reads an entry, fresh or expired. """
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT data, etag, expires_at, accessed_at FROM reference_data WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            data, etag, expires_at, accessed_at = row
+            now: float = time.time()
+            if now - accessed_at > self.TOUCH_INTERVAL:
+                connection.execute("UPDATE reference_data SET accessed_at = ? WHERE key = ?", (now, key))
+            return CacheEntry(data=json.loads(data), etag=etag, expires_at=expires_at)
+        except (sqlite3.Error, ValueError) as e:
+            log.dev.warning(f"Falha na leitura do cache de referências ({key}): {e}")
+            return None
+    
+    def store(self, key: str, data: Any, etag: Optional[str], ttl: int) -> None:
+        """ Saves (or replaces) an entry and discards the least used ones above the limits. """
+        try:
+            text: str = json.dumps(data, ensure_ascii=False)
+            now: float = time.time()
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO reference_data (key, data, etag, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, text, etag, len(text), now + ttl, now)
+            )
+            self._evict(connection)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            log.dev.warning(f"Falha na gravação do cache de referências ({key}): {e}")
+    
+    def refresh(self, key: str, ttl: int) -> None:
+        """ Renews the TTL of a revalidated entry (HTTP 304). """
+        try:
+            now: float = time.time()
+            self._connection().execute(
+                "UPDATE reference_data SET expires_at = ?, accessed_at = ? WHERE key = ?", (now + ttl, now, key)
+            )
+        except sqlite3.Error as e:
+            log.dev.warning(f"Falha na atualização do cache de referências ({key}): {e}")
+    
+    def clear(self) -> None:
+        try:
+            self._connection().execute("DELETE FROM reference_data")
+        except sqlite3.Error as e:
+            log.dev.warning(f"Falha na limpeza do cache de referências: {e}")
+    
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        count, total = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM reference_data").fetchone()
+        if count <= self.config.max_entries and total <= self.max_bytes:
+            return
+        
+        discarded: list[tuple[str]] = []
+        for key, size in connection.execute("SELECT key, size FROM reference_data ORDER BY accessed_at").fetchall():
+            if count <= self.config.max_entries and total <= self.max_bytes:
+                break
+            discarded.append((key,))
+            count -= 1
+            total -= size
+        connection.executemany("DELETE FROM reference_data WHERE key = ?", discarded)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """ One connection per thread (sqlite3 connections can't be shared between threads). """
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.config.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL") # Readers don't block the writer of other processes.
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(self.SCHEMA)
+            self._local.connection = connection
+        return connection
+    
+    @staticmethod
+    def _transient(response: MeliResponse) -> bool:
+        """ Errors that don't mean the resource changed (Ex.: a 404 means the category no longer exists). """
+        return response.http_status is None or response.http_status == 429 or response.http_status >= 500
+
+
+_shared_cache: Optional[ReferenceCache] = None
+_shared_cache_lock = threading.Lock()
+
+def shared_reference_cache() -> ReferenceCache:
+    """ Process-wide reference cache. """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ReferenceCache(AppConfigManager().load_reference_cache_config())
+        return _shared_cache
@@ -0,0 +1,153 @@
+""" Request timeouts and operation deadlines for Mercado Libre requests. """
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from .models import MeliContext
+
+
+Timeout = tuple[float, float] # (connect, read) seconds.
+
+DEFAULT_TIMEOUT: Timeout = (3.05, 20.0)
+CONTEXT_TIMEOUTS: dict[MeliContext, Timeout] = {
+    "auth": (3.05, 10.0),
+    "image_upload": (3.05, 60.0),
+    "item_publication": (3.05, 45.0),
+    "item_description": (3.05, 30.0),
+    "item_editation": (3.05, 30.0),
+    "items_listing": (3.05, 30.0),
+    "get_items_info": (3.05, 30.0),
+    "get_item_info": (3.05, 15.0),
+    "category_root_types": (3.05, 15.0),
+    "category_data": (3.05, 15.0),
+    "category_attributes": (3.05, 15.0),
+    "category_dump": (3.05, 300.0), # Full site category tree (tens of MB).
+    "get_category_by_item_name": (3.05, 15.0)
+}
+
+# Methods that can be repeated without side effects on the seller account.
+IDEMPOTENT_METHODS: frozenset[str] = frozenset({"GET", "PUT", "DELETE"})
+
+# Contexts whose POST can be repeated without side effects on the seller account.
+IDEMPOTENT_CONTEXTS: frozenset[str] = frozenset({"auth", "image_upload"})
+
+
+class DeadlineExceeded(Exception):
+    """ The operation deadline expired before the request could be sent. """
+
+
+@dataclass
+class Deadline:
+    """ Time limit of an operation (Ex.: a publication) shared by every request made inside it. """
+    expires_at: float # time.monotonic() reference.
+    retryable: bool = False # A request was cut short or timed out and can be safely repeated.
+    committed: bool = False # A request with side effects succeeded (Ex.: the item was published).
+    
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+    
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("meli_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """
+    Limits the time of every Mercado Libre request made inside the block (payload generators,
+    request classes, async clients...), without passing the deadline through each signature.
+    A nested scope never extends the outer one.
+    Args:
+        seconds (float, optional): Operation time limit. None (or 0) disables the deadline.
+    Example:
+        >>> with deadline_scope(60) as deadline:
+        ...     publication.publish(line, token)
+        >>> if deadline.retryable and not deadline.committed:
+        ...     repo.update.log_retry(line.id, "Prazo esgotado")
+    """
+    if not seconds:
+        yield _current_deadline.get()
+        return
+    
+    parent: Optional[Deadline] = _current_deadline.get()
+    expires_at: float = time.monotonic() + seconds
+    if parent:
+        expires_at = min(expires_at, parent.expires_at)
+    
+    deadline = Deadline(expires_at=expires_at)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+        if parent:
+            parent.retryable = parent.retryable or deadline.retryable
+            parent.committed = parent.committed or deadline.committed
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """
+    Runs the block without the current deadline. Used by compensation steps that must run
+    even after the deadline expired (Ex.: reactivating a paused product).
+    """
+    token = _current_deadline.set(None)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Seconds left on the current deadline (None without deadline).
+    Raises:
+        DeadlineExceeded: If the deadline already expired.
+    """
+    deadline: Optional[Deadline] = _current_deadline.get()
+    if deadline is None:
+        return None
+    remaining: float = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded("Prazo da operação esgotado antes do envio da requisição.")
+    return remaining
+
+
+def request_timeout(context: Optional[MeliContext]) -> Timeout:
+    """
+    Connect/read timeouts of a request, limited by the current deadline.
+    Raises:
+        DeadlineExceeded: If the deadline already expired.
+    """
+    connect, read = CONTEXT_TIMEOUTS.get(context, DEFAULT_TIMEOUT)
+    remaining: Optional[float] = remaining_time()
+    if remaining is None:
+        return (connect, read)
+    return (min(connect, remaining), min(read, remaining))
+
+
+def is_idempotent(method: str, context: Optional[MeliContext]) -> bool:
+    """ Whether the request can be repeated without duplicating side effects. """
+    return method.upper() in IDEMPOTENT_METHODS or context in IDEMPOTENT_CONTEXTS
+
+
+def mark_retryable() -> None:
+    """ Flags the current deadline: a request was cut short and can be repeated. """
+    if deadline := _current_deadline.get():
+        deadline.retryable = True
+
+
+def mark_committed() -> None:
+    """ Flags the current deadline: a request with side effects succeeded. """
+    if deadline := _current_deadline.get():
+        deadline.committed = True
@@ -20,8 +20,9 @@ TypeVars:
 
 
 from typing import TypeVar
+from datetime import datetime
 from dataclasses import dataclass
-from sqlalchemy import Integer, String, Text
+from sqlalchemy import DateTime, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, composite, declared_attr
 
 DataclassTable = TypeVar("DataclassTable") # Represents a dataclass model used for business logic.
@@ -95,6 +96,10 @@ class OrmBaseModel(Base):
     operacao: Mapped[int] = mapped_column(Integer)
     cod_retorno: Mapped[int] = mapped_column(Integer)
     log_erro: Mapped[str] = mapped_column(Text)
+    worker_id: Mapped[str] = mapped_column(String(64), nullable=True) # Worker that claimed the line.
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=True) # When the claimed line started processing.
+    retry_at: Mapped[datetime] = mapped_column(DateTime, nullable=True) # A requeued line isn't claimed before it.
+    attempts: Mapped[int] = mapped_column(Integer, default=0) # Retries in a row (see `log_retry`).
     
     @declared_attr
     def controllers(cls):
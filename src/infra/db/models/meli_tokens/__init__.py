@@ -0,0 +1,14 @@
+""" Models for meli_tokens table. """
+
+from .data_class import MeliTokenDataclass
+from .orm_entity import MeliTokensORM
+from .orm_converter import MeliTokensConverter
+
+__version__ = "v.0.0.0"
+__all__ = [
+    "__version__",
+    
+    "MeliTokensORM",
+    "MeliTokenDataclass",
+    "MeliTokensConverter"
+]
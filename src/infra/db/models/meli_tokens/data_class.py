@@ -0,0 +1,15 @@
+""" Dataclass model for meli_tokens table. """
+
+from datetime import datetime
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class MeliTokenDataclass:
+    client_id: str
+    access_token: str
+    refresh_token: str # Latest refresh token (Mercado Libre rotates it on each refresh).
+    refresh_token_origem: str # Refresh token of the table lines that created this authorization.
+    expira_em: datetime # Access token expiration (timezone aware).
+    user_id: Optional[int] = None
+    scope: Optional[str] = None
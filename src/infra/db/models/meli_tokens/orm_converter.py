@@ -0,0 +1,23 @@
+""" Converter the MeliTokensORM entity to a MeliTokenDataclass object. """
+
+from .orm_entity import MeliTokensORM
+from .data_class import MeliTokenDataclass
+
+class MeliTokensConverter:
+    def orm_convert(self, orm_object: MeliTokensORM) -> MeliTokenDataclass:
+        """
+        Converts a meli_tokens table ORM object into a MeliTokenDataclass.
+        Args:
+            orm_object (MeliTokensORM): meli_tokens table ORM entity.
+        Returns:
+            MeliTokenDataclass: Dataclass with the seller tokens.
+        """
+        return MeliTokenDataclass(
+            client_id=orm_object.client_id,
+            access_token=orm_object.access_token,
+            refresh_token=orm_object.refresh_token,
+            refresh_token_origem=orm_object.refresh_token_origem,
+            expira_em=orm_object.expira_em,
+            user_id=orm_object.user_id,
+            scope=orm_object.scope
+        )
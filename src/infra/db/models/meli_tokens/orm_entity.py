@@ -0,0 +1,25 @@
+""" SQLAlchemy entity for table meli_tokens. """
+
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..bases import Base
+
+
+class MeliTokensORM(Base):
+    """ Access and refresh tokens of each seller, shared by every bot instance. """
+    __tablename__: str = "meli_tokens"
+    
+    client_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    access_token: Mapped[str] = mapped_column(String(256))
+    refresh_token: Mapped[str] = mapped_column(String(256))
+    refresh_token_origem: Mapped[str] = mapped_column(String(256))
+    expira_em: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=True)
+    scope: Mapped[str] = mapped_column(String(256), nullable=True)
+    atualizado_em: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
@@ -1,5 +1,9 @@
 """ Converter the Produtos ORM entity to a Product dataclass object. """
 
+from typing import Any
+
+from sqlalchemy import inspect
+
 from .orm_entity import Produtos
 from .data_class import Product
 
@@ -40,6 +44,10 @@ class ProdutosConverter:
         Returns:
             Product: Converted dataclass to instance.
         """
+        unloaded: set[str] = inspect(orm_obj).unloaded
+        if unloaded:
+            return self.partial_convert(orm_obj, unloaded)
+        
         return Product(
             id=orm_obj.id,
             credentials=orm_obj.credentials,
@@ -54,6 +62,38 @@ class ProdutosConverter:
             produto_atualizado=orm_obj.produto_atualizado,
         )
     
+    def partial_convert(self, orm_obj: Produtos, unloaded: set[str]) -> Product:
+        """
+        Convert a Produtos ORM entity loaded with only some columns (`load_only`).
+        The columns that weren't loaded are None, without loading them one line at a time.
+        
+        Args:
+            orm_obj (Produtos): A Produtos ORM entity with unloaded columns.
+            unloaded (set[str]): Names of the unloaded columns.
+        Returns:
+            Product: Converted dataclass to instance.
+        """
+        def value(name: str) -> Any:
+            return None if name in unloaded else getattr(orm_obj, name)
+        
+        def composite(name: str) -> Any:
+            prop = Produtos.__mapper__.composites[name]
+            return prop.composite_class(*(value(column.key) for column in prop.props))
+        
+        return Product(
+            id=orm_obj.id,
+            credentials=composite("credentials"),
+            controllers=composite("controllers"),
+            identfiers=composite("identfiers"),
+            sale=composite("sale"),
+            shippiment=composite("shippiment"),
+            category=composite("category"),
+            technical=composite("technical"),
+            dimensions=composite("dimensions"),
+            produto_status=value("produto_status"),
+            produto_atualizado=value("produto_atualizado"),
+        )
+    
     def orms_convert(self, orm_objs: list[Produtos]) -> list[Product]:
         """
         Convert a multiple Pordutos ORM entities to Prodcut datclasses.
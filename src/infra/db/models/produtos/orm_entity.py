@@ -1,6 +1,8 @@
 """ SQLAlchemy entity for table produtos """
 
-from sqlalchemy import event, Integer, String, Text, Boolean, Sequence, Numeric
+from datetime import datetime
+
+from sqlalchemy import event, DateTime, Integer, String, Text, Boolean, Sequence, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, composite #DeclarativeBase, 
 from sqlalchemy.schema import CreateSequence
 
@@ -43,6 +45,10 @@ class Produtos(Base):
     operacao: Mapped[int] = mapped_column(Integer)
     cod_retorno: Mapped[int] = mapped_column(Integer)
     log_erro: Mapped[str] = mapped_column(Text)
+    worker_id: Mapped[str] = mapped_column(String(64), nullable=True) # Worker that claimed the line.
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=True) # When the claimed line started processing.
+    retry_at: Mapped[datetime] = mapped_column(DateTime, nullable=True) # A requeued line isn't claimed before it.
+    attempts: Mapped[int] = mapped_column(Integer, default=0) # Retries in a row (see `log_retry`).
     controllers = composite(OperationControllers, 
         "operacao",
         "cod_retorno",
@@ -30,6 +30,8 @@ class ProdutosCategoryORM(OrmBaseModel):
         "titulo_produto"
     )
     
+    origem_categoria: Mapped[str] = mapped_column(String(10)) # See ResultSource.
+    
     cod_produto: Mapped[str] = mapped_column(String(12))
     atualizado: Mapped[str] = mapped_column(CHAR(1), default='N')
     
@@ -0,0 +1,103 @@
+""" Postgres LISTEN/NOTIFY listener used to wake up the main loop when a pending row arrives. """
+
+import select
+from typing import Optional
+
+from src.core import log
+from .database import engine
+
+PENDING_OPERATIONS_CHANNEL: str = "operacoes_pendentes"
+
+
+class PendingOperationsListener:
+    """
+    Keeps a dedicated connection listening a NOTIFY channel.
+    
+    The channel is fed by the `notificar_operacao_pendente` trigger (see "Tables commands.sql"),
+    which sends the table name as payload whenever a row is inserted or updated with `cod_retorno = 0`.
+    """
+    def __init__(self, channel: str = PENDING_OPERATIONS_CHANNEL) -> None:
+        """
+        Args:
+            channel (str): NOTIFY channel name.
+        """
+        self.channel = channel
+        self._connection = None
+    
+    @property
+    def is_listening(self) -> bool:
+        return self._connection is not None
+    
+    def start(self) -> bool:
+        """
+        Opens the listening connection.
+        Returns:
+            bool: True if the connection is listening the channel, else False.
+        """
+        if self.is_listening:
+            return True
+        try:
+            connection = engine.raw_connection()
+            driver_connection = connection.driver_connection
+            driver_connection.autocommit = True
+            with driver_connection.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self.channel}";')
+            self._connection = connection
+            log.dev.info(f"Escutando o canal '{self.channel}' para novas operações pendentes.")
+            return True
+        except Exception as e:
+            log.dev.exception(f"Falha ao escutar o canal '{self.channel}': {e}")
+            self._connection = None
+            return False
+    
+    def wait(self, timeout: float) -> Optional[set[str]]:
+        """
+        Blocks until a notification arrives or the timeout expires.
+        Args:
+            timeout (float): Max seconds to wait (fallback timer).
+        Returns:
+            set[str]: Table names that notified pending rows. Empty set if the timeout expired.
+            None: If the listener is not available, the caller must fall back to a plain sleep.
+        """
+        if not self.start():
+            return None
+        
+        driver_connection = self._connection.driver_connection
+        try:
+            tables: set[str] = self._drain(driver_connection)
+            if tables:
+                return tables
+            
+            readable, _, _ = select.select([driver_connection], [], [], max(timeout, 0))
+            if not readable:
+                return set()
+            
+            return self._drain(driver_connection)
+        except Exception as e:
+            log.dev.exception(f"Conexão de escuta do canal '{self.channel}' perdida: {e}")
+            self.stop()
+            return None
+    
+    def stop(self) -> None:
+        """ Closes the listening connection. """
+        if not self._connection:
+            return
+        try:
+            self._connection.invalidate()
+        except Exception as e:
+            log.dev.exception(f"Falha ao fechar a conexão de escuta: {e}")
+        finally:
+            self._connection = None
+    
+    def _drain(self, driver_connection) -> set[str]:
+        """
+        Consumes every notification already received.
+        Returns:
+            set[str]: Notified table names.
+        """
+        driver_connection.poll()
+        tables: set[str] = set()
+        while driver_connection.notifies:
+            notify = driver_connection.notifies.pop(0)
+            tables.add(notify.payload)
+        return tables
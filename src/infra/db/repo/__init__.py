@@ -5,12 +5,14 @@ Provides:
     ProdutosRepository: Repository for produtos table.
     ProdutosStatusRepository: Repository for produtos_status table.
     CloudinaryRepository: Repository for cloudinary table.
+    MeliTokensRepository: Repository for meli_tokens table.
 """
 
 from .produtos import ProdutosRepository
 from .produtos_status import ProdutosStatusRepository
 from .produtos_category import ProdutosCategroyRepository
 from .cloud import CloudinaryRepository
+from .meli_tokens import MeliTokensRepository
 
 __version__ = "v.0.0.1"
 __all__ = [
@@ -20,5 +22,6 @@ __all__ = [
     "ProdutosStatusRepository",
     "ProdutosCategroyRepository",
     
-    "CloudinaryRepository"
+    "CloudinaryRepository",
+    "MeliTokensRepository"
 ]
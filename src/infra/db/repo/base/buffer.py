@@ -0,0 +1,159 @@
+""" Write-behind buffer of line updates. """
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Type
+
+from sqlalchemy import cast, column, update, values
+from sqlalchemy.orm import Session
+
+from src.infra.db.repo.session import session_scope
+from src.infra.db.repo.models import TableEntity
+
+
+class WriteBuffer:
+    """
+    Collects the updates of a table lines during a batch and writes them grouped.
+    
+    - Inside `batch()` the updates are kept in memory, merged by line (the last value of each column wins).
+    - The pending lines are written when the outermost batch ends or when `max_rows` lines are pending,
+      with one `UPDATE ... FROM (VALUES ...)` statement for each set of updated columns.
+    - A durable update (or any update outside a batch) is written at once, together with the pending
+      values of the same line.
+    """
+    def __init__(self, entity: Type[TableEntity], max_rows: int = 200) -> None:
+        """
+        Args:
+            entity (Type[TableEntity]): Table entity, with an `id` primary key.
+            max_rows (int): Pending lines that trigger a flush.
+        """
+        self.entity = entity
+        self.max_rows = max_rows
+        self._pending: dict[int, dict[str, Any]] = {}
+        self._batches: int = 0
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """ Buffers the updates until the outermost batch ends. """
+        with self._lock:
+            self._batches += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batches -= 1
+                outermost: bool = self._batches == 0
+            if outermost:
+                self.flush()
+    
+    def put(self, id: int, values: dict[str, Any], durable: bool = False) -> None:
+        """
+        Updates a line.
+        Args:
+            id (int): Line ID.
+            values (dict[str, Any]): New column values.
+            durable (bool): Writes it (and the pending values of the line) before returning.
+        """
+        row: Optional[dict[str, Any]] = None
+        full: bool = False
+        with self._lock:
+            self._pending.setdefault(id, {}).update(values)
+            if durable or not self._batches:
+                row = self._pending.pop(id)
+            else:
+                full = len(self._pending) >= self.max_rows
+        
+        if row is not None:
+            self._write_row(id, row)
+        elif full:
+            self.flush()
+    
+    def write(self, id: int, values: dict[str, Any]) -> None:
+        """
+        Writes a line at once, together with its pending values. Unlike `put`, the values may be SQL
+        expressions (Ex.: `entity.attempts + 1`), as they are never buffered.
+        Args:
+            id (int): Line ID.
+            values (dict[str, Any]): New column values or expressions.
+        """
+        with self._lock:
+            pending: dict[str, Any] = self._pending.pop(id, {})
+        try:
+            with session_scope() as session:
+                session.execute(update(self.entity).where(self.entity.id == id).values(**{**pending, **values}))
+        except Exception:
+            if pending:
+                self._restore({id: pending})
+            raise
+    
+    def flush(self) -> None:
+        """ Writes every pending line. """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        
+        try:
+            with session_scope() as session:
+                self._write_pending(session, pending)
+        except Exception:
+            self._restore(pending)
+            raise
+    
+    @contextmanager
+    def transaction(self) -> Iterator[Session]:
+        """
+        Opens a transaction that also writes every pending line, so the statements of the block and the
+        buffered updates are committed together. If the transaction fails, the updates go back to the buffer.
+        Example:
+            >>> with buffer.transaction() as session:
+            ...     session.execute(insert(entity), rows)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        try:
+            with session_scope() as session:
+                self._write_pending(session, pending)
+                yield session
+        except Exception:
+            self._restore(pending)
+            raise
+    
+    def _write_pending(self, session: Session, pending: dict[int, dict[str, Any]]) -> None:
+        """ One grouped UPDATE for each set of updated columns. """
+        groups: dict[tuple[str, ...], list[tuple[int, dict[str, Any]]]] = {}
+        for id, row in pending.items():
+            groups.setdefault(tuple(sorted(row)), []).append((id, row))
+        for names, rows in groups.items():
+            session.execute(self._grouped_update(names, rows))
+    
+    def _write_row(self, id: int, row: dict[str, Any]) -> None:
+        try:
+            with session_scope() as session:
+                session.execute(update(self.entity).where(self.entity.id == id).values(**row))
+        except Exception:
+            self._restore({id: row})
+            raise
+    
+    def _grouped_update(self, names: tuple[str, ...], rows: list[tuple[int, dict[str, Any]]]):
+        """ UPDATE table SET a = v.a, b = v.b FROM (VALUES (...), ...) AS v (id, a, b) WHERE table.id = v.id """
+        table = self.entity.__table__
+        data = values(
+            column("id", table.c.id.type),
+            *(column(name, table.c[name].type) for name in names),
+            name="buffered"
+        ).data([(id, *(row[name] for name in names)) for id, row in rows])
+        return (
+            update(table)
+            .where(table.c.id == cast(data.c.id, table.c.id.type))
+            .values({name: cast(data.c[name], table.c[name].type) for name in names})
+        )
+    
+    def _restore(self, pending: dict[int, dict[str, Any]]) -> None:
+        """ Gives back the values of a failed write, without overwriting newer values. """
+        with self._lock:
+            for id, row in pending.items():
+                current: dict[str, Any] = self._pending.setdefault(id, {})
+                for name, value in row.items():
+                    current.setdefault(name, value)
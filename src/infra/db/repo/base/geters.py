@@ -1,5 +1,10 @@
 """ Base common get functionalities. """
 
+from datetime import datetime
+from typing import Iterable, Optional
+from sqlalchemy import ColumnElement, func, or_, select, update
+from sqlalchemy.orm import load_only
+
 from src.infra.db.repo.session import session_scope
 from src.infra.db.repo.models import ResponseCode, TableEntity, DataclassTable
 
@@ -7,22 +12,134 @@ from src.infra.db.repo.models import ResponseCode, TableEntity, DataclassTable
 class StatusOperationGetters:
     """ Finders based on status_operacao_id column value. Pressets search methods for user interface. """
     
-    def by_column_value(self, operacao: int) -> list[DataclassTable]:
+    def by_column_value(self, operacao: int, columns: Optional[Iterable[str]] = None) -> list[DataclassTable]:
         """
         Pick all lines with specified `operacao` value.
         
         Args:
             operacao (int): Number of operation type.
+            columns (Iterable[str], optional): Columns to load (see `_projection`). Default: every column.
         Returns:
             (list[DataclassTable]): list of a DataclassTable objects. (Empty list if it not exists).
         """
         with session_scope() as session:
-            operations = session.query(self.entity).filter(self.entity.cod_retorno == operacao).all()
-            return self.converter.convert(operations)
+            operations = session.query(self.entity).filter(self.entity.cod_retorno == operacao)
+            if columns is not None:
+                operations = operations.options(self._projection(columns))
+            return self.converter.convert(operations.all())
+    
+    def by_ids(self, ids: Iterable[int], columns: Optional[Iterable[str]] = None) -> list[DataclassTable]:
+        """
+        Pick the lines of the given IDs, ordered by ID.
+        
+        Args:
+            ids (Iterable[int]): Line IDs.
+            columns (Iterable[str], optional): Columns to load (see `_projection`). Default: every column.
+        Returns:
+            (list[DataclassTable]): list of a DataclassTable objects.
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        with session_scope() as session:
+            statement = select(self.entity).where(self.entity.id.in_(ids)).order_by(self.entity.id)
+            if columns is not None:
+                statement = statement.options(self._projection(columns))
+            return self.converter.convert(list(session.scalars(statement).all()))
     
-    def pending_operations(self) -> list[TableEntity]:
-        """ Get pending operations. """
-        return self.by_column_value(ResponseCode.PENDING)
+    def pending_operations(self, columns: Optional[Iterable[str]] = None) -> list[TableEntity]:
+        """
+        Get pending operations.
+        Args:
+            columns (Iterable[str], optional): Columns to load (see `_projection`). Default: every column.
+        """
+        return self.by_column_value(ResponseCode.PENDING, columns)
+    
+    def count_pending(self, where: Optional[ColumnElement[bool]] = None) -> int:
+        """
+        Counts the lines waiting to be processed (backlog). Requeued lines still waiting for their `retry_at`
+        aren't counted.
+        Args:
+            where (ColumnElement[bool], optional): Extra filter. Ex.: the lines of a priority lane.
+        """
+        with session_scope() as session:
+            statement = select(func.count()).select_from(self.entity).where(self._claimable())
+            if where is not None:
+                statement = statement.where(where)
+            return session.scalar(statement)
+    
+    def claim_pending_operations(
+        self, 
+        worker_id: str, 
+        limit: int = 100, 
+        where: Optional[ColumnElement[bool]] = None, 
+        order_by: Optional[list[ColumnElement]] = None,
+        columns: Optional[Iterable[str]] = None
+    ) -> list[DataclassTable]:
+        """
+        Atomically claims up to `limit` pending lines for a worker.
+        
+        The lines are locked with `FOR UPDATE SKIP LOCKED`, marked as EXECUTING and returned in a single
+        statement, so concurrent workers (processes or hosts) never pick up the same line. Requeued lines
+        are only claimed after their `retry_at`. Inside each `order_by` priority the sellers (client_id)
+        take turns: every seller gets its oldest line claimed before any seller gets a second one.
+        
+        Args:
+            worker_id (str): Identifier of the worker claiming the lines.
+            limit (int): Max number of lines to claim.
+            where (ColumnElement[bool], optional): Extra filter. Ex.: the lines of a priority lane.
+            order_by (list[ColumnElement], optional): Claim priority. Sellers take turns inside each priority.
+            columns (Iterable[str], optional): Columns returned (see `_projection`). Default: every column.
+        Returns:
+            (list[DataclassTable]): Claimed lines ordered by ID. (Empty list if there's nothing pending).
+        """
+        order_by = list(order_by or [])
+        pending = self._claimable() if where is None else self._claimable() & where
+        # Position of each line in its seller queue (per priority), so a seller with thousands of pending
+        # lines can't fill every claim: the first line of each seller is claimed, then the second...
+        ranked = (
+            select(
+                self.entity.id,
+                func.row_number().over(partition_by=[self.entity.client_id, *order_by], order_by=self.entity.id).label("rank")
+            )
+            .where(pending)
+            .subquery()
+        )
+        with session_scope() as session:
+            pending_ids = (
+                select(self.entity.id)
+                .join(ranked, ranked.c.id == self.entity.id)
+                .where(pending) # Re-checked after the lock: the line may have been claimed meanwhile.
+                .order_by(*order_by, ranked.c.rank, self.entity.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True, of=self.entity) # Window functions can't be locked.
+            )
+            statement = (
+                update(self.entity)
+                .where(self.entity.id.in_(pending_ids))
+                .values(cod_retorno=ResponseCode.EXECUTING, worker_id=worker_id, started_at=None)
+                .returning(self.entity)
+            )
+            if columns is not None:
+                statement = statement.options(self._projection(columns))
+            claimed = session.scalars(statement, execution_options={"synchronize_session": False}).all()
+            return self.converter.convert(sorted(claimed, key=lambda line: line.id))
+    
+    def _claimable(self) -> ColumnElement[bool]:
+        """ Pending lines that aren't waiting for a retry. """
+        return (self.entity.cod_retorno == ResponseCode.PENDING) & or_(
+            self.entity.retry_at.is_(None),
+            self.entity.retry_at <= datetime.now()
+        )
+    
+    def _projection(self, columns: Iterable[str]):
+        """
+        Loader option that selects only some columns (and the ID). The other columns aren't transferred
+        nor converted, and are None on the converted dataclasses.
+        Args:
+            columns (Iterable[str]): Column names. Ex.: ["client_id", "operacao", "ml_id_produto"].
+        """
+        return load_only(*(getattr(self.entity, name) for name in columns))
     
     def completed_operations(self) -> list[TableEntity]:
         """ Get completed operations. """
@@ -1,53 +1,185 @@
 """ Base common update functionalities. """
 
+import threading
+from datetime import datetime, timedelta
+from typing import Any, ContextManager, Optional
+
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+
 from src.infra.db.repo.session import session_scope
 from src.infra.db.repo.models import ResponseCode
+from .buffer import WriteBuffer
+
+_buffer_lock = threading.Lock()
+
+RETRY_DELAY: int = 60 # Default seconds a requeued line waits before being claimed again.
+MAX_RETRIES: int = 5 # Default `log_retry` calls before a line goes to PROGRAM_ERROR.
+
+INTERRUPTED_MESSAGE: str = (
+    "Processamento interrompido após o início da operação. Ela pode já ter sido realizada no Mercado Livre: "
+    "confira antes de colocar a linha novamente na fila."
+)
 
 
 class Loggers:
-    """ Basic common logers for any table who contains the cod_retorno, log_erro columns"""
-    def log_error(self, id: int, return_code: int, log_erro: str) -> None:
+    """
+    Basic common logers for any table who contains the cod_retorno, log_erro columns.
+    
+    Inside `batch()` the line updates go through a write-behind buffer (see `WriteBuffer`). `durable=True`
+    writes an update before returning, even inside a batch.
+    """
+    retry_delay: int = RETRY_DELAY # Default seconds of `log_retry` before the line can be claimed again.
+    max_retries: int = MAX_RETRIES # `log_retry` calls in a row before a line goes to PROGRAM_ERROR.
+    
+    @property
+    def write_buffer(self) -> WriteBuffer:
+        buffer: WriteBuffer = self.__dict__.get("_write_buffer")
+        if buffer is None:
+            with _buffer_lock:
+                buffer = self.__dict__.setdefault("_write_buffer", WriteBuffer(self.entity))
+        return buffer
+    
+    def batch(self) -> ContextManager[None]:
+        """
+        Buffers the line updates until the end of the batch.
+        Example:
+            ```python
+            with repo.update.batch():
+                for line in lines:
+                    repo.update.executing(id=line.id)
+                    ...
+            ```
+        """
+        return self.write_buffer.batch()
+    
+    def flush(self) -> None:
+        """ Writes the buffered line updates. """
+        self.write_buffer.flush()
+    
+    def transaction(self) -> ContextManager[Session]:
+        """
+        Transaction that also writes the buffered line updates (see `WriteBuffer.transaction`).
+        Example:
+            ```python
+            with repo.update.transaction() as session:
+                repo.insert.add_new_results(results, session=session)
+            ```
+        """
+        return self.write_buffer.transaction()
+    
+    def _write(self, id: int, durable: bool = False, **values: Any) -> None:
+        if values.get("cod_retorno") not in (None, ResponseCode.PENDING, ResponseCode.EXECUTING):
+            values["attempts"] = 0 # A final result restarts the retry count.
+        self.write_buffer.put(id, values, durable=durable)
+    
+    def log_error(self, id: int, return_code: int, log_erro: str, durable: bool = False) -> None:
         """
         Log an error inside an especifiedy line.
         Args:
             id (int): Line ID.
             return_code (int): Error code.
             log_erro (str): Log message.
+            durable (bool): Writes it at once, even inside a batch.
         """
-        with session_scope() as session:
-            produto = session.query(self.entity).get(id)
-            produto.cod_retorno = return_code
-            produto.log_erro = str(log_erro)
+        self._write(id, durable, cod_retorno=return_code, log_erro=str(log_erro))
     
-    def log_success_code(self, id: int, return_code: int = ResponseCode.SUCCESS) -> None:
+    def log_success_code(self, id: int, return_code: int = ResponseCode.SUCCESS, durable: bool = False) -> None:
         """
         Log a simple message with the code sucess.
         Args:
             id (int): Line ID.
             return_code (int): Success code number. 
+            durable (bool): Writes it at once, even inside a batch.
         """
-        with session_scope() as session:
-            line = session.query(self.entity).get(id)
-            line.cod_retorno = return_code
+        self._write(id, durable, cod_retorno=return_code)
     
-    def got_to_sleep(self, id: int, return_code: int = ResponseCode.SUCCESS) -> None:
+    def got_to_sleep(self, id: int, return_code: int = ResponseCode.SUCCESS, durable: bool = False) -> None:
         """
         Change the status operation to another number to make it "sleep"
         Args:
             id (int): Line ID.
             return_code (int): Code number. 
+            durable (bool): Writes it at once, even inside a batch.
         """
-        with session_scope() as session:
-            line = session.query(self.entity).get(id)
-            line.cod_retorno = return_code
+        self._write(id, durable, cod_retorno=return_code)
     
-    def executing(self, id: int, return_code: int = ResponseCode.EXECUTING) -> None:
+    def executing(self, id: int, return_code: int = ResponseCode.EXECUTING, durable: bool = True) -> None:
         """
-        Change the status operation to another number to make it "sleep"
+        Marks a claimed line as started. Started lines are never given back to the queue by `release_claims`
+        and `release_worker_claims` (the operation may already have been done on mercado libre).
         Args:
             id (int): Line ID.
             return_code (int): Success code number. 
+            durable (bool): Writes it at once (default), so a crash after this point never repeats the operation.
         """
+        self._write(id, durable, cod_retorno=return_code, started_at=datetime.now())
+    
+    def log_retry(self, id: int, log_erro: str, retry_delay: Optional[int] = None) -> None:
+        """
+        Gives a line back to the queue (PENDING) after a retryable failure (Ex.: timeout), keeping the reason.
+        After `max_retries` retries in a row the line goes to PROGRAM_ERROR instead, so a line that always
+        fails isn't retried forever. Written at once, even inside a batch.
+        Args:
+            id (int): Line ID.
+            log_erro (str): Log message.
+            retry_delay (int, optional): Seconds before the line can be claimed again. Default: `retry_delay`.
+        """
+        if retry_delay is None:
+            retry_delay = self.retry_delay
+        attempts = func.coalesce(self.entity.attempts, 0) + 1
+        exhausted = attempts > self.max_retries
+        self.write_buffer.write(id, {
+            "cod_retorno": case((exhausted, ResponseCode.PROGRAM_ERROR), else_=ResponseCode.PENDING),
+            "log_erro": case(
+                (exhausted, f"{log_erro} | Limite de {self.max_retries} tentativas atingido, a operação não será repetida."),
+                else_=str(log_erro)
+            ),
+            "attempts": case((exhausted, 0), else_=attempts),
+            "worker_id": None,
+            "started_at": None,
+            "retry_at": datetime.now() + timedelta(seconds=retry_delay)
+        })
+    
+    def release_claims(self, ids: list[int], retry_delay: int = RETRY_DELAY) -> None:
+        """
+        Ends the claim of lines left in EXECUTING.
+        
+        - Lines never started (see `executing`) go back to the queue (PENDING), claimable again after
+          `retry_delay` seconds (Ex.: lines of a seller whose token failed aren't retried on every tick).
+        - Started lines go to PROGRAM_ERROR: the operation may have been done before the failure, and
+          repeating it could duplicate it (Ex.: a second publication of the same product).
+        
+        Lines already logged with another code are kept as they are.
+        Args:
+            ids (list[int]): Lines IDs.
+            retry_delay (int): Seconds before the requeued lines can be claimed again.
+        """
+        self.flush() # The buffered results must be written before, or the lines would still be EXECUTING.
+        if not ids:
+            return
+        self._release(self.entity.id.in_(ids), retry_at=datetime.now() + timedelta(seconds=retry_delay))
+    
+    def release_worker_claims(self, worker_id: str) -> None:
+        """
+        Ends the claims a worker left in EXECUTING, with the rules of `release_claims`. Used on startup to
+        recover lines claimed by a previous run that was interrupted.
+        Args:
+            worker_id (str): Worker identifier.
+        """
+        self.flush()
+        self._release(self.entity.worker_id == worker_id, retry_at=None)
+    
+    def _release(self, where, retry_at: Optional[datetime]) -> None:
+        executing = self.entity.cod_retorno == ResponseCode.EXECUTING
         with session_scope() as session:
-            line = session.query(self.entity).get(id)
-            line.cod_retorno = return_code
+            session.execute(
+                update(self.entity)
+                .where(where, executing, self.entity.started_at.is_(None))
+                .values(cod_retorno=ResponseCode.PENDING, worker_id=None, retry_at=retry_at)
+            )
+            session.execute(
+                update(self.entity)
+                .where(where, executing, self.entity.started_at.is_not(None))
+                .values(cod_retorno=ResponseCode.PROGRAM_ERROR, log_erro=INTERRUPTED_MESSAGE, attempts=0)
+            )
@@ -1,6 +1,7 @@
 """ Repositorie model for typing. """
 
-from typing import Protocol, TypeVar
+from typing import Optional, Protocol, TypeVar
+from sqlalchemy import ColumnElement
 from src.infra.db.repo.models import ResponseCode
 
 DataclassTable = TypeVar("DataclassTable")
@@ -32,6 +33,27 @@ class StatusOperationGettersProtocol(Protocol):
     def pending_operations(self) -> list[DataclassTable]:
         """ Get pending operations """
     
+    def count_pending(self, where: Optional[ColumnElement[bool]] = None) -> int:
+        """ Counts the lines waiting to be processed (backlog), optionally filtered. """
+    
+    def claim_pending_operations(
+        self, 
+        worker_id: str, 
+        limit: int = 100, 
+        where: Optional[ColumnElement[bool]] = None, 
+        order_by: Optional[list[ColumnElement]] = None
+    ) -> list[DataclassTable]:
+        """
+        Atomically claims pending lines (marks them as EXECUTING) for a worker.
+        Args:
+            worker_id (str): Identifier of the worker claiming the lines.
+            limit (int): Max number of lines to claim.
+            where (ColumnElement[bool], optional): Extra filter.
+            order_by (list[ColumnElement], optional): Claim order.
+        Returns:
+            (list[DataclassTable]): Claimed lines. (Empty list if there's nothing pending).
+        """
+    
     def completed_operations(self) -> list[DataclassTable]:
         """ Get completed operations """
     
@@ -57,11 +79,34 @@ class LoggersProtocol:
         """
     def executing(self, id: int, return_code: int = ResponseCode.EXECUTING) -> None:
         """
-        Change the status operation to another number to make it "sleep"
+        Marks a claimed line as started (it won't be given back to the queue anymore).
         Args:
             id (int): Line ID.
             return_code (int): Success code number. 
         """
+    def log_retry(self, id: int, log_erro: str, retry_delay: Optional[int] = None) -> None:
+        """
+        Gives a line back to the queue (PENDING) after a retryable failure, keeping the reason. After
+        `max_retries` retries in a row the line goes to PROGRAM_ERROR.
+        Args:
+            id (int): Line ID.
+            log_erro (str): Log message.
+            retry_delay (int, optional): Seconds before the line can be claimed again.
+        """
+    def release_claims(self, ids: list[int], retry_delay: int = 60) -> None:
+        """
+        Ends the claim of lines left in EXECUTING: never started lines go back to the queue (PENDING),
+        claimable after `retry_delay` seconds, started ones to PROGRAM_ERROR.
+        Args:
+            ids (list[int]): Lines IDs.
+            retry_delay (int): Seconds before the requeued lines can be claimed again.
+        """
+    def release_worker_claims(self, worker_id: str) -> None:
+        """
+        Ends the claims a worker left in EXECUTING, with the rules of `release_claims`.
+        Args:
+            worker_id (str): Worker identifier.
+        """
 
 class TableGetMethodsProtocol(OrmEntityProtocol, StatusOperationGettersProtocol):...
 class TableUpdateMethodsProtocol(OrmEntityProtocol, LoggersProtocol):...
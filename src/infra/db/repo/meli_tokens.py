@@ -0,0 +1,125 @@
+""" CRUD operations for meli_tokens table. """
+
+import time
+import hashlib
+from typing import Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.infra.db.repo.session import session_scope
+from src.infra.db.models.meli_tokens import MeliTokensORM, MeliTokenDataclass, MeliTokensConverter
+
+converter = MeliTokensConverter()
+
+LOCK_TIMEOUT: float = 30.0 # Max seconds waiting for another instance to refresh a seller.
+LOCK_POLL_INTERVAL: float = 0.25
+
+
+class AdvisoryLockTimeout(Exception):
+    """ The advisory lock of a seller wasn't released within the timeout. """
+
+
+def advisory_lock_key(client_id: str) -> int:
+    """ Stable 64 bits key of a seller, used by pg_advisory_xact_lock. """
+    digest: bytes = hashlib.sha256(f"meli_tokens:{client_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class MeliTokensGetMethods:
+    """ Read (GET) methods for meli_tokens table entity. """
+    def __init__(self, entity: MeliTokensORM):
+        """
+        Args:
+            entity (MeliTokensORM): meli_tokens table entity.
+        """
+        self.entity = entity
+        self.converter = converter
+    
+    def token(self, client_id: str) -> Optional[MeliTokenDataclass]:
+        """
+        Returns the stored tokens of a seller (without locking).
+        Args:
+            client_id (str): Seller client_id.
+        """
+        with session_scope() as session:
+            line: Optional[MeliTokensORM] = session.get(self.entity, client_id)
+            return self.converter.orm_convert(line) if line else None
+
+
+class MeliTokensUpdateMethods:
+    """ Update methods for meli_tokens table entity. """
+    def __init__(self, entity: MeliTokensORM):
+        """
+        Args:
+            entity (MeliTokensORM): meli_tokens table entity.
+        """
+        self.entity = entity
+        self.converter = converter
+    
+    def exchange(
+        self,
+        client_id: str,
+        refresh: Callable[[Optional[MeliTokenDataclass]], Optional[MeliTokenDataclass]],
+        adopt: Optional[Callable[[Optional[MeliTokenDataclass]], bool]] = None,
+        lock_timeout: float = LOCK_TIMEOUT
+    ) -> Optional[MeliTokenDataclass]:
+        """
+        Refreshes a seller tokens holding a transaction advisory lock, so only one bot instance
+        refreshes the seller at a time.
+        
+        The lock is polled with `pg_try_advisory_xact_lock` (a blocking lock call would hit the
+        statement_timeout while the other instance waits for the auth API). Between the attempts the line
+        is read again: the tokens saved meanwhile by the other instance are returned once `adopt` accepts them.
+        Args:
+            client_id (str): Seller client_id.
+            refresh (Callable): Receives the stored tokens (None if there's no line) and returns the tokens
+                to be saved. Returning the same object (or None) keeps the line unchanged.
+            adopt (Callable, optional): Whether the stored tokens can be used without refreshing them.
+            lock_timeout (float): Max seconds waiting for the lock.
+        Returns:
+            MeliTokenDataclass: The tokens saved (or the stored ones when nothing changed).
+        Raises:
+            AdvisoryLockTimeout: If the lock wasn't released within `lock_timeout`.
+        """
+        key: int = advisory_lock_key(client_id)
+        give_up_at: float = time.monotonic() + lock_timeout
+        with session_scope() as session:
+            while not session.scalar(select(func.pg_try_advisory_xact_lock(key))):
+                line: Optional[MeliTokensORM] = session.get(self.entity, client_id, populate_existing=True)
+                current: Optional[MeliTokenDataclass] = self.converter.orm_convert(line) if line else None
+                if adopt is not None and adopt(current): # Refreshed by the instance holding the lock.
+                    return current
+                if time.monotonic() >= give_up_at:
+                    raise AdvisoryLockTimeout(f"[{client_id}] Tempo limite aguardando a renovação do token por outra instância.")
+                time.sleep(LOCK_POLL_INTERVAL)
+            
+            line: Optional[MeliTokensORM] = session.get(self.entity, client_id, populate_existing=True)
+            current: Optional[MeliTokenDataclass] = self.converter.orm_convert(line) if line else None
+            
+            token: Optional[MeliTokenDataclass] = refresh(current)
+            if token is None or token is current:
+                return current
+            
+            values: dict = {
+                "access_token": token.access_token,
+                "refresh_token": token.refresh_token,
+                "refresh_token_origem": token.refresh_token_origem,
+                "expira_em": token.expira_em,
+                "user_id": token.user_id,
+                "scope": token.scope,
+                "atualizado_em": func.now()
+            }
+            session.execute(
+                insert(self.entity)
+                .values(client_id=client_id, **values)
+                .on_conflict_do_update(index_elements=[self.entity.client_id], set_=values)
+            )
+            return token
+
+
+class MeliTokensRepository:
+    """ SQL commands for table meli_tokens. """
+    def __init__(self):
+        self.get = MeliTokensGetMethods(MeliTokensORM)
+        self.update = MeliTokensUpdateMethods(MeliTokensORM)
@@ -17,3 +17,9 @@ class ResponseCode:
     TABLE_ERROR: int = 88
     PROGRAM_ERROR: int = 91
 
+
+
+class ResultSource:
+    """ Origin of a category result (operacao_categoria_ml.origem_categoria). """
+    API: str = "api"
+    LOCAL: str = "local" # Local title classifier. Never used to train it again.
@@ -4,6 +4,8 @@
 
 # from session import session_scope
 # from session.session_manager import session_scope
+from sqlalchemy import select
+
 from src.infra.db.repo.session.session_manager import session_scope
 from ..models.produtos import Produtos, ProdutosConverter
 from .models import ResponseCode
@@ -24,6 +26,27 @@ class ProdutosGetMethods(BaseGetMethods):
         """
         self.entity = entity
         self.converter = ProdutosConverter()
+    
+    def title_samples(self, limit: int) -> list[tuple[str, str, str]]:
+        """
+        Titles and categories of the most recent products published successfully (classifier training).
+        Args:
+            limit (int): Max lines.
+        Returns:
+            list[tuple[str, str, str]]: (titulo, categoria, categoria_id) of each line.
+        """
+        with session_scope() as session:
+            rows = session.execute(
+                select(self.entity.titulo, self.entity.categoria, self.entity.categoria_id)
+                .where(
+                    self.entity.cod_retorno == ResponseCode.SUCCESS,
+                    self.entity.ml_id_produto.is_not(None),
+                    self.entity.titulo.is_not(None)
+                )
+                .order_by(self.entity.id.desc())
+                .limit(limit)
+            ).all()
+            return [tuple(row) for row in rows]
 
 
 class ProdutosUpdateMethods(BaseUpdateMethods):
@@ -33,7 +56,18 @@ class ProdutosUpdateMethods(BaseUpdateMethods):
         Args:
             entity (Produtos): Produtos table entity.
         """
-        self.entity = entity
+        super().__init__(entity)
+    
+    def register_publication(self, id: int, ml_id_produto: str, link_publicacao: str, durable: bool = True) -> None:
+        """
+        Registers the item created by a publication, before its next steps (description, compatibilities).
+        Args:
+            id (int): Line ID.
+            ml_id_produto (str): Created item ID.
+            link_publicacao (str): Created item link.
+            durable (bool): Writes it at once (default), so the item ID is never lost.
+        """
+        self._write(id, durable, ml_id_produto=ml_id_produto, link_publicacao=link_publicacao)
     
     def publication_success(
         self,
@@ -42,6 +76,7 @@ class ProdutosUpdateMethods(BaseUpdateMethods):
         categoria: str,
         link_publicacao: str,
         produto_status: str,
+        durable: bool = True
     ) -> None:
         """
         Log a success publication message.
@@ -50,29 +85,31 @@ class ProdutosUpdateMethods(BaseUpdateMethods):
             categoria: 
             link_publicacao: 
             produto_status: 
-        """
-        with session_scope() as session:
-            line = session.query(self.entity).get(id)
-            line.ml_id_produto = ml_id_produto
-            line.categoria = categoria
-            line.link_publicacao = link_publicacao
-            line.produto_status = produto_status
-            line.cod_retorno = ResponseCode.SUCCESS
+            durable: Writes it at once (default), so an interrupted run never publishes the line again.
+        """
+        self._write(
+            id,
+            durable,
+            ml_id_produto=ml_id_produto,
+            categoria=categoria,
+            link_publicacao=link_publicacao,
+            produto_status=produto_status,
+            cod_retorno=ResponseCode.SUCCESS
+        )
     
     def change_status_success(
         self,
         id: int,
         produto_status: str,
+        durable: bool = False
     ) -> None:
         """
         Log a success activation message.
         Args:
             produto_status:
+            durable: Writes it at once, even inside a batch.
         """
-        with session_scope() as session:
-            line = session.query(self.entity).get(id)
-            line.produto_status = produto_status
-            line.cod_retorno = ResponseCode.SUCCESS
+        self._write(id, durable, produto_status=produto_status, cod_retorno=ResponseCode.SUCCESS)
     
     def pause_success(
         self,
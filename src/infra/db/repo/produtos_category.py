@@ -1,10 +1,12 @@
 """ Repository for table operacao_categoria_ml """
 
-from sqlalchemy import insert
+from typing import Optional
+from sqlalchemy import insert, or_, select
+from sqlalchemy.orm import Session
 
 from src.infra.db.models.produtos_category import ProdutosCategoryORM, ProdutosCategoryConverter
 from src.infra.db.repo.session.session_manager import session_scope
-from .models import ResponseCode
+from .models import ResponseCode, ResultSource
 from .base import (
     BaseGetMethods,
     BaseUpdateMethods,
@@ -20,35 +22,74 @@ class ProdutosCategroyGetMethods(BaseGetMethods):
         """
         self.entity = entity
         self.converter = ProdutosCategoryConverter()
+    
+    def title_samples(self, limit: int) -> list[tuple[str, str]]:
+        """
+        Titles and category IDs of the most recent successful results (classifier training). The results of the
+        classifier itself are left out, so it never learns from its own predictions.
+        Args:
+            limit (int): Max lines.
+        Returns:
+            list[tuple[str, str]]: (titulo_produto, categoria_id) of each line.
+        """
+        with session_scope() as session:
+            rows = session.execute(
+                select(self.entity.titulo_produto, self.entity.categoria_id)
+                .where(
+                    self.entity.cod_retorno == ResponseCode.SUCCESS,
+                    self.entity.titulo_produto.is_not(None),
+                    self.entity.categoria_id.is_not(None),
+                    or_(self.entity.origem_categoria.is_(None), self.entity.origem_categoria != ResultSource.LOCAL)
+                )
+                .order_by(self.entity.id.desc())
+                .limit(limit)
+            ).all()
+            return [tuple(row) for row in rows]
 
 class ProdutosCategroyUpdateMethods(BaseUpdateMethods):
     
-    def register_category_id(self, id: int, category_id: str) -> None:
+    def register_category_id(self, id: int, category_id: str, durable: bool = False) -> None:
         """
         
         Args:
             id (int): Line id.
             category_id (str): The meli category ID.
+            durable (bool): Writes it at once, even inside a batch.
         """
-        with session_scope() as session:
-            line: ProdutosCategoryORM = session.query(self.entity).get(id)
-            line.categoria_id = category_id
-            line.cod_retorno = ResponseCode.SUCCESS
+        self._write(id, durable, categoria_id=category_id, cod_retorno=ResponseCode.SUCCESS)
     
-    def register_single_result(self, id: int, category_id: str) -> None:
-        self.register_category_id(id=id, category_id=category_id)
+    def register_single_result(
+        self, 
+        id: int, 
+        category_id: str, 
+        source: str = ResultSource.API, 
+        durable: bool = False
+    ) -> None:
+        """
+        
+        Args:
+            id (int): Line id.
+            category_id (str): The meli category ID predicted for the title.
+            source (str): Origin of the prediction (see ResultSource).
+            durable (bool): Writes it at once, even inside a batch.
+        """
+        self._write(
+            id, 
+            durable, 
+            categoria_id=category_id, 
+            origem_categoria=source, 
+            cod_retorno=ResponseCode.SUCCESS
+        )
     
-    def register_category_path(self, id: int, category_path: str) -> None:
+    def register_category_path(self, id: int, category_path: str, durable: bool = False) -> None:
         """
         
         Args:
             id (int): Line id.
             category_id (str): 
+            durable (bool): Writes it at once, even inside a batch.
         """
-        with session_scope() as session:
-            line: ProdutosCategoryORM = session.query(self.entity).get(id)
-            line.nome_categoria = category_path
-            line.cod_retorno = ResponseCode.SUCCESS
+        self._write(id, durable, nome_categoria=category_path, cod_retorno=ResponseCode.SUCCESS)
     
 
 
@@ -68,6 +109,30 @@ class ProdutosCategroyInsertMethods(BaseInsertMethods):
                 cod_retorno=ResponseCode.SUCCESS
             )
             session.add(new_record)
+    
+    def add_new_results(self, results: list[tuple[str, str, str]], session: Optional[Session] = None) -> None:
+        """
+        Inserts many results in a single multi-row INSERT.
+        Args:
+            results (list[tuple[str, str, str]]): (cod_produto, category_id, source) of each new line.
+            session (Session, optional): Transaction to join (Ex.: `update.transaction()`). Default: its own.
+        """
+        if not results:
+            return
+        rows: list[dict] = [
+            {
+                "cod_produto": cod_produto,
+                "categoria_id": category_id,
+                "origem_categoria": source,
+                "cod_retorno": ResponseCode.SUCCESS
+            }
+            for cod_produto, category_id, source in results
+        ]
+        if session is not None:
+            session.execute(insert(self.entity), rows)
+            return
+        with session_scope() as session:
+            session.execute(insert(self.entity), rows)
 
 
 class ProdutosCategroyDeleteMethods(BaseDeleteMethods):...
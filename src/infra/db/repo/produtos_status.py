@@ -1,7 +1,6 @@
 """  """
 
 from src.infra.db.models import ProdutosStatusORM, ProdutosStausConverter
-from src.infra.db.repo.session.session_manager import session_scope
 from .models import ResponseCode
 from .base import (
     BaseGetMethods,
@@ -20,17 +19,15 @@ class ProdutosGetMethods(BaseGetMethods):
         self.converter = ProdutosStausConverter()
 
 class ProdutosUpdateMethods(BaseUpdateMethods):
-    def log_success(self, id: int, status: str) -> None:
+    def log_success(self, id: int, status: str, durable: bool = False) -> None:
         """
         Register the result.
         Args:
             id (int): Line id.
             status (str): Product status on mercado libre.
+            durable (bool): Writes it at once, even inside a batch.
         """
-        with session_scope() as session:
-            line: ProdutosStatusORM = session.query(self.entity).get(id)
-            line.status_produto = status
-            line.cod_retorno = ResponseCode.SUCCESS
+        self._write(id, durable, status_produto=status, cod_retorno=ResponseCode.SUCCESS)
 
 class ProdutosInsertMethods(BaseDeleteMethods):...
 class ProdutosDeleteMethods(BaseInsertMethods):...
@@ -1,22 +1,59 @@
 """ Program main loop. """
 
 import time
+from typing import Optional
 
 from .core import log
-from .config import AppConfigManager
+from .config import AppConfigManager, AppConfig
 from .app import App
+from .app.models import ApplicationProtocol
+from .app.scheduler import ApplicationScheduler
+from .app.polling import AdaptiveInterval, PollingMetrics
+from .infra.db.notifications import PendingOperationsListener
 
 
 config = AppConfigManager()
 database_config = config.load_database_config()
+scheduler_config = config.load_scheduler_config()
+
+APPLICATIONS: dict[str, ApplicationProtocol] = {
+    "produtos_urgente": App.produtos_urgent,
+    "produtos": App.produtos,
+    "produtos_status": App.status,
+    "operacao_categoria_ml": App.category
+}
+
+APPLICATIONS_TABLES: dict[str, str] = {
+    "produtos_urgente": "produtos",
+    "produtos": "produtos",
+    "produtos_status": "produtos_status",
+    "operacao_categoria_ml": "operacao_categoria_ml"
+}
+
+APPLICATIONS_LIMITS: dict[str, int] = {
+    "produtos_urgente": scheduler_config.urgent_concurrency,
+    "produtos": scheduler_config.produtos_concurrency,
+    "produtos_status": scheduler_config.status_concurrency,
+    "operacao_categoria_ml": scheduler_config.category_concurrency
+}
 
 
 class MainLoop:
     """ Manages and controls the main program loop. """
+    def __init__(self) -> None:
+        self.listener = PendingOperationsListener()
+        self.scheduler = ApplicationScheduler()
+        self.polling = AdaptiveInterval()
+        for name, application in APPLICATIONS.items():
+            self.scheduler.register(name, application, APPLICATIONS_LIMITS[name])
+    
     def turn_on(self):
         """ Turns on the loop and keeps it active as long as the STILL_ON variable in the .env file is active. """
         try:
             log.user.info("Iniciando o bot...")
+            self._recover_claims()
+            applications: list[str] = list(APPLICATIONS)
+            counted: list[str] = list(APPLICATIONS) # Applications whose backlog is counted after the tick.
             while True:
                 
                 app_config = config.load_app_config()
@@ -25,23 +62,104 @@ class MainLoop:
                     log.user.info('Arquivo .env: Comando desligar.')
                     break
                 
-                # Applications
-                App.produtos.execute()
-                App.status.execute()
-                App.category.execute()
+                # Applications (run concurrently, each one limited by its own slots)
+                self.scheduler.submit(applications)
+                
+                backlog: dict[str, int] = self._backlog(counted)
+                interval: float = self.polling.next(backlog, base=app_config.timer, ceiling=app_config.timer_max)
                 
-                time.sleep(app_config.timer)
+                if any(backlog.values()):
+                    # There's backlog: wait for a free slot. Without progress (Ex.: lines that keep going back
+                    # to the queue) waits at least the interval, even when nothing is running.
+                    running: bool = self.scheduler.wait_any(timeout=interval or app_config.timer)
+                    if interval and not running:
+                        time.sleep(interval)
+                    applications = [name for name, pending in backlog.items() if pending]
+                    counted = applications # Only the ones that still had backlog.
+                    continue
+                
+                applications, counted = self._wait(app_config, interval)
                 # break
         except KeyboardInterrupt as k:
             log.user.info(f"Programa desligado manualmente pelo usuário {k}")
         except Exception as e:
             log.dev.exception(f"Exceção inesperada durante a execução do loop principal: {e}")
     
+    @property
+    def metrics(self) -> PollingMetrics:
+        """ Current polling interval and backlog. """
+        return self.polling.metrics
+    
+    def _backlog(self, names: list[str]) -> dict[str, int]:
+        """
+        Counts the pending lines of some applications.
+        Args:
+            names (list[str]): Applications to count (Ex.: the notified ones). The others are taken as idle.
+        Returns:
+            dict[str, int]: Pending lines by application. Applications that failed to be counted are left out.
+        """
+        backlog: dict[str, int] = {}
+        for name in names:
+            try:
+                backlog[name] = APPLICATIONS[name].backlog()
+            except Exception as e:
+                log.dev.exception(f"[{name}] Falha ao contar as linhas pendentes: {e}")
+        return backlog
+    
+    def _recover_claims(self) -> None:
+        """
+        Ends the claims this worker left in EXECUTING on a previous (interrupted) run: lines never started go
+        back to the queue, started ones to PROGRAM_ERROR (see `release_worker_claims`).
+        """
+        worker_id: str = config.load_worker_config().worker_id
+        for name, application in APPLICATIONS.items():
+            try:
+                application.repo.update.release_worker_claims(worker_id)
+            except Exception as e:
+                log.dev.exception(f"[{name}] Falha ao liberar as linhas reservadas por '{worker_id}': {e}")
+    
+    def _wait(self, app_config: AppConfig, interval: float) -> tuple[list[str], list[str]]:
+        """
+        Waits for the next tick.
+        
+        With LISTEN_NOTIFY active, wakes up as soon as a pending row is notified and only the
+        applications of the notified tables run (and have their backlog counted). The interval remains
+        as a fallback: when it expires every application runs, as in the plain sleep mode, but nothing
+        is counted (no row was notified, so the tables are idle).
+        Args:
+            app_config (AppConfig): Current .env configurations.
+            interval (float): Seconds to wait (adaptive interval).
+        Returns:
+            tuple[list[str], list[str]]: Applications that must run on the next tick, and the ones whose
+                backlog is counted after it.
+        """
+        all_applications: list[str] = list(APPLICATIONS)
+        
+        if not app_config.listen_notify:
+            self.listener.stop()
+            time.sleep(interval)
+            return all_applications, all_applications
+        
+        tables: Optional[set[str]] = self.listener.wait(timeout=interval)
+        
+        if tables is None: # Listener unavailable, fallback to the plain sleep.
+            time.sleep(interval)
+            return all_applications, all_applications
+        
+        if not tables: # Timeout expired.
+            return all_applications, []
+        
+        self.polling.reset()
+        notified: list[str] = [name for name, table in APPLICATIONS_TABLES.items() if table in tables] or all_applications
+        return notified, notified
+    
     def turn_off(self):
         """ Turn off the loop. """
         try:
             # Close the database connectation
             # connect_manager.close_all_connections()
+            self.listener.stop()
+            self.scheduler.shutdown()
             log.user.info('Desligando o bot...\n\n')
         except Exception as e:
             log.dev.exception(f"Exceção inesperada durante a desativação do loop principal: {e}")
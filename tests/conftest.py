@@ -0,0 +1,78 @@
+""" Shared fixtures of the unit tests. """
+
+import os
+import sys
+import types
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENV: str = "\n".join([
+    "STILL_ON=ON",
+    "TIMER=2",
+    "HOSTNAME=localhost",
+    "DATABASE=tests",
+    "USER=tests",
+    "PASSWORD=tests",
+    "CLOUDINARY_USER=tests",
+])
+
+# The settings are read from the .env of the working directory (and the logs written there) when `src` is imported.
+_workdir: str = tempfile.mkdtemp(prefix="mercado-livre-tests-")
+with open(os.path.join(_workdir, ".env"), "w", encoding="utf-8") as env_file:
+    env_file.write(ENV)
+os.chdir(_workdir)
+sys.path.insert(0, ROOT)
+
+# `src.app` builds every application (and connects to the database) when imported. The tests import its
+# modules without running that package initialization.
+_app = types.ModuleType("src.app")
+_app.__path__ = [os.path.join(ROOT, "src", "app")]
+sys.modules.setdefault("src.app", _app)
+
+
+def create_table(engine: Engine, entity) -> None:
+    """ Creates the table of an entity on SQLite (the Postgres sequences and types are left out). """
+    columns: list[str] = [column.name for column in entity.__table__.columns if column.name != "id"]
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"CREATE TABLE {entity.__tablename__} (id INTEGER PRIMARY KEY, {', '.join(columns)})"
+        ))
+
+
+@pytest.fixture
+def database(monkeypatch) -> Engine:
+    """ In-memory SQLite database used by the repositories instead of Postgres. """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def session_scope() -> Iterator[Session]:
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    from src.infra.db.repo import produtos, produtos_category
+    from src.infra.db.repo.base import buffer, geters, updaters
+    for module in (buffer, geters, updaters, produtos, produtos_category):
+        monkeypatch.setattr(module, "session_scope", session_scope)
+    yield engine
+    engine.dispose()
@@ -0,0 +1,79 @@
+""" Category name matching: NameTrie and the path resolution of CategoryTree. """
+
+from src.app.shared.category.names import NameTrie, normalize_name
+from src.app.shared.category.tree import CategoryTree
+
+LEVEL: list[str] = [
+    "Peças de Carros e Caminhonetes",
+    "Peças de Motos e Quadriciclos",
+    "Acessórios de Carros e Caminhonetes",
+]
+
+
+def trie() -> NameTrie[int]:
+    return NameTrie((name, index) for index, name in enumerate(LEVEL))
+
+
+def category(id: str, name: str, *parents: tuple[str, str]) -> dict:
+    path: list[dict] = [{"id": parent_id, "name": parent_name} for parent_id, parent_name in parents]
+    return {"id": id, "name": name, "path_from_root": path + [{"id": id, "name": name}], "settings": {}}
+
+
+def tree() -> CategoryTree:
+    root = ("MLB5672", "Acessórios para Veículos")
+    parts = ("MLB1747", "Peças de Carros e Caminhonetes")
+    return CategoryTree(CategoryTree.build({
+        "MLB5672": category(*root),
+        "MLB1747": category(*parts, root),
+        "MLB1748": category("MLB1748", "Peças de Motos e Quadriciclos", root),
+        "MLB2227": category("MLB2227", "Freios", root, parts),
+    }))
+
+
+def test_names_are_compared_without_accents_case_and_extra_spaces():
+    assert normalize_name("  Acessórios  para VEÍCULOS ") == "acessorios para veiculos"
+    assert trie().get("pecas de carros   e CAMINHONETES") == 0
+
+
+def test_repeated_names_keep_the_first_value():
+    level: NameTrie[int] = NameTrie([("Freios", 1), ("FREIOS", 2)])
+    assert len(level) == 1 and level.get("freios") == 1
+
+
+def test_prefix_and_typo_are_not_accepted():
+    assert trie().get("Peças de Carros e Camin") is None
+    assert trie().get("Pecas de Caros e Caminhonetes") is None
+    assert trie().get("") is None
+
+
+def test_prefixes_are_suggested_first():
+    suggestions = [match.name for match in trie().suggest("Peças de")]
+    assert set(suggestions[:2]) == set(LEVEL[:2])
+
+
+def test_typos_are_suggested():
+    [best, *_] = trie().suggest("Pecas de Caros e Caminhonetes")
+    assert best.name == LEVEL[0] and 0.6 <= best.score < 1.0
+
+
+def test_unrelated_names_are_not_suggested():
+    assert trie().suggest("Informática") == []
+
+
+def test_tree_resolves_exact_paths():
+    resolution = tree().resolve(["acessorios para veiculos", "PEÇAS DE CARROS E CAMINHONETES", "Freios"])
+    assert resolution.category_id == "MLB2227"
+    assert resolution.names == ["Acessórios para Veículos", "Peças de Carros e Caminhonetes", "Freios"]
+
+
+def test_tree_suggests_close_levels_without_resolving_them():
+    resolution = tree().resolve(["Acessórios para Veículos", "Pecas de Caros e Caminhonetes", "Freios"])
+    assert resolution.category_id is None
+    assert resolution.missing == "Pecas de Caros e Caminhonetes"
+    assert resolution.suggestions[0] == "Peças de Carros e Caminhonetes"
+    assert tree().find_id(["Acessórios para Veículos", "Peças de Carros e Camin"]) is None
+
+
+def test_tree_rebuilds_the_path_of_an_id():
+    assert tree().path("MLB2227") == ["Acessórios para Veículos", "Peças de Carros e Caminhonetes", "Freios"]
+    assert tree().path("MLB0") is None
@@ -0,0 +1,81 @@
+""" Extra category suggestions inserted by the title search (operacao_categoria_ml). """
+
+import pytest
+from sqlalchemy import event, text
+
+from src.infra.db.models.produtos_category import ProdutosCategoryORM
+from src.infra.db.repo import ProdutosCategroyRepository
+from src.infra.db.repo.base import buffer as buffer_module
+from src.infra.db.repo.models import ResponseCode, ResultSource
+from conftest import create_table
+
+
+def test_results_are_inserted_with_a_single_statement(database):
+    create_table(database, ProdutosCategoryORM)
+    inserts: list[str] = []
+    
+    @event.listens_for(database, "before_cursor_execute")
+    def record(connection, cursor, sql: str, *args) -> None:
+        if sql.startswith("INSERT"):
+            inserts.append(sql)
+    
+    ProdutosCategroyRepository().insert.add_new_results([
+        ("P1", "MLB1747", ResultSource.API),
+        ("P1", "MLB2227", ResultSource.API),
+        ("P2", "MLB5672", ResultSource.LOCAL)
+    ])
+    
+    assert len(inserts) == 1
+    with database.connect() as connection:
+        rows = connection.execute(text("SELECT cod_produto, categoria_id, origem_categoria, cod_retorno FROM operacao_categoria_ml ORDER BY id")).all()
+    assert [tuple(row) for row in rows] == [
+        ("P1", "MLB1747", "api", ResponseCode.SUCCESS),
+        ("P1", "MLB2227", "api", ResponseCode.SUCCESS),
+        ("P2", "MLB5672", "local", ResponseCode.SUCCESS)
+    ]
+
+
+class Transaction:
+    """ Records the statements of a transaction, optionally failing the INSERT. """
+    def __init__(self, fail_insert: bool = False) -> None:
+        self.fail_insert = fail_insert
+        self.executed: list[str] = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def execute(self, statement, parameters=None):
+        kind: str = statement.__visit_name__ # "update" or "insert".
+        if kind == "insert" and self.fail_insert:
+            raise RuntimeError("Conexão perdida")
+        self.executed.append(kind)
+
+
+def test_single_results_are_written_in_the_insert_transaction(monkeypatch):
+    transaction = Transaction()
+    monkeypatch.setattr(buffer_module, "session_scope", lambda: transaction)
+    repo = ProdutosCategroyRepository()
+    
+    with repo.update.batch():
+        repo.update.register_single_result(id=1, category_id="MLB1747")
+        with repo.update.transaction() as session:
+            repo.insert.add_new_results([("P1", "MLB2227", ResultSource.API)], session=session)
+    
+    assert transaction.executed == ["update", "insert"]
+
+
+def test_failed_insert_gives_the_single_results_back_to_the_buffer(monkeypatch):
+    monkeypatch.setattr(buffer_module, "session_scope", lambda: Transaction(fail_insert=True))
+    repo = ProdutosCategroyRepository()
+    
+    with repo.update.batch():
+        repo.update.register_single_result(id=1, category_id="MLB1747")
+        with pytest.raises(RuntimeError):
+            with repo.update.transaction() as session:
+                repo.insert.add_new_results([("P1", "MLB2227", ResultSource.API)], session=session)
+        
+        assert repo.update.write_buffer._pending[1]["categoria_id"] == "MLB1747"
+        repo.update.write_buffer._pending.clear()
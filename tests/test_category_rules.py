@@ -0,0 +1,84 @@
+""" Compiled category rules of the publication validation (CategoryValidator). """
+
+from types import SimpleNamespace
+
+from src.infra.api.mercadolivre.models import MeliResponse
+from src.app.shared.category.tree import CategoryTree
+from src.app.services.produtos.generators.category import CategoryGenerator
+from src.app.services.produtos.generators.category.validators import CategoryValidator
+
+
+def snapshot(max_title_length: int, created_at: float) -> CategoryTree:
+    settings = {"max_title_length": max_title_length, "status": "enabled"}
+    return CategoryTree(CategoryTree.build({
+        "MLB2227": {
+            "id": "MLB2227",
+            "name": "Freios",
+            "path_from_root": [{"id": "MLB2227", "name": "Freios"}],
+            "settings": settings
+        }
+    }, created_at=created_at))
+
+
+class Reads:
+    """ Counts the category reads of a tree. """
+    def __init__(self, tree: CategoryTree) -> None:
+        self.tree = tree
+        self.created_at = tree.created_at
+        self.reads: int = 0
+    
+    def category_data(self, category_id: str):
+        self.reads += 1
+        return self.tree.category_data(category_id)
+
+
+def test_tree_rules_are_compiled_once_per_snapshot():
+    validator = CategoryValidator()
+    tree = Reads(snapshot(max_title_length=60, created_at=1.0))
+    
+    first = validator.tree_rules(tree, "MLB2227")
+    assert validator.tree_rules(tree, "MLB2227") is first
+    assert tree.reads == 1 and first.max_title_length == 60
+    
+    fresh = validator.tree_rules(snapshot(max_title_length=80, created_at=2.0), "MLB2227")
+    assert fresh.max_title_length == 80
+
+
+def test_categories_out_of_the_tree_have_no_tree_rules():
+    assert CategoryValidator().tree_rules(snapshot(max_title_length=60, created_at=1.0), "MLB0") is None
+
+
+class CategoryRequests:
+    """ Answers /categories/{id} and counts the requests. """
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+    
+    def get_category_data(self, category_id: str, access_token: str) -> MeliResponse:
+        self.requests.append(category_id)
+        return MeliResponse(success=True, data={
+            "id": category_id,
+            "children_categories": [],
+            "settings": {"buying_modes": ["buy_it_now"], "item_conditions": ["new"], "shipping_options": ["me2"], "status": "enabled"}
+        })
+
+
+def product(title: str, categoria: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        sale=SimpleNamespace(titulo=title, descricao="", imagens="a.jpg", preco=100, modo_compra="buy_it_now"),
+        technical=SimpleNamespace(condicao_produto="new"),
+        shippiment=SimpleNamespace(modo_envio="me2"),
+        category=SimpleNamespace(categoria=categoria, categoria_id=None, categoria_caminho=None)
+    )
+
+
+def test_categories_out_of_the_tree_are_requested_once():
+    generator = CategoryGenerator()
+    generator.category_requests = CategoryRequests()
+    generator.category_tree = SimpleNamespace(tree=lambda access_token: None) # Tree unavailable.
+    token = SimpleNamespace(access_token="APP_USR-vendedor")
+    
+    responses = generator.generate_many([product("Pastilha", "MLB1"), product("Disco", "MLB1"), product("Farol", "MLB2")], token)
+    assert [response.result for response in responses] == ["MLB1", "MLB1", "MLB2"]
+    assert generator.generate(product("Lanterna", "MLB1"), token).success
+    
+    assert generator.category_requests.requests == ["MLB1", "MLB2"]
@@ -0,0 +1,144 @@
+""" Claim and release of pending lines (StatusOperationGetters and Loggers). """
+
+import pytest
+from sqlalchemy import text
+
+from src.infra.db.models.produtos import Produtos
+from src.infra.db.repo import ProdutosRepository
+from src.infra.db.repo.models import ResponseCode
+from conftest import create_table
+
+
+@pytest.fixture
+def repo(database) -> ProdutosRepository:
+    create_table(database, Produtos)
+    with database.begin() as connection:
+        for id in (1, 2, 3):
+            connection.execute(
+                text("INSERT INTO produtos (id, operacao, cod_retorno, cod_produto) VALUES (:id, 1, 0, :cod)"),
+                {"id": id, "cod": f"P{id}"}
+            )
+    return ProdutosRepository()
+
+
+def states(database) -> dict[int, tuple]:
+    with database.connect() as connection:
+        rows = connection.execute(text("SELECT id, cod_retorno, worker_id, started_at FROM produtos ORDER BY id"))
+        return {row.id: (row.cod_retorno, row.worker_id, row.started_at is not None) for row in rows}
+
+
+def test_claim_marks_lines_as_executing_by_the_worker(repo, database):
+    claimed = repo.get.claim_pending_operations(worker_id="w1", limit=2)
+
+    assert [line.id for line in claimed] == [1, 2]
+    assert states(database) == {
+        1: (ResponseCode.EXECUTING, "w1", False),
+        2: (ResponseCode.EXECUTING, "w1", False),
+        3: (ResponseCode.PENDING, None, False),
+    }
+    assert [line.id for line in repo.get.claim_pending_operations(worker_id="w2", limit=10)] == [3]
+
+
+def test_release_requeues_only_lines_never_started(repo, database):
+    claimed = repo.get.claim_pending_operations(worker_id="w1", limit=3)
+    repo.update.executing(id=1)
+    repo.update.log_error(2, return_code=ResponseCode.TABLE_ERROR, log_erro="Coluna vazia")
+
+    repo.update.release_claims([line.id for line in claimed])
+
+    result = states(database)
+    assert result[1][0] == ResponseCode.PROGRAM_ERROR
+    assert result[2][0] == ResponseCode.TABLE_ERROR
+    assert result[3] == (ResponseCode.PENDING, None, False)
+
+
+def test_failure_after_publication_never_publishes_again(repo, database):
+    """ A line that raises after the item was created must not go back to the queue. """
+    claimed = repo.get.claim_pending_operations(worker_id="w1", limit=1)
+    with pytest.raises(OSError):
+        try:
+            with repo.update.batch():
+                repo.update.executing(id=1)
+                raise OSError("retorno/A/B.ml") # Ex.: a cod_produto with "/" breaks the .ml file after the POST.
+        finally:
+            repo.update.release_claims([line.id for line in claimed])
+
+    assert states(database)[1][0] == ResponseCode.PROGRAM_ERROR
+    assert [line.id for line in repo.get.claim_pending_operations(worker_id="w1", limit=10)] == [2, 3]
+
+
+def test_started_mark_survives_a_crash_inside_a_batch(repo, database):
+    repo.get.claim_pending_operations(worker_id="w1", limit=2)
+    with repo.update.batch():
+        repo.update.executing(id=1) # Durable: written before the operation runs.
+        repo.update.log_error(1, return_code=ResponseCode.TABLE_ERROR, log_erro="Falha") # Buffered.
+        assert states(database)[1] == (ResponseCode.EXECUTING, "w1", True)
+        repo.update.write_buffer._pending.clear() # The process dies: the buffered results are lost.
+
+    ProdutosRepository().update.release_worker_claims("w1") # Startup of the next run.
+
+    result = states(database)
+    assert result[1][0] == ResponseCode.PROGRAM_ERROR
+    assert result[2] == (ResponseCode.PENDING, None, False)
+
+
+def test_retried_lines_go_back_to_the_queue(repo, database):
+    claimed = repo.get.claim_pending_operations(worker_id="w1", limit=1)
+    repo.update.executing(id=1)
+    repo.update.log_retry(id=1, log_erro="Prazo esgotado")
+    repo.update.release_claims([line.id for line in claimed])
+
+    assert states(database)[1] == (ResponseCode.PENDING, None, False)
+
+
+def test_requeued_lines_wait_for_the_retry_delay(repo, database):
+    claimed = repo.get.claim_pending_operations(worker_id="w1", limit=1)
+    repo.update.release_claims([line.id for line in claimed], retry_delay=60) # Ex.: the seller token failed.
+    
+    assert states(database)[1] == (ResponseCode.PENDING, None, False)
+    assert repo.get.count_pending() == 2
+    assert [line.id for line in repo.get.claim_pending_operations(worker_id="w1", limit=10)] == [2, 3]
+    
+    repo.update.log_retry(id=2, log_erro="Prazo esgotado", retry_delay=0)
+    assert [line.id for line in repo.get.claim_pending_operations(worker_id="w1", limit=10)] == [2]
+
+
+def test_retries_are_limited(repo, database):
+    repo.update.max_retries = 2
+    for attempt in range(2):
+        repo.get.claim_pending_operations(worker_id="w1", limit=1)
+        repo.update.log_retry(id=1, log_erro="Prazo esgotado", retry_delay=0)
+        assert states(database)[1][0] == ResponseCode.PENDING
+    
+    repo.get.claim_pending_operations(worker_id="w1", limit=1)
+    repo.update.log_retry(id=1, log_erro="Prazo esgotado", retry_delay=0)
+    
+    with database.connect() as connection:
+        row = connection.execute(text("SELECT cod_retorno, log_erro, attempts FROM produtos WHERE id = 1")).one()
+    assert row.cod_retorno == ResponseCode.PROGRAM_ERROR
+    assert "Limite de 2 tentativas" in row.log_erro
+    assert row.attempts == 0
+
+
+def test_a_final_result_restarts_the_retry_count(repo, database):
+    repo.update.log_retry(id=1, log_erro="Prazo esgotado", retry_delay=0)
+    repo.update.log_success_code(id=1)
+    
+    with database.connect() as connection:
+        assert connection.execute(text("SELECT attempts FROM produtos WHERE id = 1")).scalar() == 0
+
+
+def test_a_big_seller_does_not_fill_the_claim(repo, database):
+    with database.begin() as connection:
+        connection.execute(text("UPDATE produtos SET client_id = 'grande'"))
+        for id in range(4, 13):
+            connection.execute(
+                text("INSERT INTO produtos (id, operacao, cod_retorno, client_id) VALUES (:id, 1, 0, :client)"),
+                {"id": id, "client": "grande" if id < 11 else "pequeno"}
+            )
+    
+    claimed = repo.get.claim_pending_operations(worker_id="w1", limit=4)
+    
+    assert [(line.id, line.credentials.client_id) for line in claimed] == [
+        (1, "grande"), (2, "grande"), (11, "pequeno"), (12, "pequeno")
+    ]
@@ -0,0 +1,102 @@
+""" Read timeouts against a real (slow) socket. """
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+
+from src.config import HttpConfig
+from src.infra.api.mercadolivre.client import MLBaseClient, build_session
+from src.infra.api.mercadolivre.coalescing import RequestCoalescer
+from src.infra.api.mercadolivre.models import TIMEOUT_CODE
+from src.infra.api.mercadolivre.rate_limit import RateLimiter
+from src.infra.api.mercadolivre.timeouts import deadline_scope
+
+HEADERS: dict = {"Authorization": "Bearer APP_USR-vendedor"}
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """ Counts the requests and answers only after the client gave up. """
+    calls: list[str] = []
+    
+    def handle_one_request(self) -> None:
+        try:
+            super().handle_one_request()
+        except OSError:
+            pass # The client already closed the connection.
+    
+    def answer(self) -> None:
+        self.calls.append(self.command)
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(1)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+    
+    do_GET = do_POST = answer
+    
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def slow_server():
+    SlowHandler.calls = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def client(session, base_url: str = None) -> MLBaseClient:
+    result = MLBaseClient(
+        session=session,
+        rate_limiter=RateLimiter(rate=100, burst=100),
+        coalescer=RequestCoalescer(ttl=0)
+    )
+    if base_url:
+        result.BASE_URL = base_url
+    return result
+
+
+def test_timed_out_post_is_sent_once_and_not_retryable(slow_server):
+    meli = client(build_session(HttpConfig()), f"http://127.0.0.1:{slow_server.server_port}")
+    
+    with deadline_scope(0.3) as deadline:
+        response = meli.post("/items", "item_publication", headers=HEADERS, json={"title": "Farol"})
+    
+    assert SlowHandler.calls == ["POST"]
+    assert response.error.code == TIMEOUT_CODE
+    assert not response.error.retryable
+    assert not deadline.retryable
+
+
+def test_timed_out_get_is_left_to_the_operation_retry(slow_server):
+    meli = client(build_session(HttpConfig()), f"http://127.0.0.1:{slow_server.server_port}")
+    
+    with deadline_scope(0.3) as deadline:
+        response = meli.get("/items/MLB1", "get_item_info", headers=HEADERS)
+    
+    assert SlowHandler.calls == ["GET"] # No fresh read timeout past the deadline.
+    assert response.error.code == TIMEOUT_CODE
+    assert response.error.retryable
+    assert deadline.retryable
+
+
+def test_timeout_wrapped_by_exhausted_retries_is_still_a_timeout():
+    class Session:
+        def request(self, method: str, url: str, **kwargs):
+            timeout = ReadTimeoutError(None, url, "Read timed out.")
+            raise requests.ConnectionError(MaxRetryError(None, url, timeout))
+    
+    response = client(Session()).post("/items", "item_publication", headers=HEADERS, json={})
+    
+    assert response.error.code == TIMEOUT_CODE
+    assert not response.error.retryable
@@ -0,0 +1,72 @@
+""" Responses shared by identical GET requests (RequestCoalescer). """
+
+import threading
+import time
+
+from src.infra.api.mercadolivre import coalescing
+from src.infra.api.mercadolivre.coalescing import RequestCoalescer
+from src.infra.api.mercadolivre.models import MeliResponse
+
+KEY = RequestCoalescer.key("/sites/MLB/categories/all", access_token="APP_USR-vendedor")
+
+
+def no_deepcopy(monkeypatch) -> None:
+    def fail(data, memo=None):
+        raise AssertionError("deepcopy da resposta compartilhada")
+    monkeypatch.setattr(coalescing.copy, "deepcopy", fail)
+
+
+def test_response_of_a_single_caller_is_not_copied(monkeypatch):
+    no_deepcopy(monkeypatch)
+    data: dict = {"categories": [{"id": "MLB1747"}]}
+    
+    response = RequestCoalescer(ttl=0).run(KEY, lambda: MeliResponse(success=True, data=data))
+    
+    assert response.data is data
+
+
+def test_waiters_get_their_own_copy_of_the_response(monkeypatch):
+    no_deepcopy(monkeypatch)
+    coalescer = RequestCoalescer(ttl=0)
+    release = threading.Event()
+    responses: list[MeliResponse] = []
+    
+    def perform() -> MeliResponse:
+        release.wait(timeout=5)
+        return MeliResponse(success=True, data={"categories": [{"id": "MLB1747"}]})
+    
+    threads = [threading.Thread(target=lambda: responses.append(coalescer.run(KEY, perform))) for _ in range(3)]
+    threads[0].start()
+    while KEY not in coalescer._calls:
+        time.sleep(0.01)
+    for thread in threads[1:]:
+        thread.start()
+    while coalescer._calls[KEY].waiters < 2:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+    
+    assert len({id(response.data) for response in responses}) == 3
+    assert all(response.data == {"categories": [{"id": "MLB1747"}]} for response in responses)
+
+
+def test_reused_response_is_not_changed_by_the_first_caller():
+    coalescer = RequestCoalescer(ttl=60)
+    
+    first = coalescer.run(KEY, lambda: MeliResponse(success=True, data={"categories": [{"id": "MLB1747"}]}))
+    first.data["categories"].clear()
+    second = coalescer.run(KEY, lambda: MeliResponse(success=False))
+    
+    assert second.data == {"categories": [{"id": "MLB1747"}]}
+
+
+def test_non_picklable_data_falls_back_to_deepcopy():
+    coalescer = RequestCoalescer(ttl=60)
+    data: dict = {"id": "MLB1747", "format": lambda value: value}
+    
+    first = coalescer.run(KEY, lambda: MeliResponse(success=True, data=data))
+    second = coalescer.run(KEY, lambda: MeliResponse(success=False))
+    
+    assert first.data is data
+    assert second.data["id"] == "MLB1747" and second.data is not data
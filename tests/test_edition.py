@@ -0,0 +1,41 @@
+""" Description updates of the edition operation. """
+
+import asyncio
+from types import SimpleNamespace
+
+from src.infra.api.mercadolivre.models import MeliErrorDetail, MeliResponse
+from src.app.services.produtos.operations.edition import Edition, EditionAbortError
+
+
+class ItemsRequests:
+    client = None
+    
+    def __init__(self, descriptions: dict[str, str]) -> None:
+        self.descriptions = descriptions
+        self.updates: list[tuple[str, str, bool]] = []
+    
+    def get_description(self, access_token: str, item_id: str) -> MeliResponse:
+        if item_id not in self.descriptions:
+            return MeliResponse(success=False, error=MeliErrorDetail(message="Item não encontrado", context="item_description"))
+        return MeliResponse(success=True, data={"plain_text": self.descriptions[item_id]})
+    
+    def add_description(self, access_token: str, item_id: str, descrption: str, change_description: bool = False) -> MeliResponse:
+        self.updates.append((item_id, descrption, change_description))
+        return MeliResponse(success=True)
+
+
+def line(id: int, ml_id: str, descricao: str):
+    return SimpleNamespace(id=id, identfiers=SimpleNamespace(ml_id_produto=ml_id), sale=SimpleNamespace(descricao=descricao))
+
+
+def test_descriptions_of_a_batch_are_updated_together():
+    items_requests = ItemsRequests({"MLB1": "", "MLB2": "Antiga", "MLB3": "Igual"})
+    edition = Edition(log=None, repo=None, items_requests=items_requests, payload_generator=None)
+    lines = [line(1, "MLB1", "Nova"), line(2, "MLB2", "Nova"), line(3, "MLB3", "Igual"), line(4, "MLB4", "Nova")]
+    
+    results = asyncio.run(edition._update_descriptions(lines, SimpleNamespace(access_token="token")))
+    
+    assert sorted(items_requests.updates) == [("MLB1", "Nova", False), ("MLB2", "Nova", True)]
+    assert [error is None for error, _ in results] == [True, True, True, False]
+    assert isinstance(results[3][0], EditionAbortError) and "Item não encontrado" in str(results[3][0])
+    assert not any(retryable for _, retryable in results)
@@ -0,0 +1,29 @@
+""" Adaptive polling interval of the main loop (AdaptiveInterval). """
+
+from src.app.polling import AdaptiveInterval
+
+
+def test_no_wait_while_the_backlog_shrinks():
+    polling = AdaptiveInterval()
+    assert polling.next({"produtos": 30}, base=2, ceiling=60) == 0
+    assert polling.next({"produtos": 20}, base=2, ceiling=60) == 0
+    assert polling.next({"produtos": 10}, base=2, ceiling=60) == 0
+
+
+def test_backoff_while_the_backlog_does_not_shrink():
+    """ Lines that keep going back to the queue must not make the loop spin. """
+    polling = AdaptiveInterval()
+    intervals = [polling.next({"produtos": 5}, base=2, ceiling=10) for _ in range(6)]
+    
+    assert intervals == [0, 2, 4, 8, 10, 10]
+    assert polling.metrics.stalled_ticks == 6
+    assert polling.next({"produtos": 4}, base=2, ceiling=10) == 0 # Progress resets the backoff.
+    assert polling.metrics.stalled_ticks == 0
+
+
+def test_backoff_without_backlog():
+    polling = AdaptiveInterval()
+    intervals = [polling.next({"produtos": 0}, base=2, ceiling=10) for _ in range(5)]
+    
+    assert intervals == [2, 4, 8, 10, 10]
+    assert polling.next({"produtos": 3}, base=2, ceiling=10) == 0
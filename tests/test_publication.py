@@ -0,0 +1,58 @@
+""" Publication error handling. """
+
+from src.infra.api.mercadolivre.models import MeliErrorDetail, MeliResponse
+from src.infra.db.repo.models import ResponseCode
+from src.app.services.produtos.operations.publication import PublicationErrorHandler
+
+
+class Line:
+    id: int = 1
+
+
+class Updates:
+    def __init__(self) -> None:
+        self.errors: list[dict] = []
+    
+    def log_error(self, id, return_code, log_erro, durable=False):
+        self.errors.append({"id": id, "return_code": return_code, "log_erro": log_erro})
+
+
+class Repo:
+    def __init__(self) -> None:
+        self.update = Updates()
+
+
+class Log:
+    pass
+
+
+def failure(**error) -> MeliResponse:
+    return MeliResponse(success=False, error=MeliErrorDetail(message="Falha", context="item_publication", **error))
+
+
+def test_timeout_without_details_is_left_to_the_retry():
+    repo = Repo()
+    handler = PublicationErrorHandler(Log(), repo)
+    
+    handler.handle_publication_request(Line(), failure(retryable=True)) # Ex.: deadline expired before the POST.
+    
+    assert repo.update.errors == []
+
+
+def test_error_without_details_is_logged():
+    repo = Repo()
+    handler = PublicationErrorHandler(Log(), repo)
+    
+    handler.handle_publication_request(Line(), failure(code=1001)) # Ex.: read timeout of the POST.
+    
+    assert [error["return_code"] for error in repo.update.errors] == [ResponseCode.PROGRAM_ERROR]
+
+
+def test_logistic_error_has_its_own_message():
+    repo = Repo()
+    handler = PublicationErrorHandler(Log(), repo)
+    details = '{"message":"Client not allowed to update item null logistic_type."}'
+    
+    handler.handle_publication_request(Line(), failure(details=details))
+    
+    assert "fulfillment" in repo.update.errors[0]["log_erro"]
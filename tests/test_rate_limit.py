@@ -0,0 +1,117 @@
+""" Seller rate limit and HTTP 429 Retry-After handling. """
+
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from src.infra.api.mercadolivre.client import MLBaseClient
+from src.infra.api.mercadolivre.coalescing import RequestCoalescer
+from src.infra.api.mercadolivre.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+from src.infra.api.mercadolivre.timeouts import DeadlineExceeded, deadline_scope
+
+HEADERS: dict = {"Authorization": "Bearer APP_USR-vendedor"}
+
+
+def response(status_code: int, retry_after: str = None) -> requests.Response:
+    result = requests.Response()
+    result.status_code = status_code
+    result._content = b'{"id": "MLB1"}'
+    if retry_after is not None:
+        result.headers["Retry-After"] = retry_after
+    return result
+
+
+class Session:
+    """ Answers the requests with the given responses, in order. """
+    def __init__(self, *responses: requests.Response) -> None:
+        self.responses = list(responses)
+        self.calls: int = 0
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """ Records the waits instead of sleeping. """
+    recorded: list[float] = []
+    monkeypatch.setattr(time, "sleep", recorded.append)
+    return recorded
+
+
+def client(session: Session, throttle_retries: int = 4) -> MLBaseClient:
+    return MLBaseClient(
+        session=session,
+        rate_limiter=RateLimiter(rate=100, burst=100, throttle_retries=throttle_retries),
+        coalescer=RequestCoalescer(ttl=0) # Each test sends its own GET.
+    )
+
+
+def test_retry_after_in_seconds_or_http_date():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert 8 < parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after(formatdate(time.time() - 10, usegmt=True)) == 0.0
+    assert parse_retry_after("depois") is None
+    assert parse_retry_after(None) is None
+
+
+def test_throttled_bucket_waits_for_the_retry_after_and_halves_the_rate():
+    bucket = TokenBucket(rate=10, capacity=10)
+    bucket.throttled(retry_after=5)
+    
+    assert 4.9 < bucket.reserve() <= 5
+    assert bucket.rate == 5
+    bucket.succeeded()
+    assert bucket.rate == pytest.approx(5.1)
+
+
+def test_wait_beyond_the_deadline_is_refused():
+    limiter = RateLimiter(rate=10, burst=10)
+    limiter.bucket("token", "/items/MLB1").throttled(retry_after=30)
+    
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire("token", "/items/MLB2", max_wait=1)
+    limiter.acquire("token", "/categories/MLB5672", max_wait=1) # Other endpoint family, other bucket.
+
+
+def test_429_is_retried_after_the_retry_after(sleeps):
+    session = Session(response(429, retry_after="2"), response(200))
+    
+    result = client(session).get("/items/MLB1", context="get_item_info", headers=HEADERS)
+    
+    assert result.success and result.data == {"id": "MLB1"}
+    assert session.calls == 2
+    assert len(sleeps) == 1 and 1.9 < sleeps[0] <= 2
+
+
+def test_429_without_retry_after_backs_off(sleeps):
+    session = Session(response(429), response(429), response(200))
+    
+    result = client(session).get("/items/MLB1", context="get_item_info", headers=HEADERS)
+    
+    assert result.success and session.calls == 3
+    assert len(sleeps) >= 2 # Backoff with jitter, then the bucket refill at the halved rate.
+
+
+def test_429_retries_are_limited(sleeps):
+    session = Session(response(429, retry_after="1"), response(429, retry_after="1"))
+    
+    result = client(session, throttle_retries=1).get("/items/MLB1", context="get_item_info", headers=HEADERS)
+    
+    assert not result.success and result.http_status == 429
+    assert session.calls == 2
+
+
+def test_retry_after_beyond_the_deadline_is_a_retryable_failure(sleeps):
+    session = Session(response(429, retry_after="30"), response(200))
+    
+    with deadline_scope(5) as deadline:
+        result = client(session).get("/items/MLB1", context="get_item_info", headers=HEADERS)
+    
+    assert not result.success and result.error.retryable
+    assert deadline.retryable and session.calls == 1
+    assert sleeps == []
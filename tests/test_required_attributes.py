@@ -0,0 +1,58 @@
+""" Required attributes index of the categories (RequiredAttributesIndex). """
+
+import threading
+
+from src.infra.api.mercadolivre.models import MeliResponse
+from src.app.shared.category.attributes import RequiredAttributes, RequiredAttributesIndex
+
+ATTRIBUTES: list[dict] = [
+    {"id": "BRAND", "name": "Marca", "tags": {"required": True}},
+    {"id": "COLOR", "name": "Cor", "tags": {}},
+    {"id": "GTIN", "name": "Código universal de produto", "hint": "Pode ser um EAN", "tags": {"required": True}},
+    {"id": "MODEL", "name": "Modelo", "tags": {"required": True}}
+]
+
+
+class CategoryRequests:
+    """ Answers /categories/{id}/attributes and counts the requests. """
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+        self.lock = threading.Lock()
+    
+    def get_category_attributes(self, category_id: str, access_token: str) -> MeliResponse:
+        with self.lock:
+            self.requests.append(category_id)
+        return MeliResponse(success=True, data=ATTRIBUTES)
+
+
+def index() -> RequiredAttributesIndex:
+    return RequiredAttributesIndex(ttl=3600, category_requests=CategoryRequests())
+
+
+def test_missing_attributes_keep_the_category_order():
+    required = RequiredAttributes.from_category_attributes("MLB2227", ATTRIBUTES)
+    
+    assert [attribute.id for attribute in required.missing(["MODEL", "COLOR"])] == ["BRAND", "GTIN"]
+    assert required.missing(["GTIN", "BRAND", "MODEL"]) == []
+    assert required.missing([])[1].message() == "GTIN (Código universal de produto) | Pode ser um EAN"
+
+
+def test_indexed_categories_are_not_requested_again():
+    attributes = index()
+    
+    first = attributes.get("MLB2227", "APP_USR-vendedor")
+    second = attributes.get("MLB2227", "APP_USR-vendedor")
+    
+    assert first.success and second.result is first.result
+    assert attributes.category_requests.requests == ["MLB2227"]
+
+
+def test_get_many_requests_each_category_once():
+    attributes = index()
+    attributes.get("MLB2227", "APP_USR-vendedor")
+    
+    responses = attributes.get_many(["MLB5672", "MLB2227", "MLB5672", "MLB1747"], "APP_USR-vendedor")
+    
+    assert set(responses) == {"MLB2227", "MLB5672", "MLB1747"}
+    assert all(response.success for response in responses.values())
+    assert sorted(attributes.category_requests.requests) == ["MLB1747", "MLB2227", "MLB5672"] # MLB2227 only by the first get.
@@ -0,0 +1,42 @@
+""" Concurrent execution of the applications (ApplicationScheduler). """
+
+import threading
+
+from src.app.scheduler import ApplicationScheduler
+
+
+class Application:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.executions: int = 0
+    
+    def execute(self) -> None:
+        self.executions += 1
+        self.release.wait(timeout=5)
+
+
+def test_an_application_runs_once_at_a_time():
+    scheduler = ApplicationScheduler()
+    slow, other = Application(), Application()
+    scheduler.register("produtos", slow)
+    scheduler.register("produtos_status", other)
+    other.release.set()
+    
+    assert scheduler.submit(["produtos", "produtos_status"]) == ["produtos", "produtos_status"]
+    assert scheduler.submit(["produtos"]) == [] # Its instance is still running.
+    
+    slow.release.set()
+    scheduler.shutdown(timeout=5)
+    assert slow.executions == 1
+
+
+def test_an_application_runs_up_to_its_limit():
+    scheduler = ApplicationScheduler()
+    application = Application()
+    scheduler.register("produtos", application, limit=2)
+    
+    assert scheduler.submit(["produtos", "produtos", "produtos"]) == ["produtos", "produtos"]
+    
+    application.release.set()
+    scheduler.shutdown(timeout=5)
+    assert application.executions == 2
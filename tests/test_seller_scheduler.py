@@ -0,0 +1,83 @@
+""" Round-robin seller scheduler (SellerScheduler) and the leases shared between schedulers. """
+
+import threading
+
+from src.app.shared.seller_scheduler import SellerLeases, SellerScheduler
+
+
+def test_sellers_take_turns():
+    order: list[tuple[str, list[int]]] = []
+    scheduler = SellerScheduler(max_workers=1, chunk_size=2)
+    
+    scheduler.run({"a": [1, 2, 3, 4, 5], "b": [6]}, lambda seller, chunk: order.append((seller, chunk)))
+    
+    assert order == [("a", [1, 2]), ("b", [6]), ("a", [3, 4]), ("a", [5])]
+
+
+def test_schedulers_sharing_leases_never_run_a_same_seller_together():
+    leases = SellerLeases()
+    other, normal = SellerScheduler(leases=leases), SellerScheduler(leases=leases)
+    started, release = threading.Event(), threading.Event()
+    running: dict[str, int] = {}
+    overlaps: list[str] = []
+    processed: list[str] = []
+    lock = threading.Lock()
+    
+    def process(seller: str, chunk: list[int]) -> None:
+        with lock:
+            running[seller] = running.get(seller, 0) + 1
+            if running[seller] > 1:
+                overlaps.append(seller)
+            processed.append(seller)
+        if chunk == [1]:
+            started.set()
+            release.wait(timeout=5)
+        with lock:
+            running[seller] -= 1
+    
+    first = threading.Thread(target=normal.run, args=({"a": [1]}, process))
+    first.start()
+    assert started.wait(timeout=5)
+    
+    second = threading.Thread(target=other.run, args=({"a": [2], "b": [3]}, process))
+    second.start()
+    second.join(timeout=0.2)
+    assert second.is_alive() and processed == ["a", "b"] # "b" ran, "a" waits for the other scheduler.
+    
+    release.set()
+    first.join(timeout=5)
+    second.join(timeout=5)
+    assert not second.is_alive()
+    assert overlaps == []
+    assert not leases.running
+
+
+def test_priority_chunks_go_ahead_of_the_seller_normal_chunks():
+    leases = SellerLeases()
+    urgent = SellerScheduler(leases=leases, priority=True)
+    normal = SellerScheduler(leases=leases, chunk_size=1)
+    bulk_started, urgent_started, release = threading.Event(), threading.Event(), threading.Event()
+    processed: list[list[int]] = []
+    
+    def process(seller: str, chunk: list[int]) -> None:
+        processed.append(chunk)
+        if chunk == [1]:
+            bulk_started.set()
+            release.wait(timeout=5)
+        if chunk == [9]:
+            urgent_started.set()
+            release.wait(timeout=5)
+    
+    bulk = threading.Thread(target=normal.run, args=({"a": [1, 2]}, process))
+    bulk.start()
+    assert bulk_started.wait(timeout=5)
+    
+    pause = threading.Thread(target=urgent.run, args=({"a": [9]}, process))
+    pause.start()
+    assert urgent_started.wait(timeout=5) # Doesn't wait for the running bulk chunk.
+    
+    release.set()
+    bulk.join(timeout=5)
+    pause.join(timeout=5)
+    assert processed == [[1], [9], [2]] # The next bulk chunk waited for the urgent one.
+    assert not leases.running and not leases.priority
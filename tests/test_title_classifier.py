@@ -0,0 +1,93 @@
+""" Local title classifier: training samples and holdout accuracy gate. """
+
+import random
+
+import pytest
+from sqlalchemy import text
+
+from src.config import TitleClassifierConfig
+from src.infra.db.models.produtos_category import ProdutosCategoryORM
+from src.infra.db.repo import ProdutosCategroyRepository
+from src.infra.db.repo.models import ResponseCode, ResultSource
+from src.app.shared.category.classifier import TitleClassifierIndex
+from conftest import create_table
+
+PARTS: dict[str, str] = {
+    "MLB1": "pastilha de freio dianteira",
+    "MLB2": "filtro de oleo do motor",
+    "MLB3": "amortecedor traseiro",
+    "MLB4": "lampada farol h4",
+    "MLB5": "correia dentada",
+    "MLB6": "vela de ignicao",
+}
+BRANDS: list[str] = ["bosch", "cofap", "nakata", "monroe", "fram", "ngk", "gates", "philips", "tecfil", "cobreq"]
+
+
+def history() -> list[tuple[str, str]]:
+    return [
+        (f"{part} {brand} {model}", category_id)
+        for category_id, part in PARTS.items()
+        for brand in BRANDS
+        for model in range(10)
+    ]
+
+
+class Samples:
+    def __init__(self, samples: list) -> None:
+        self.get = self
+        self.samples = samples
+    
+    def title_samples(self, limit: int) -> list:
+        return self.samples[:limit]
+
+
+def index(samples: list[tuple[str, str]]) -> TitleClassifierIndex:
+    return TitleClassifierIndex(TitleClassifierConfig(), category_repo=Samples(samples), produtos_repo=Samples([]))
+
+
+def test_accurate_classifier_is_used():
+    classifier = index(history())
+    classifier._train()
+    
+    [prediction, *_] = classifier.predict("Pastilha Freio Dianteira Bosch")
+    assert prediction.category_id == "MLB1"
+
+
+def test_confident_but_wrong_classifier_is_discarded():
+    classifier = index([])
+    # The validation titles disagree with the similar training titles: every confident prediction misses.
+    classifier.category_repo = Samples([
+        (title, "MLB9" if classifier._is_holdout(title) else category_id) for title, category_id in history()
+    ])
+    classifier._train()
+    
+    assert classifier._classifier is None
+    assert classifier.predict("Pastilha Freio Dianteira Bosch") == []
+
+
+def test_classifier_without_enough_validation_is_discarded():
+    shuffled = random.Random(7)
+    categories: list[str] = list(PARTS)
+    classifier = index([(title, shuffled.choice(categories)) for title, _ in history()]) # Noisy history.
+    classifier._train()
+    
+    assert classifier._classifier is None
+
+
+@pytest.fixture
+def category_repo(database) -> ProdutosCategroyRepository:
+    create_table(database, ProdutosCategoryORM)
+    with database.begin() as connection:
+        for id, source in ((1, None), (2, ResultSource.API), (3, ResultSource.LOCAL)):
+            connection.execute(
+                text(
+                    "INSERT INTO operacao_categoria_ml (id, cod_retorno, titulo_produto, categoria_id, origem_categoria) "
+                    "VALUES (:id, :code, :title, 'MLB1', :source)"
+                ),
+                {"id": id, "code": ResponseCode.SUCCESS, "title": f"Título {id}", "source": source}
+            )
+    return ProdutosCategroyRepository()
+
+
+def test_local_results_are_not_training_samples(category_repo):
+    assert category_repo.get.title_samples(10) == [("Título 2", "MLB1"), ("Título 1", "MLB1")]
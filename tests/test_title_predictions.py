@@ -0,0 +1,45 @@
+""" Category predictions by title (TitleCategoryPredictor). """
+
+from types import SimpleNamespace
+
+from src.infra.api.mercadolivre.models import MeliResponse
+from src.app.shared.category.predictions import TitleCategoryPredictor
+
+
+class ItemsRequests:
+    def __init__(self) -> None:
+        self.titles: list[str] = []
+    
+    def get_category_by_item_name(self, access_token: str, item_name: str, limit: int, site: str) -> MeliResponse:
+        self.titles.append(item_name)
+        return MeliResponse(success=True, data=[{"category_id": "MLB2227"}], http_status=200)
+
+
+class Cache:
+    def __init__(self) -> None:
+        self.config = SimpleNamespace(ttl_domain_discovery=60)
+        self.entries: dict[str, MeliResponse] = {}
+    
+    def fetch(self, key: str, ttl: int, request) -> MeliResponse:
+        if key not in self.entries:
+            self.entries[key] = request(None)
+        return self.entries[key]
+
+
+class NoClassifier:
+    def predict(self, title: str, limit: int) -> list:
+        return []
+
+
+def test_each_normalized_title_is_requested_once_with_its_first_original_title():
+    items_requests, cache = ItemsRequests(), Cache()
+    predictor = TitleCategoryPredictor(items_requests=items_requests, cache=cache, classifier=NoClassifier())
+    
+    predictions = predictor.predict_many(
+        ["Pastilha de Freio - Dianteira", "pastilha de freio dianteira", "Disco de Freio"],
+        access_token="token"
+    )
+    
+    assert items_requests.titles == ["Pastilha de Freio - Dianteira", "Disco de Freio"]
+    assert set(predictions) == {"pastilha de freio dianteira", "disco de freio"}
+    assert any(key.endswith("q=pastilha de freio dianteira") for key in cache.entries)
@@ -0,0 +1,67 @@
+""" Access tokens shared by the bot instances (TokenCache with a store). """
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from src.infra.api.mercadolivre.models import MeliResponse
+from src.infra.api.mercadolivre.auth import AuthResponse, MeliCredentials, StoredToken, TokenCache, TokenLockTimeout
+
+CREDENTIALS = MeliCredentials(client_id="123", client_secret="segredo", redirect_uri="https://exemplo.com", refresh_token="TG-tabela")
+
+
+class Auth:
+    """ Counts the refresh requests. """
+    def __init__(self) -> None:
+        self.requests: int = 0
+    
+    def get_refresh_token(self, credentials) -> MeliResponse:
+        self.requests += 1
+        return MeliResponse(success=True, data=AuthResponse(
+            access_token="APP_USR-local", token_type="bearer", expires_in=21600, scope=None, user_id=1, refresh_token="TG-local"
+        ))
+
+
+def stored(minutes: float) -> StoredToken:
+    return StoredToken(
+        client_id="123",
+        access_token="APP_USR-outra-instancia",
+        refresh_token="TG-renovado",
+        refresh_token_origem="TG-tabela",
+        expira_em=datetime.now(timezone.utc) + timedelta(minutes=minutes)
+    )
+
+
+class Store:
+    """ Another instance holds the seller lock and saves `saved` while this one polls it. """
+    def __init__(self, saved: Optional[StoredToken]) -> None:
+        self.saved = saved
+        self.reads: int = 0
+    
+    def token(self, client_id: str) -> Optional[StoredToken]:
+        self.reads += 1
+        return self.saved if self.reads > 1 else None # Nothing stored before the refresh of the other instance.
+    
+    def exchange(self, client_id, refresh, adopt=None) -> Optional[StoredToken]:
+        if adopt and adopt(self.saved):
+            return self.saved
+        raise TokenLockTimeout("Tempo limite aguardando a renovação do token por outra instância.")
+
+
+def test_token_saved_by_the_lock_holder_is_adopted_while_polling():
+    auth = Auth()
+    cache = TokenCache(auth=auth, store=Store(stored(minutes=360)))
+    
+    response = cache.get_token(CREDENTIALS)
+    
+    assert response.data.access_token == "APP_USR-outra-instancia"
+    assert auth.requests == 0
+
+
+def test_lock_timeout_never_falls_back_to_a_local_refresh():
+    auth = Auth()
+    cache = TokenCache(auth=auth, store=Store(stored(minutes=0.5))) # About to expire: not adopted.
+    
+    response = cache.get_token(CREDENTIALS)
+    
+    assert not response.success
+    assert auth.requests == 0 # A local refresh would race the rotation of the other instance.
@@ -0,0 +1,143 @@
+""" Write-behind buffer of line updates (WriteBuffer). """
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from src.infra.db.models.produtos import Produtos
+from src.infra.db.repo.base import buffer as buffer_module
+from src.infra.db.repo.base.buffer import WriteBuffer
+from conftest import create_table
+
+
+@pytest.fixture
+def table(database):
+    create_table(database, Produtos)
+    with database.begin() as connection:
+        for id in (1, 2, 3):
+            connection.execute(text("INSERT INTO produtos (id, cod_retorno) VALUES (:id, 1)"), {"id": id})
+    return database
+
+
+def rows(database) -> dict[int, tuple]:
+    with database.connect() as connection:
+        result = connection.execute(text("SELECT id, cod_retorno, log_erro FROM produtos ORDER BY id"))
+        return {row.id: (row.cod_retorno, row.log_erro) for row in result}
+
+
+class Statements:
+    """ Records the statements of the buffer writes, optionally failing them. """
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.executed: list = []
+
+    def execute(self, statement):
+        if self.fail:
+            raise RuntimeError("Conexão perdida")
+        self.executed.append(statement)
+
+
+def fake_session(monkeypatch, statements: Statements) -> None:
+    class Scope:
+        def __enter__(self):
+            return statements
+        def __exit__(self, *exc):
+            return False
+    monkeypatch.setattr(buffer_module, "session_scope", Scope)
+
+
+def compiled(statement) -> tuple[str, dict]:
+    compiled = statement.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+def test_updates_are_merged_by_line_and_the_last_value_wins(monkeypatch):
+    statements = Statements()
+    fake_session(monkeypatch, statements)
+    buffer = WriteBuffer(Produtos)
+    with buffer.batch():
+        buffer.put(1, {"cod_retorno": 91, "log_erro": "primeiro"})
+        buffer.put(1, {"log_erro": "último"})
+        assert not statements.executed # Nothing written inside the batch.
+
+    [statement] = statements.executed
+    sql, params = compiled(statement)
+    assert "AS buffered (id, cod_retorno, log_erro)" in sql
+    assert sorted(params.values(), key=str) == sorted([1, 91, "último"], key=str)
+
+
+def test_lines_are_grouped_by_updated_columns(monkeypatch):
+    statements = Statements()
+    fake_session(monkeypatch, statements)
+    buffer = WriteBuffer(Produtos)
+    with buffer.batch():
+        buffer.put(1, {"cod_retorno": 2})
+        buffer.put(2, {"cod_retorno": 2})
+        buffer.put(3, {"cod_retorno": 91, "log_erro": "Falha"})
+
+    assert len(statements.executed) == 2
+    sql = str(statements.executed[0].compile(dialect=postgresql.dialect()))
+    assert "UPDATE produtos SET cod_retorno=CAST(buffered.cod_retorno AS INTEGER)" in sql
+    assert "FROM (VALUES" in sql and "AS buffered (id, cod_retorno)" in sql
+    assert "produtos.id = CAST(buffered.id AS INTEGER)" in sql
+
+
+def test_nested_batches_flush_only_at_the_outermost(monkeypatch):
+    statements = Statements()
+    fake_session(monkeypatch, statements)
+    buffer = WriteBuffer(Produtos)
+    with buffer.batch():
+        with buffer.batch():
+            buffer.put(1, {"cod_retorno": 2})
+        assert not statements.executed
+    assert len(statements.executed) == 1
+
+
+def test_durable_update_is_written_at_once_with_the_pending_values(table):
+    buffer = WriteBuffer(Produtos)
+    with buffer.batch():
+        buffer.put(1, {"log_erro": "pendente"})
+        buffer.put(1, {"cod_retorno": 2}, durable=True)
+        assert rows(table)[1] == (2, "pendente")
+        assert not buffer._pending
+
+
+def test_full_buffer_is_flushed(monkeypatch):
+    statements = Statements()
+    fake_session(monkeypatch, statements)
+    buffer = WriteBuffer(Produtos, max_rows=2)
+    with buffer.batch():
+        buffer.put(1, {"cod_retorno": 2})
+        assert not statements.executed
+        buffer.put(2, {"cod_retorno": 2})
+        assert len(statements.executed) == 1 and not buffer._pending
+
+
+def test_failed_flush_restores_values_without_overwriting_newer_ones(monkeypatch):
+    statements = Statements(fail=True)
+    fake_session(monkeypatch, statements)
+    buffer = WriteBuffer(Produtos)
+    with pytest.raises(RuntimeError):
+        with buffer.batch():
+            buffer.put(1, {"cod_retorno": 91, "log_erro": "antigo"})
+            buffer.put(2, {"cod_retorno": 2})
+    assert buffer._pending == {1: {"cod_retorno": 91, "log_erro": "antigo"}, 2: {"cod_retorno": 2}}
+
+    with pytest.raises(RuntimeError):
+        with buffer.batch():
+            buffer.put(1, {"log_erro": "novo"}) # Newer than the restored value.
+    assert buffer._pending[1] == {"cod_retorno": 91, "log_erro": "novo"}
+
+    statements.fail = False
+    buffer.flush()
+    assert not buffer._pending
+    assert len(statements.executed) == 2
+
+
+def test_failed_durable_write_keeps_the_line_pending(monkeypatch):
+    statements = Statements(fail=True)
+    fake_session(monkeypatch, statements)
+    buffer = WriteBuffer(Produtos)
+    with pytest.raises(RuntimeError):
+        buffer.put(1, {"cod_retorno": 2}, durable=True)
+    assert buffer._pending == {1: {"cod_retorno": 2}}